@@ -0,0 +1 @@
+# benchmarks/__init__.py - Sync throughput benchmarks against local stand-ins
@@ -0,0 +1,6 @@
+# benchmarks/__main__.py - Entry point for `python -m benchmarks`
+import sys
+
+from benchmarks.cli import main
+
+sys.exit(main())
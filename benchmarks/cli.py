@@ -0,0 +1,164 @@
+# benchmarks/cli.py - Command line for the sync benchmark suite
+"""
+Measures sync throughput against local stand-ins - no tenant needed.
+
+    python -m benchmarks                          # full suite (10k/100k/1M)
+    python -m benchmarks --kind spo_to_sql --size 10000
+    python -m benchmarks --latency-ms 50 --throttle-rate 0.02
+    python -m benchmarks --save results.json --baseline previous.json
+
+With --baseline, a scenario regresses when rows/sec drops or peak RSS grows
+by more than --tolerance; the exit code is then 1.
+"""
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.runner import (
+    DEFAULT_SIZES,
+    KINDS,
+    BenchmarkResult,
+    BenchmarkRunner,
+    build_scenarios,
+)
+
+EXIT_OK = 0
+EXIT_REGRESSION = 1
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    lines = [
+        f"{'scenario':<22} {'rows':>9} {'seconds':>9} {'rows/s':>10} "
+        f"{'peak MB':>8} {'requests':>9} {'429s':>5}  status"
+    ]
+    for r in results:
+        status = "ok" if r.success else f"FAILED: {r.message}"
+        if r.success and not r.completed:
+            status = "time limit"
+        peak = f"{r.peak_rss_mb:.0f}" if r.peak_rss_mb is not None else "-"
+        lines.append(
+            f"{r.scenario:<22} {r.rows_processed:>9,} {r.seconds:>9.1f} "
+            f"{r.rows_per_sec:>10,.0f} {peak:>8} {r.requests.get('total', 0):>9,} "
+            f"{r.requests.get('throttled', 0):>5}  {status}"
+        )
+    return "\n".join(lines)
+
+
+def compare_to_baseline(
+    results: List[BenchmarkResult], baseline: Dict[str, dict], tolerance: float
+) -> List[str]:
+    """Return one message per regressed scenario"""
+    regressions = []
+    for r in results:
+        before = baseline.get(r.scenario)
+        if not before or not r.success:
+            continue
+
+        old_rate = before.get("rows_per_sec") or 0
+        if old_rate and r.rows_per_sec < old_rate * (1 - tolerance):
+            regressions.append(
+                f"{r.scenario}: rows/s {old_rate:,.0f} -> {r.rows_per_sec:,.0f}"
+            )
+
+        old_peak = before.get("peak_rss_mb")
+        if old_peak and r.peak_rss_mb and r.peak_rss_mb > old_peak * (1 + tolerance):
+            regressions.append(
+                f"{r.scenario}: peak RSS {old_peak:.0f} MB -> {r.peak_rss_mb:.0f} MB"
+            )
+
+        old_requests = (before.get("requests") or {}).get("total")
+        new_requests = r.requests.get("total", 0)
+        if (
+            r.completed
+            and old_requests
+            and new_requests > old_requests * (1 + tolerance)
+        ):
+            regressions.append(
+                f"{r.scenario}: requests {old_requests:,} -> {new_requests:,}"
+            )
+    return regressions
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Sync throughput benchmarks"
+    )
+    parser.add_argument(
+        "--kind",
+        action="append",
+        choices=KINDS,
+        help="scenario kind (repeatable, default: all)",
+    )
+    parser.add_argument(
+        "--size",
+        action="append",
+        type=int,
+        help=f"rows per scenario (repeatable, default: {list(DEFAULT_SIZES)})",
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument(
+        "--throttle-rate",
+        type=float,
+        default=0.0,
+        help="fraction of SharePoint requests answered with 429",
+    )
+    parser.add_argument(
+        "--page-size", type=int, default=100, help="items per page without $top"
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        default=0.0,
+        help="stop per-record loops after N seconds and report partial rows/s",
+    )
+    parser.add_argument("--work-dir", type=Path, help="keep generated files here")
+    parser.add_argument("--save", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="JSON results to compare to")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--list", action="store_true", help="list scenarios and exit")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    scenarios = build_scenarios(args.kind or KINDS, args.size or DEFAULT_SIZES)
+
+    if args.list:
+        for scenario in scenarios:
+            print(scenario.name)
+        return EXIT_OK
+
+    results = []
+    with BenchmarkRunner(
+        latency_ms=args.latency_ms,
+        throttle_rate=args.throttle_rate,
+        page_size=args.page_size,
+        time_limit=args.time_limit,
+        work_dir=args.work_dir,
+    ) as runner:
+        for scenario in scenarios:
+            print(f"Running {scenario.name}...", flush=True)
+            results.append(runner.run(scenario))
+
+    print()
+    print(format_results(results))
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({r.scenario: r.to_dict() for r in results}, f, indent=2)
+        print(f"\nResults saved to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for message in regressions:
+                print(f"  {message}")
+            return EXIT_REGRESSION
+        print("\nNo regressions against baseline")
+
+    return EXIT_OK
@@ -0,0 +1,709 @@
+# benchmarks/mock_sharepoint.py - Local stand-in for the SharePoint REST API
+"""
+A small threaded HTTP server that answers the SharePoint REST calls the
+connectors make, so sync throughput can be measured without a tenant.
+
+Supported: ACS token endpoint, /_api/web, /_api/web/lists, list metadata,
+list fields, list items with `__next` paging, item create/MERGE,
+/_api/contextinfo and /_api/$batch (multipart/mixed, changesets flattened),
+`$filter=Modified ge datetime'...'` plus `ID gt/ge/lt/le N` ranges,
+`$orderby=ID desc` and webhook subscriptions (validation handshake included;
+`notify()` posts a change notification).
+Latency and 429 throttling can be injected per HTTP request. Like the real
+list view threshold, a Modified filter scanning more than `view_threshold`
+IDs fails with SPQueryThrottledException.
+
+    python -m benchmarks.mock_sharepoint --items 10000 --port 8765
+    python -m benchmarks.mock_sharepoint --notify-every 30   # webhook test
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import urllib.request
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+SITE_PATH = "/sites/bench"
+MAX_PAGE_SIZE = 5000
+VIEW_THRESHOLD = 5000
+THRESHOLD_ERROR_CODE = "-2147024860, Microsoft.SharePoint.SPQueryThrottledException"
+CATEGORIES = ("Alpha", "Beta", "Gamma", "Delta")
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+FIELDS = (
+    ("Id", "Counter"),
+    ("Title", "Text"),
+    ("Amount", "Number"),
+    ("Category", "Choice"),
+    ("Modified", "DateTime"),
+)
+
+_MODIFIED_FILTER_RE = re.compile(r"Modified ge datetime'([^']+)'", re.IGNORECASE)
+_ID_FILTER_RE = re.compile(r"\bID (gt|ge|lt|le) (\d+)", re.IGNORECASE)
+_LIST_RE = re.compile(
+    r"/_api/web/lists/GetByTitle\('(?P<title>[^']*)'\)"
+    r"(?:/(?P<sub>items|fields|subscriptions)"
+    r"(?:\((?P<item_id>\d+|'[^']*')\))?)?/?$",
+    re.IGNORECASE,
+)
+
+Response = Tuple[int, Dict[str, str], Optional[dict]]
+
+
+class MockList:
+    """
+    List whose seeded items are generated from their ID on demand, so
+    million-item lists cost no memory; created/updated items are stored.
+    """
+
+    def __init__(self, title: str, item_count: int = 0):
+        self.title = title
+        self.id = str(uuid.uuid4())
+        self.seeded = item_count
+        self.created: Dict[int, dict] = {}
+        self.updated: Dict[int, dict] = {}
+        self.last_modified = BASE_TIME + timedelta(seconds=item_count)
+        self._lock = threading.Lock()
+
+    @property
+    def entity_type(self) -> str:
+        return f"SP.Data.{self.title.replace(' ', '_x0020_')}ListItem"
+
+    @property
+    def item_count(self) -> int:
+        return self.seeded + len(self.created)
+
+    @property
+    def max_id(self) -> int:
+        return self.item_count
+
+    def item(self, item_id: int) -> Optional[dict]:
+        if item_id in self.created:
+            item = dict(self.created[item_id])
+        elif 1 <= item_id <= self.seeded:
+            item = {
+                "Id": item_id,
+                "ID": item_id,
+                "Title": f"Item {item_id}",
+                "Amount": round(item_id * 1.5, 2),
+                "Category": CATEGORIES[item_id % len(CATEGORIES)],
+                "Modified": (BASE_TIME + timedelta(seconds=item_id)).isoformat(),
+            }
+        else:
+            return None
+        item.update(self.updated.get(item_id, {}))
+        return item
+
+    def add(self, fields: dict) -> dict:
+        with self._lock:
+            item_id = self.max_id + 1
+            item = {k: v for k, v in fields.items() if k != "__metadata"}
+            item.update(
+                {
+                    "Id": item_id,
+                    "ID": item_id,
+                    "Modified": datetime.now(timezone.utc).isoformat(),
+                }
+            )
+            self.created[item_id] = item
+            self.last_modified = datetime.now(timezone.utc)
+        return item
+
+    def merge(self, item_id: int, fields: dict) -> bool:
+        if self.item(item_id) is None:
+            return False
+        with self._lock:
+            changes = self.updated.setdefault(item_id, {})
+            changes.update({k: v for k, v in fields.items() if k != "__metadata"})
+            changes["Modified"] = datetime.now(timezone.utc).isoformat()
+            self.last_modified = datetime.now(timezone.utc)
+        return True
+
+    def touch(self, item_ids) -> int:
+        """Mark items as modified now (what a user edit would do)"""
+        return sum(self.merge(item_id, {}) for item_id in item_ids)
+
+
+class MockSharePointServer:
+    """Threaded mock server; use as a context manager or start()/stop()"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+        page_size: int = 100,
+        seed: int = 0,
+        view_threshold: int = VIEW_THRESHOLD,
+    ):
+        self.latency_ms = latency_ms
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.page_size = page_size
+        self.view_threshold = view_threshold  # 0 = never throttle queries
+
+        self.lists: Dict[str, MockList] = {}
+        self.subscriptions: Dict[str, dict] = {}  # id -> subscription
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {}
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def site_url(self) -> str:
+        return self.base_url + SITE_PATH
+
+    @property
+    def token_url(self) -> str:
+        return self.base_url + "/bench-tenant/tokens/OAuth/2"
+
+    def start(self) -> "MockSharePointServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="MockSharePoint", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Data and counters
+    # ------------------------------------------------------------------
+    def add_list(self, title: str, item_count: int = 0) -> MockList:
+        mock_list = MockList(title, item_count)
+        self.lists[title.lower()] = mock_list
+        return mock_list
+
+    def get_list(self, title: str) -> Optional[MockList]:
+        return self.lists.get(title.lower())
+
+    def count(self, endpoint: str):
+        with self._lock:
+            self._counts[endpoint] = self._counts.get(endpoint, 0) + 1
+
+    def request_counts(self) -> Dict[str, int]:
+        with self._lock:
+            counts = dict(self._counts)
+        counts["total"] = sum(
+            n for name, n in counts.items() if not name.startswith("batch:")
+        )
+        return counts
+
+    def reset_counts(self):
+        with self._lock:
+            self._counts.clear()
+
+    def should_throttle(self) -> bool:
+        if self.throttle_rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < self.throttle_rate
+
+    # ------------------------------------------------------------------
+    # Request routing (shared by plain requests and $batch parts)
+    # ------------------------------------------------------------------
+    def dispatch(
+        self, method: str, url: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[str, Response]:
+        """Route one request; returns (endpoint label, response)"""
+        parts = urlsplit(url)
+        path = unquote(parts.path)
+        query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        method = headers.get("x-http-method", method).upper()
+
+        if path.endswith("/tokens/OAuth/2"):
+            return "token", self._token()
+        if not path.startswith(SITE_PATH + "/_api/"):
+            return "unknown", _error(404, f"Unknown path: {path}")
+
+        api_path = path[len(SITE_PATH) :]
+        if api_path.rstrip("/") == "/_api/web":
+            return "web", (200, {}, {"d": {"Title": "Benchmark Site"}})
+        if api_path.rstrip("/").lower() == "/_api/web/lists":
+            results = [
+                {"Title": l.title, "ItemCount": l.item_count}
+                for l in self.lists.values()
+            ]
+            return "lists", (200, {}, {"d": {"results": results}})
+        if api_path == "/_api/contextinfo":
+            digest = f"0x{uuid.uuid4().hex.upper()},{time.strftime('%d %b %Y')}"
+            info = {"FormDigestValue": digest, "FormDigestTimeoutSeconds": 1800}
+            return "contextinfo", (200, {}, {"d": {"GetContextWebInformation": info}})
+
+        match = _LIST_RE.search(api_path)
+        if not match:
+            return "unknown", _error(404, f"Unknown API path: {api_path}")
+
+        mock_list = self.get_list(match.group("title"))
+        if mock_list is None:
+            return "list", _error(404, f"List '{match.group('title')}' not found")
+
+        sub = (match.group("sub") or "").lower()
+        item_id = match.group("item_id")
+        if sub == "subscriptions":
+            subscription_id = (item_id or "").strip("'") or None
+            return "subscriptions", self._subscriptions(
+                method, mock_list, subscription_id, body
+            )
+        if sub == "fields":
+            return "fields", self._fields()
+        if sub == "items" and item_id:
+            return self._item(method, mock_list, int(item_id), body)
+        if sub == "items":
+            if method == "POST":
+                return "items:create", self._create(mock_list, body)
+            return "items:read", self._read_items(mock_list, parts, query)
+        return "list", self._list_info(mock_list, query)
+
+    def _token(self) -> Response:
+        payload = {
+            "token_type": "Bearer",
+            "access_token": f"mock-{uuid.uuid4().hex}",
+            "expires_in": "3599",
+        }
+        return 200, {"Content-Type": "application/json"}, payload
+
+    def _fields(self) -> Response:
+        results = [
+            {"InternalName": name, "Title": name, "TypeAsString": type_name}
+            for name, type_name in FIELDS
+        ]
+        return 200, {}, {"d": {"results": results}}
+
+    def _list_info(self, mock_list: MockList, query: dict) -> Response:
+        info = {
+            "Id": mock_list.id,
+            "Title": mock_list.title,
+            "ItemCount": mock_list.item_count,
+            "ListItemEntityTypeFullName": mock_list.entity_type,
+            "LastItemModifiedDate": mock_list.last_modified.isoformat(),
+        }
+        return 200, {}, {"d": _select(info, query.get("$select"))}
+
+    def _read_items(self, mock_list: MockList, parts, query: dict) -> Response:
+        page_size = min(int(query.get("$top") or self.page_size), MAX_PAGE_SIZE)
+        lower, upper = _id_bounds(query.get("$filter"), mock_list.max_id)
+        since = _modified_since(query.get("$filter"))
+        if since and self.view_threshold and upper - lower > self.view_threshold:
+            return _error(
+                500,
+                "The attempted operation is prohibited because it exceeds the "
+                "list view threshold.",
+                code=THRESHOLD_ERROR_CODE,
+            )
+
+        def matching(item_id: int) -> Optional[dict]:
+            item = mock_list.item(item_id)
+            if item is None:
+                return None
+            if since and datetime.fromisoformat(item["Modified"]) < since:
+                return None
+            item["__metadata"] = {"type": mock_list.entity_type}
+            return _select(item, query.get("$select"))
+
+        if query.get("$orderby", "").lower().endswith(" desc"):
+            # Only used for "highest ID" probes: one page, no __next
+            results = []
+            for item_id in range(upper, lower, -1):
+                item = matching(item_id)
+                if item is not None:
+                    results.append(item)
+                    if len(results) >= page_size:
+                        break
+            return 200, {}, {"d": {"results": results}}
+
+        skiptoken = query.get("$skiptoken", "")
+        if skiptoken:
+            token_args = parse_qs(skiptoken)
+            lower = max(lower, int(token_args.get("p_ID", ["0"])[0]))
+
+        results = []
+        item_id = lower
+        while len(results) < page_size and item_id < upper:
+            item_id += 1
+            item = matching(item_id)
+            if item is not None:
+                results.append(item)
+
+        data = {"results": results}
+        if item_id < upper:
+            next_query = "&".join(
+                f"{key}={quote(value, safe=',()')}"
+                for key, value in query.items()
+                if key != "$skiptoken"
+            )
+            skip = quote(f"Paged=TRUE&p_ID={item_id}", safe="")
+            next_query = f"{next_query}&$skiptoken={skip}".lstrip("&")
+            data["__next"] = f"{self.base_url}{parts.path}?{next_query}"
+        return 200, {}, {"d": data}
+
+    def _create(self, mock_list: MockList, body: bytes) -> Response:
+        try:
+            fields = json.loads(body or b"{}")
+        except ValueError:
+            return _error(400, "Invalid JSON body")
+        item = mock_list.add(fields)
+        item["__metadata"] = {"type": mock_list.entity_type}
+        return 201, {}, {"d": item}
+
+    def _item(self, method: str, mock_list: MockList, item_id: int, body: bytes):
+        if method == "MERGE":
+            try:
+                fields = json.loads(body or b"{}")
+            except ValueError:
+                return "items:update", _error(400, "Invalid JSON body")
+            if not mock_list.merge(item_id, fields):
+                return "items:update", _error(404, f"Item {item_id} not found")
+            return "items:update", (204, {}, None)
+
+        item = mock_list.item(item_id)
+        if item is None:
+            return "items:read", _error(404, f"Item {item_id} not found")
+        return "items:read", (200, {}, {"d": item})
+
+    # ------------------------------------------------------------------
+    # Webhooks
+    # ------------------------------------------------------------------
+    def _subscriptions(
+        self, method: str, mock_list: MockList, subscription_id, body: bytes
+    ) -> Response:
+        if method == "GET":
+            value = [
+                s for s in self.subscriptions.values() if s["resource"] == mock_list.id
+            ]
+            return 200, {"Content-Type": "application/json"}, {"value": value}
+
+        if subscription_id:
+            subscription = self.subscriptions.get(subscription_id)
+            if subscription is None:
+                return _error(404, f"Subscription {subscription_id} not found")
+            if method == "DELETE":
+                del self.subscriptions[subscription_id]
+                return 204, {}, None
+            fields = json.loads(body or b"{}")
+            subscription["expirationDateTime"] = fields["expirationDateTime"]
+            return 204, {}, None
+
+        try:
+            fields = json.loads(body or b"{}")
+            url = fields["notificationUrl"]
+        except (ValueError, KeyError):
+            return _error(400, "notificationUrl is required")
+        # SharePoint's handshake: the receiver must echo the token in 5s
+        token = uuid.uuid4().hex
+        try:
+            request = urllib.request.Request(
+                f"{url}?validationtoken={token}", data=b"", method="POST"
+            )
+            with urllib.request.urlopen(request, timeout=5) as response:
+                echoed = response.read().decode("utf-8")
+        except OSError as e:
+            return _error(400, f"Validation of {url} failed: {e}")
+        if echoed != token:
+            return _error(400, f"Validation of {url} failed: wrong token")
+
+        subscription = {
+            "id": str(uuid.uuid4()),
+            "clientState": fields.get("clientState", ""),
+            "expirationDateTime": fields.get("expirationDateTime"),
+            "notificationUrl": url,
+            "resource": mock_list.id,
+        }
+        self.subscriptions[subscription["id"]] = subscription
+        return 201, {"Content-Type": "application/json"}, subscription
+
+    def notify(self, title: str) -> int:
+        """POST a change notification to each subscriber of a list"""
+        mock_list = self.get_list(title)
+        sent = 0
+        for subscription in list(self.subscriptions.values()):
+            if mock_list is None or subscription["resource"] != mock_list.id:
+                continue
+            notification = {
+                "subscriptionId": subscription["id"],
+                "clientState": subscription["clientState"],
+                "expirationDateTime": subscription["expirationDateTime"],
+                "resource": mock_list.id,
+                "tenantId": "00000000-0000-0000-0000-000000000000",
+                "siteUrl": SITE_PATH,
+                "webId": "00000000-0000-0000-0000-000000000001",
+            }
+            request = urllib.request.Request(
+                subscription["notificationUrl"],
+                data=json.dumps({"value": [notification]}).encode("utf-8"),
+                headers={"Content-Type": "application/json"},
+                method="POST",
+            )
+            try:
+                with urllib.request.urlopen(request, timeout=5):
+                    sent += 1
+            except OSError:
+                self.count("notify:failed")
+        return sent
+
+    def dispatch_batch(self, content_type: str, body: bytes) -> Tuple[str, bytes]:
+        """Execute a multipart/mixed $batch body; returns (content type, body)"""
+        boundary = _boundary(content_type)
+        if not boundary:
+            raise ValueError("Missing multipart boundary")
+
+        response_boundary = f"batchresponse_{uuid.uuid4()}"
+        out = []
+        for request_text in _batch_requests(body.decode("utf-8"), boundary):
+            method, url, headers, part_body = _parse_http_part(request_text)
+            endpoint, (status, extra, payload) = self.dispatch(
+                method, url, headers, part_body.encode("utf-8")
+            )
+            self.count(f"batch:{endpoint}")
+            text = json.dumps(payload) if payload is not None else ""
+            out.append(
+                f"--{response_boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                "Content-Transfer-Encoding: binary\r\n\r\n"
+                f"HTTP/1.1 {status} {_reason(status)}\r\n"
+                "Content-Type: application/json;odata=verbose;charset=utf-8\r\n\r\n"
+                f"{text}\r\n"
+            )
+        out.append(f"--{response_boundary}--\r\n")
+        return (
+            f"multipart/mixed; boundary={response_boundary}",
+            "".join(out).encode("utf-8"),
+        )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like SharePoint Online
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def _handle(self, method: str):
+        mock: MockSharePointServer = self.server.mock
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        headers = {k.lower(): v for k, v in self.headers.items()}
+
+        if mock.latency_ms:
+            time.sleep(mock.latency_ms / 1000)
+
+        path = urlsplit(self.path).path
+        if not path.endswith("/tokens/OAuth/2") and mock.should_throttle():
+            mock.count("throttled")
+            self._send(
+                429,
+                {"Retry-After": str(mock.retry_after)},
+                json.dumps(_error(429, "Request throttled")[2]).encode(),
+            )
+            return
+
+        if path.endswith("/_api/$batch"):
+            mock.count("batch")
+            try:
+                content_type, payload = mock.dispatch_batch(
+                    headers.get("content-type", ""), body
+                )
+            except ValueError as e:
+                self._send(400, {}, json.dumps(_error(400, str(e))[2]).encode())
+                return
+            self._send(200, {"Content-Type": content_type}, payload)
+            return
+
+        endpoint, (status, extra, payload) = mock.dispatch(
+            method, self.path, headers, body
+        )
+        mock.count(endpoint)
+        data = json.dumps(payload).encode() if payload is not None else b""
+        self._send(status, extra, data)
+
+    def _send(self, status: int, headers: Dict[str, str], data: bytes):
+        self.send_response(status)
+        headers.setdefault("Content-Type", "application/json;odata=verbose")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+
+def _error(status: int, message: str, code: str = None) -> Response:
+    return (
+        status,
+        {},
+        {
+            "error": {
+                "code": code or str(status),
+                "message": {"lang": "en-US", "value": message},
+            }
+        },
+    )
+
+
+def _reason(status: int) -> str:
+    return BaseHTTPRequestHandler.responses.get(status, ("",))[0]
+
+
+def _modified_since(filter_text: Optional[str]) -> Optional[datetime]:
+    match = _MODIFIED_FILTER_RE.search(filter_text or "")
+    if not match:
+        return None
+    return datetime.fromisoformat(match.group(1).replace("Z", "+00:00"))
+
+
+def _id_bounds(filter_text: Optional[str], max_id: int) -> Tuple[int, int]:
+    """ID range of a filter as (exclusive lower, inclusive upper)"""
+    lower, upper = 0, max_id
+    for op, value in _ID_FILTER_RE.findall(filter_text or ""):
+        value = int(value)
+        op = op.lower()
+        if op == "gt":
+            lower = max(lower, value)
+        elif op == "ge":
+            lower = max(lower, value - 1)
+        elif op == "le":
+            upper = min(upper, value)
+        else:
+            upper = min(upper, value - 1)
+    return lower, upper
+
+
+def _select(record: dict, select: Optional[str]) -> dict:
+    if not select:
+        return record
+    wanted = {name.strip() for name in select.split(",")}
+    wanted.add("__metadata")
+    return {key: value for key, value in record.items() if key in wanted}
+
+
+def _boundary(content_type: str) -> Optional[str]:
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    return match.group(1) if match else None
+
+
+def _batch_requests(text: str, boundary: str):
+    """Yield the embedded HTTP requests, descending into changesets"""
+    for part in text.replace("\r\n", "\n").split(f"--{boundary}"):
+        part = part.strip("\n")
+        if not part or part == "--":
+            continue
+        head, _, rest = part.partition("\n\n")
+        nested = _boundary(head) if "multipart/mixed" in head.lower() else None
+        if nested:
+            yield from _batch_requests(rest, nested)
+        else:
+            yield rest
+
+
+def _parse_http_part(text: str):
+    """Split an application/http part into method, url, headers and body"""
+    head, _, body = text.partition("\n\n")
+    lines = head.strip("\n").split("\n")
+    method, _, target = lines[0].partition(" ")
+    url = target.rsplit(" HTTP/", 1)[0]
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return method, url, headers, body.strip("\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.mock_sharepoint",
+        description="Serve a mock SharePoint site for manual testing",
+    )
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--list", default="BenchItems", help="list title")
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument(
+        "--view-threshold",
+        type=int,
+        default=VIEW_THRESHOLD,
+        help="IDs a filtered query may scan before it fails (0 = no limit)",
+    )
+    parser.add_argument(
+        "--notify-every",
+        type=float,
+        default=0.0,
+        help="seconds between simulated edits + webhook notifications",
+    )
+    args = parser.parse_args(argv)
+
+    server = MockSharePointServer(
+        port=args.port,
+        latency_ms=args.latency_ms,
+        throttle_rate=args.throttle_rate,
+        page_size=args.page_size,
+        view_threshold=args.view_threshold,
+    )
+    mock_list = server.add_list(args.list, args.items)
+    print(f"Site URL:  {server.site_url}")
+    print(f"Token URL: {server.token_url}  (set sharepoint_token_url)")
+    print(f"List:      {args.list} ({args.items} items)")
+    server.start()
+    try:
+        if args.notify_every > 0:
+            while True:
+                time.sleep(args.notify_every)
+                edited = random.sample(
+                    range(1, mock_list.max_id + 1), min(5, mock_list.max_id)
+                )
+                mock_list.touch(edited)
+                sent = server.notify(args.list)
+                print(f"Edited items {sorted(edited)}; notified {sent} subscriber(s)")
+        while True:
+            time.sleep(60)
+            print(f"Requests: {server.request_counts()}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,316 @@
+# benchmarks/runner.py - Scenario execution and measurement
+"""
+Each scenario runs the real sync code (SyncJob / ExcelImportWorker and the
+connectors) in a fresh spawned process against the mock SharePoint server
+and a SQLite file, so peak RSS is per scenario. The mock server stays in
+the parent process and counts the requests each scenario makes.
+"""
+import multiprocessing
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmarks.mock_sharepoint import CATEGORIES, MockSharePointServer
+from utils.config_loader import Config
+
+KINDS = ("spo_to_sql", "sql_to_spo", "excel")
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+
+LIST_TITLE = "BenchItems"
+TABLE_NAME = "bench_items"
+FIELD_MAPPING = {"Title": "Title", "Amount": "Amount", "Category": "Category"}
+
+
+@dataclass
+class Scenario:
+    kind: str
+    rows: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.kind}_{self.rows}"
+
+
+@dataclass
+class BenchmarkResult:
+    scenario: str
+    kind: str
+    rows: int
+    success: bool
+    message: str
+    rows_processed: int = 0
+    seconds: float = 0.0
+    rows_per_sec: float = 0.0
+    peak_rss_mb: Optional[float] = None
+    requests: Dict[str, int] = field(default_factory=dict)
+    completed: bool = True  # False when stopped by the time limit
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def build_scenarios(kinds=KINDS, sizes=DEFAULT_SIZES) -> List[Scenario]:
+    return [Scenario(kind, rows) for kind in kinds for rows in sizes]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None if unavailable)"""
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KB, macOS bytes
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss) / (1024 * 1024)
+    except ImportError:
+        return None
+
+
+def build_config(
+    server: MockSharePointServer, sqlite_file: Path, work_dir: Path
+) -> Config:
+    """
+    Configuration pointing every connector at the local stand-ins; state
+    files the app would write under data/ go to `work_dir` instead.
+    """
+    return Config(
+        sharepoint_site=server.site_url,
+        sharepoint_list=LIST_TITLE,
+        sharepoint_client_id="bench-client",
+        sharepoint_client_secret="bench-secret",
+        tenant_id="bench-tenant",
+        sharepoint_token_url=server.token_url,
+        database_type="sqlite",
+        sqlite_file=str(sqlite_file),
+        sqlite_table_name=TABLE_NAME,
+        sql_table_name=TABLE_NAME,
+        sql_truncate_before=True,
+        sharepoint_to_sql_mapping=dict(FIELD_MAPPING),
+        sql_to_sharepoint_mapping=dict(FIELD_MAPPING),
+        excel_import_mapping=dict(FIELD_MAPPING),
+        health_monitor_enabled=False,
+        run_history_file=str(work_dir / "run_history.db"),
+        read_plan_state_file=str(work_dir / "read_plan_state.json"),
+        lookup_cache_file=str(work_dir / "lookup_cache.json"),
+        batch_tuning_file=str(work_dir / "batch_tuning.json"),
+        spill_dir=str(work_dir / "spill"),
+    )
+
+
+def seed_sql_table(sqlite_file: Path, rows: int, chunk: int = 50_000):
+    """Fill the source table for SQL -> SharePoint runs (stdlib sqlite3)"""
+    with sqlite3.connect(sqlite_file) as conn:
+        conn.execute(f"DROP TABLE IF EXISTS {TABLE_NAME}")
+        conn.execute(
+            f"CREATE TABLE {TABLE_NAME} (Title TEXT, Amount REAL, Category TEXT)"
+        )
+        for start in range(1, rows + 1, chunk):
+            end = min(rows, start + chunk - 1)
+            conn.executemany(
+                f"INSERT INTO {TABLE_NAME} VALUES (?, ?, ?)",
+                (
+                    (f"Row {i}", i * 1.5, CATEGORIES[i % len(CATEGORIES)])
+                    for i in range(start, end + 1)
+                ),
+            )
+
+
+def write_excel_file(path: Path, rows: int):
+    """Write an .xlsx source file for Excel import runs"""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Items")
+    sheet.append(list(FIELD_MAPPING))
+    for i in range(1, rows + 1):
+        sheet.append([f"Row {i}", i * 1.5, CATEGORIES[i % len(CATEGORIES)]])
+    workbook.save(path)
+
+
+# ----------------------------------------------------------------------
+# Child process side
+# ----------------------------------------------------------------------
+class _BenchEvents:
+    """SyncEvents sink that only tracks how far the job got"""
+
+    def __init__(self):
+        self.rows_done = 0
+
+    def on_progress(self, task_name, percentage, message):
+        pass
+
+    def on_progress_stats(self, stats):
+        if stats.get("rows_done"):
+            self.rows_done = stats["rows_done"]
+
+    def on_log(self, message, level):
+        pass
+
+    def on_completed(self, success, message, stats):
+        pass
+
+
+def _run_sync(config: Config, direction: str, time_limit: float) -> dict:
+    from controller.sync_core import SyncJob
+    from utils.resilience import get_resilience
+
+    get_resilience().configure(config)
+    events = _BenchEvents()
+    job = SyncJob(config, direction, events=events)
+    timer = threading.Timer(time_limit, job.stop) if time_limit else None
+    if timer:
+        timer.start()
+
+    started = time.perf_counter()
+    try:
+        success, message, stats = job.run()
+    finally:
+        if timer:
+            timer.cancel()
+    seconds = time.perf_counter() - started
+
+    timed_out = bool(timer) and not success and "cancelled" in message.lower()
+    rows = stats.get("records_added", 0) or events.rows_done
+    return {
+        "success": success or timed_out,
+        "completed": not timed_out,
+        "message": message,
+        "rows_processed": rows,
+        "seconds": seconds,
+    }
+
+
+def _run_excel(config: Config, excel_file: str) -> dict:
+    from utils.excel_import_handler import ExcelImportWorker
+
+    results = []
+    worker = ExcelImportWorker(
+        config, excel_file, TABLE_NAME, dict(config.excel_import_mapping)
+    )
+    worker.import_completed.connect(results.append)
+
+    # run() directly - measure the import, not thread scheduling
+    started = time.perf_counter()
+    worker.run()
+    seconds = time.perf_counter() - started
+
+    result = results[0] if results else None
+    return {
+        "success": bool(result and result.success),
+        "completed": True,
+        "message": result.message if result else "No result emitted",
+        "rows_processed": result.rows_imported_to_db if result else 0,
+        "seconds": seconds,
+    }
+
+
+def _child_main(kind: str, config: Config, excel_file: str, time_limit: float):
+    """Entry point inside the spawned process"""
+    import logging
+
+    logging.basicConfig(level=logging.WARNING)
+    if kind == "excel":
+        outcome = _run_excel(config, excel_file)
+    else:
+        outcome = _run_sync(config, kind, time_limit)
+    outcome["peak_rss_mb"] = peak_rss_mb()
+    return outcome
+
+
+# ----------------------------------------------------------------------
+# Parent process side
+# ----------------------------------------------------------------------
+class BenchmarkRunner:
+    """Runs scenarios against one mock server instance"""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        throttle_rate: float = 0.0,
+        page_size: int = 100,
+        time_limit: float = 0.0,
+        work_dir: Path = None,
+    ):
+        self.server = MockSharePointServer(
+            latency_ms=latency_ms, throttle_rate=throttle_rate, page_size=page_size
+        )
+        self.time_limit = time_limit
+        self._tmp = None
+        if work_dir is None:
+            self._tmp = tempfile.TemporaryDirectory(prefix="spo_bench_")
+        self.work_dir = Path(work_dir or self._tmp.name)
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+
+    def __enter__(self):
+        self.server.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.stop()
+        if self._tmp:
+            self._tmp.cleanup()
+
+    def prepare(self, scenario: Scenario) -> tuple:
+        """Seed the source side; returns (config, excel_file)"""
+        sqlite_file = self.work_dir / f"{scenario.name}.db"
+        sqlite_file.unlink(missing_ok=True)
+        config = build_config(self.server, sqlite_file, self.work_dir)
+        excel_file = ""
+
+        if scenario.kind == "spo_to_sql":
+            self.server.add_list(LIST_TITLE, scenario.rows)
+        elif scenario.kind == "sql_to_spo":
+            self.server.add_list(LIST_TITLE, 0)
+            seed_sql_table(sqlite_file, scenario.rows)
+        elif scenario.kind == "excel":
+            excel_file = str(self.work_dir / f"{scenario.name}.xlsx")
+            if not Path(excel_file).exists():
+                write_excel_file(Path(excel_file), scenario.rows)
+        else:
+            raise ValueError(f"Unknown scenario kind: {scenario.kind}")
+        return config, excel_file
+
+    def run(self, scenario: Scenario) -> BenchmarkResult:
+        config, excel_file = self.prepare(scenario)
+        self.server.reset_counts()
+
+        context = multiprocessing.get_context("spawn")
+        try:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                outcome = pool.submit(
+                    _child_main, scenario.kind, config, excel_file, self.time_limit
+                ).result()
+        except Exception as e:
+            outcome = {"success": False, "message": f"Benchmark process failed: {e}"}
+
+        seconds = outcome.get("seconds", 0.0)
+        rows = outcome.get("rows_processed", 0)
+        return BenchmarkResult(
+            scenario=scenario.name,
+            kind=scenario.kind,
+            rows=scenario.rows,
+            success=outcome.get("success", False),
+            completed=outcome.get("completed", False),
+            message=outcome.get("message", ""),
+            rows_processed=rows,
+            seconds=round(seconds, 3),
+            rows_per_sec=round(rows / seconds, 1) if seconds > 0 else 0.0,
+            peak_rss_mb=(
+                round(outcome["peak_rss_mb"], 1)
+                if outcome.get("peak_rss_mb") is not None
+                else None
+            ),
+            requests=self.server.request_counts(),
+        )
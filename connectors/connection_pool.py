@@ -0,0 +1,287 @@
+# connectors/connection_pool.py - Thread-safe pool of long-lived connectors
+import hashlib
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Tuple
+
+from utils.config_loader import Config
+
+logger = logging.getLogger(__name__)
+
+SHAREPOINT = "sharepoint"
+DATABASE = "database"
+
+
+def connector_cache_key(config: Config, connector_type: str) -> str:
+    """
+    Generate a pool/cache key from the settings that identify a connection.
+    Credentials are part of the key, so connectors opened with old ones are
+    not leased again after the settings change.
+    """
+    if connector_type == SHAREPOINT:
+        fields = (
+            config.sharepoint_site,
+            config.sharepoint_client_id,
+            config.sharepoint_client_secret,
+            config.tenant_id,
+            getattr(config, "sharepoint_token_url", ""),
+            getattr(config, "use_graph_api", False),
+            getattr(config, "graph_base_url", ""),
+            getattr(config, "graph_token_url", ""),
+        )
+    elif connector_type == DATABASE:
+        if config.database_type == "sqlserver":
+            # sql_server carries the port ("host,1433"); the ODBC driver is fixed
+            fields = (
+                config.sql_server,
+                config.sql_database,
+                config.sql_username,
+                config.sql_password,
+            )
+        else:
+            fields = (config.sqlite_file,)
+    else:
+        fields = (str(config),)
+
+    config_str = "\x1f".join(str(value) for value in fields)
+    return hashlib.sha256(f"{connector_type}:{config_str}".encode()).hexdigest()
+
+
+def _default_factory(connector_type: str) -> Callable[[Config], Any]:
+    """Resolve the connector class for a connector type"""
+    if connector_type == SHAREPOINT:
+        from connectors.sharepoint_connector import create_sharepoint_connector
+
+        return create_sharepoint_connector
+    if connector_type == DATABASE:
+        from connectors.database_connector import DatabaseConnector
+
+        return DatabaseConnector
+    raise ValueError(f"Unknown connector type: {connector_type}")
+
+
+class _PoolSlot:
+    """Idle connectors and lease bookkeeping for one pool key"""
+
+    def __init__(self):
+        self.idle: List[Tuple[Any, float]] = []  # (connector, released_at)
+        self.leased = 0
+
+
+class ConnectorPool:
+    """
+    Thread-safe pool that leases long-lived connectors to workers.
+    Returned connectors stay open, so the SQLAlchemy engine pool, HTTP
+    keep-alive sessions and cached auth tokens survive between sync runs.
+    """
+
+    def __init__(
+        self,
+        max_per_key: int = 2,
+        idle_ttl_seconds: int = 900,
+        acquire_timeout: int = 30,
+    ):
+        self.max_per_key = max(1, max_per_key)
+        self.idle_ttl = idle_ttl_seconds
+        self.acquire_timeout = acquire_timeout
+
+        self._cond = threading.Condition()
+        self._slots: Dict[str, _PoolSlot] = {}
+        self._leases: Dict[int, Tuple[str, int]] = {}  # id(connector) -> (key, gen)
+        self._factories: Dict[str, Callable[[Config], Any]] = {}
+        self._generation = 0
+        self._closed = False
+
+        logger.debug(
+            f"ConnectorPool initialized (max_per_key={self.max_per_key}, "
+            f"idle_ttl={self.idle_ttl}s)"
+        )
+
+    def register_factory(self, connector_type: str, factory: Callable[[Config], Any]):
+        """Override how connectors of a given type are created"""
+        self._factories[connector_type] = factory
+
+    def acquire(self, config: Config, connector_type: str, timeout: float = None):
+        """Lease a connector, reusing an idle one when available"""
+        key = connector_cache_key(config, connector_type)
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("ConnectorPool is closed")
+
+            slot = self._slots.setdefault(key, _PoolSlot())
+            self._evict_expired(slot)
+
+            while not slot.idle and slot.leased >= self.max_per_key:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"No {connector_type} connector available after {timeout}s"
+                    )
+                self._cond.wait(remaining)
+                self._evict_expired(slot)
+
+            if slot.idle:
+                connector, _ = slot.idle.pop()
+                slot.leased += 1
+                self._leases[id(connector)] = (key, self._generation)
+                self._bind_config(connector, config)
+                logger.debug(f"Reusing pooled {connector_type} connector")
+                return connector
+
+            # Reserve the slot before creating outside the lock
+            slot.leased += 1
+            generation = self._generation
+
+        try:
+            factory = self._factories.get(connector_type) or _default_factory(
+                connector_type
+            )
+            logger.info(f"Creating pooled {connector_type} connector")
+            connector = factory(config)
+        except Exception:
+            with self._cond:
+                slot.leased -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._leases[id(connector)] = (key, generation)
+        return connector
+
+    def release(self, connector, discard: bool = False):
+        """Return a leased connector to the pool (or close it if discarded)"""
+        if connector is None:
+            return
+
+        with self._cond:
+            key, generation = self._leases.pop(id(connector), (None, None))
+            slot = self._slots.get(key) if key else None
+            if slot is not None:
+                slot.leased = max(0, slot.leased - 1)
+
+            keep = (
+                slot is not None
+                and not discard
+                and not self._closed
+                and generation == self._generation
+                and self._is_usable(connector)
+            )
+            if keep:
+                slot.idle.append((connector, time.monotonic()))
+            self._cond.notify()
+
+        if not keep:
+            self._close_connector(connector)
+
+    # ConnectionManager-compatible names, so workers can lease straight from
+    # a pool when no Qt ConnectionManager exists (headless runs)
+    def acquire_connector(self, config: Config, connector_type: str):
+        return self.acquire(config, connector_type)
+
+    def release_connector(self, connector, discard: bool = False):
+        self.release(connector, discard=discard)
+
+    @contextmanager
+    def lease(self, config: Config, connector_type: str):
+        """Context manager that leases a connector and always returns it"""
+        connector = self.acquire(config, connector_type)
+        failed = False
+        try:
+            yield connector
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.release(connector, discard=failed)
+
+    def prune_idle(self) -> int:
+        """Close idle connectors that exceeded the idle TTL"""
+        with self._cond:
+            expired = []
+            for slot in self._slots.values():
+                expired.extend(self._evict_expired(slot, close=False))
+
+        for connector in expired:
+            self._close_connector(connector)
+        return len(expired)
+
+    def clear(self):
+        """Close idle connectors; leased ones are closed when released"""
+        with self._cond:
+            self._generation += 1
+            idle = [c for slot in self._slots.values() for c, _ in slot.idle]
+            for slot in self._slots.values():
+                slot.idle.clear()
+            self._cond.notify_all()
+
+        for connector in idle:
+            self._close_connector(connector)
+        logger.debug(f"ConnectorPool cleared ({len(idle)} idle connectors closed)")
+
+    def close(self):
+        """Close the pool and all idle connectors"""
+        with self._cond:
+            self._closed = True
+        self.clear()
+
+    def get_stats(self) -> Dict[str, dict]:
+        """Return idle/leased counts per pool key"""
+        with self._cond:
+            return {
+                key: {"idle": len(slot.idle), "leased": slot.leased}
+                for key, slot in self._slots.items()
+            }
+
+    def _evict_expired(self, slot: _PoolSlot, close: bool = True) -> list:
+        """Drop idle connectors past their TTL (caller holds the lock)"""
+        if not self.idle_ttl:
+            return []
+
+        now = time.monotonic()
+        fresh, expired = [], []
+        for connector, released_at in slot.idle:
+            if now - released_at < self.idle_ttl:
+                fresh.append((connector, released_at))
+            else:
+                expired.append(connector)
+        slot.idle = fresh
+
+        if close:
+            for connector in expired:
+                self._close_connector(connector)
+        return expired
+
+    @staticmethod
+    def _bind_config(connector, config: Config):
+        """
+        Hand a reused connector the borrower's settings. The key only pins
+        the connection itself; batch sizes, read workers, tuning files,
+        memory budget and timeouts come from whichever job leases it.
+        """
+        if hasattr(connector, "config"):
+            connector.config = config
+        session = getattr(connector, "session", None)
+        if session is not None:
+            session.timeout = getattr(config, "connection_timeout", 30)
+
+    @staticmethod
+    def _is_usable(connector) -> bool:
+        """Cheap local check - no network round trip"""
+        if hasattr(connector, "engine") and connector.engine is None:
+            return False
+        if hasattr(connector, "session") and connector.session is None:
+            return False
+        return True
+
+    @staticmethod
+    def _close_connector(connector):
+        try:
+            if hasattr(connector, "close"):
+                connector.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled connector: {e}")
@@ -1,16 +1,51 @@
 # connectors/database_connector.py - Fixed Database Connector
-import pandas as pd
-from sqlalchemy import create_engine, text, inspect, exc
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 import logging
+import sqlite3
+import time
 from pathlib import Path
 from urllib.parse import quote_plus
 
 from utils.error_handling import handle_exceptions, ErrorCategory, ErrorSeverity
-from utils.config_manager import Config
+from utils.config_loader import Config
+from utils.resilience import get_resilience
+from utils.lazy_imports import lazy_module
+from utils.metrics import current_metrics
+from utils.batch_tuner import BatchTuner, get_batch_tuner
+from utils.memory_budget import frame_row_bytes, get_memory_budget
+
+# Loaded on first use - keeps the GUI start path free of pandas/SQLAlchemy
+pd = lazy_module("pandas")
+sqlalchemy = lazy_module("sqlalchemy")
+exc = lazy_module("sqlalchemy.exc")
 
 logger = logging.getLogger(__name__)
 
+# OperationalError also covers bad SQL on some drivers, so match on the message
+TRANSIENT_MARKERS = (
+    "locked",
+    "busy",
+    "timeout",
+    "timed out",
+    "connection",
+    "network",
+    "08001",
+    "08S01",
+    "HYT00",
+)
+
+
+def is_transient_db_error(error: Exception) -> bool:
+    """Dropped connections, pool/lock timeouts and unreachable servers"""
+    if isinstance(error, (exc.DisconnectionError, exc.TimeoutError)):
+        return True
+    if isinstance(error, exc.DBAPIError) and error.connection_invalidated:
+        return True
+    if isinstance(error, exc.OperationalError):
+        message = str(error).lower()
+        return any(marker.lower() in message for marker in TRANSIENT_MARKERS)
+    return isinstance(error, (ConnectionError, TimeoutError))
+
 
 class DatabaseConnector:
     """
@@ -22,6 +57,8 @@ class DatabaseConnector:
         self.config = config
         self.engine = None
         self.connection_string = ""
+        self.resilience = get_resilience()
+        self._endpoint = self._endpoint_name()
         self._create_engine()
         logger.info(f"DatabaseConnector initialized for {self.config.database_type}")
 
@@ -52,11 +89,12 @@ class DatabaseConnector:
                     "autocommit": True,
                 }
 
-            self.engine = create_engine(self.connection_string, **engine_kwargs)
+            self.engine = sqlalchemy.create_engine(
+                self.connection_string, **engine_kwargs
+            )
 
             # Test connection
-            with self.engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+            self._call(self._ping)
 
             logger.info(f"Database engine created successfully for {db_type}")
 
@@ -67,6 +105,27 @@ class DatabaseConnector:
             logger.error(f"Unexpected error during engine creation: {e}")
             raise
 
+    def _endpoint_name(self) -> str:
+        """Breaker key for this database target (no credentials)"""
+        if self.config.database_type.lower() == "sqlserver":
+            return f"database:{self.config.sql_server}/{self.config.sql_database}"
+        return f"database:{self.config.sqlite_file}"
+
+    def _call(self, func, *args, retryable=True, **kwargs):
+        """Run a database operation through the shared breaker/retry layer"""
+        return self.resilience.call(
+            self._endpoint,
+            func,
+            *args,
+            is_transient=is_transient_db_error,
+            retryable=retryable,
+            **kwargs,
+        )
+
+    def _ping(self):
+        with self.engine.connect() as conn:
+            conn.execute(sqlalchemy.text("SELECT 1")).fetchone()
+
     def _build_sqlserver_connection_string(self) -> str:
         """Build SQL Server connection string"""
         if not all([self.config.sql_server, self.config.sql_database]):
@@ -116,9 +175,8 @@ class DatabaseConnector:
             return False
 
         try:
-            with self.engine.connect() as conn:
-                result = conn.execute(text("SELECT 1"))
-                result.fetchone()
+            # Probes fail fast - the health monitor has its own backoff
+            self._call(self._ping, retryable=False)
             logger.info("Database connection test successful")
             return True
         except exc.SQLAlchemyError as e:
@@ -129,8 +187,8 @@ class DatabaseConnector:
             return False
 
     @handle_exceptions(ErrorCategory.DATA, ErrorSeverity.MEDIUM)
-    def read_table(self, table_name: str) -> Optional[List[Dict]]:
-        """Read all data from specified table"""
+    def read_table(self, table_name: str, as_frame: bool = False):
+        """Read all data from specified table (records, or the DataFrame)"""
         if not table_name:
             logger.error("Table name is required")
             return None
@@ -141,19 +199,26 @@ class DatabaseConnector:
             logger.error("Database engine is not initialized")
             return None
 
-        try:
+        def read():
             with self.engine.connect() as conn:
                 # Check if table exists
-                inspector = inspect(self.engine)
+                inspector = sqlalchemy.inspect(self.engine)
                 if not inspector.has_table(table_name):
-                    logger.warning(f"Table '{table_name}' does not exist")
-                    return []
+                    return None
 
-                query = text(f"SELECT * FROM [{table_name}]")
-                df = pd.read_sql(query, conn)
+                query = sqlalchemy.text(f"SELECT * FROM [{table_name}]")
+                return pd.read_sql(query, conn)
+
+        try:
+            with current_metrics().span("db:read") as span:
+                df = self._call(read)
+                span["rows"] = len(df) if df is not None else 0
+            if df is None:
+                logger.warning(f"Table '{table_name}' does not exist")
+                return pd.DataFrame() if as_frame else []
 
             logger.info(f"Successfully read {len(df)} rows from table '{table_name}'")
-            return df.to_dict(orient="records")
+            return df if as_frame else df.to_dict(orient="records")
 
         except exc.SQLAlchemyError as e:
             logger.error(f"Failed to read table '{table_name}': {e}")
@@ -165,12 +230,14 @@ class DatabaseConnector:
     @handle_exceptions(ErrorCategory.DATA, ErrorSeverity.MEDIUM)
     def write_dataframe(
         self,
-        df: pd.DataFrame,
+        df: "pd.DataFrame",
         table_name: str,
         if_exists: str = "append",
         index: bool = False,
         create_table: bool = True,
         chunksize: int = None,
+        replace_keys: str = None,
+        progress: Callable[[int], None] = None,
     ) -> int:
         """
         Write pandas DataFrame to database table
@@ -181,7 +248,11 @@ class DatabaseConnector:
             if_exists: 'fail', 'replace', 'append'
             index: Whether to write DataFrame index
             create_table: Whether to create table if not exists
-            chunksize: Number of rows to write at once
+            chunksize: Number of rows to write at once (None = tuned per
+                table, starting from batch_size)
+            replace_keys: Column whose existing rows are deleted for the keys
+                in `df` before the insert (incremental upsert)
+            progress: Called with the rows written so far after each batch
 
         Returns:
             Number of rows written
@@ -202,28 +273,76 @@ class DatabaseConnector:
 
         try:
             # Check table existence if needed
-            inspector = inspect(self.engine)
-            table_exists = inspector.has_table(table_name)
+            table_exists = self._call(
+                lambda: sqlalchemy.inspect(self.engine).has_table(table_name)
+            )
 
             if not table_exists and not create_table and if_exists != "replace":
                 raise ValueError(
                     f"Table '{table_name}' does not exist and create_table=False"
                 )
 
-            # Use configured batch size if chunksize not specified
+            # Multi-row INSERTs are limited by bind parameters per statement
+            max_rows = self._max_insert_rows(len(df.columns))
             if chunksize is None:
-                chunksize = getattr(self.config, "batch_size", 1000)
-
-            # Write data using transaction
-            with self.engine.begin() as conn:
-                rows_written = df.to_sql(
-                    table_name,
-                    con=conn,
-                    if_exists=if_exists,
-                    index=index,
-                    chunksize=chunksize,
-                    method="multi",  # Use multi-row INSERT for better performance
+                tuner = get_batch_tuner(
+                    self.config,
+                    f"{self._endpoint}:{table_name}",
+                    initial=getattr(self.config, "batch_size", 1000),
+                    minimum=min(50, max_rows),
+                    maximum=max_rows,
                 )
+            else:
+                size = min(max(1, chunksize or len(df)), max_rows)
+                tuner = BatchTuner(table_name, size, size, size)  # fixed
+
+            # Under memory pressure batches shrink below the tuned size
+            budget = get_memory_budget(self.config)
+            row_bytes = frame_row_bytes(df)
+
+            def write():
+                metrics = current_metrics()
+                # Batches share one transaction; time each batch and the commit
+                with self.engine.begin() as conn:
+                    if replace_keys and table_exists and if_exists == "append":
+                        with metrics.span("db:delete_keys", rows=len(df)):
+                            self._delete_keys(
+                                conn,
+                                table_name,
+                                replace_keys,
+                                df[replace_keys].dropna().unique().tolist(),
+                            )
+                    start = 0
+                    while start < len(df):
+                        size = budget.fit_rows(tuner.size, row_bytes)
+                        batch = df.iloc[start : start + size]
+                        batch_started = time.perf_counter()
+                        try:
+                            with metrics.span("db:write_batch", rows=len(batch)):
+                                batch.to_sql(
+                                    table_name,
+                                    con=conn,
+                                    if_exists=if_exists if start == 0 else "append",
+                                    index=index,
+                                    method="multi",  # Multi-row INSERT per batch
+                                )
+                        except Exception as e:
+                            if is_transient_db_error(e):
+                                tuner.backoff()
+                            raise
+                        tuner.record(len(batch), time.perf_counter() - batch_started)
+                        start += len(batch)
+                        if progress:
+                            progress(start)
+                    commit_started = time.perf_counter()
+                metrics.record("db:commit", time.perf_counter() - commit_started)
+
+            # Write data using transaction. SQL Server runs with autocommit,
+            # so a failed write may be partially applied and is not retried
+            try:
+                self._call(write, retryable=False)
+            finally:
+                tuner.save()
 
             logger.info(f"Successfully wrote {len(df)} rows to table '{table_name}'")
             return len(df)
@@ -237,6 +356,46 @@ class DatabaseConnector:
             )
             raise
 
+    def _max_insert_rows(self, columns: int) -> int:
+        """Rows per multi-row INSERT that stay under the bind parameter limit"""
+        if self.config.database_type.lower() == "sqlserver":
+            limit = 2100 - 1  # SQL Server / ODBC
+        elif sqlite3.sqlite_version_info >= (3, 32, 0):
+            limit = 32766
+        else:
+            limit = 999
+        return max(1, limit // max(1, columns))
+
+    @handle_exceptions(ErrorCategory.DATA, ErrorSeverity.MEDIUM)
+    def delete_keys(self, table_name: str, column: str, keys: list) -> int:
+        """Delete the rows whose `column` is one of `keys`"""
+        if not keys or self.engine is None:
+            return 0
+        table_exists = self._call(
+            lambda: sqlalchemy.inspect(self.engine).has_table(table_name)
+        )
+        if not table_exists:
+            return 0
+
+        def delete():
+            with self.engine.begin() as conn:
+                return self._delete_keys(conn, table_name, column, keys)
+
+        return self._call(delete, retryable=False)
+
+    @staticmethod
+    def _delete_keys(conn, table_name: str, column: str, keys: list) -> int:
+        """Delete rows whose `column` matches one of `keys`, 500 at a time"""
+        quote = conn.dialect.identifier_preparer.quote
+        statement = sqlalchemy.text(
+            f"DELETE FROM {quote(table_name)} WHERE {quote(column)} IN :keys"
+        ).bindparams(sqlalchemy.bindparam("keys", expanding=True))
+        deleted = 0
+        for start in range(0, len(keys), 500):
+            result = conn.execute(statement, {"keys": keys[start : start + 500]})
+            deleted += max(result.rowcount or 0, 0)
+        return deleted
+
     @handle_exceptions(ErrorCategory.DATA, ErrorSeverity.MEDIUM)
     def execute_query(self, query: str, params: dict = None) -> Optional[List[Dict]]:
         """Execute custom SQL query"""
@@ -249,12 +408,12 @@ class DatabaseConnector:
         if self.engine is None:
             raise ConnectionError("Database engine not initialized")
 
-        try:
+        def run():
             with self.engine.connect() as conn:
                 if params:
-                    result = conn.execute(text(query), params)
+                    result = conn.execute(sqlalchemy.text(query), params)
                 else:
-                    result = conn.execute(text(query))
+                    result = conn.execute(sqlalchemy.text(query))
 
                 # Handle SELECT queries
                 if result.returns_rows:
@@ -269,6 +428,10 @@ class DatabaseConnector:
                     logger.info(f"Query affected {rowcount} rows")
                     return [{"affected_rows": rowcount}]
 
+        try:
+            # Custom queries may modify data, so they are never retried
+            return self._call(run, retryable=False)
+
         except exc.SQLAlchemyError as e:
             logger.error(f"Failed to execute query: {e}")
             raise
@@ -285,15 +448,18 @@ class DatabaseConnector:
         if self.engine is None:
             return None
 
-        try:
-            inspector = inspect(self.engine)
-
+        def describe():
+            inspector = sqlalchemy.inspect(self.engine)
             if not inspector.has_table(table_name):
                 return None
+            return inspector.get_columns(table_name), inspector.get_indexes(table_name)
 
-            columns = inspector.get_columns(table_name)
-            indexes = inspector.get_indexes(table_name)
+        try:
+            schema = self._call(describe)
+            if schema is None:
+                return None
 
+            columns, indexes = schema
             return {
                 "table_name": table_name,
                 "columns": columns,
@@ -312,8 +478,9 @@ class DatabaseConnector:
             return []
 
         try:
-            inspector = inspect(self.engine)
-            tables = inspector.get_table_names()
+            tables = self._call(
+                lambda: sqlalchemy.inspect(self.engine).get_table_names()
+            )
             logger.debug(f"Found {len(tables)} tables in database")
             return tables
         except Exception as e:
@@ -0,0 +1,393 @@
+# connectors/graph_connector.py - SharePoint lists through Microsoft Graph
+"""
+Same interface as SharePointConnector (read_list_items, add_list_item(s),
+update_list_item, get_list_info, test_connection, close), selected with
+`use_graph_api`. On top of it:
+
+- read_list_changes() follows /items/delta, so incremental runs only
+  transfer changed and deleted items;
+- reads project columns with $expand=fields($select=...);
+- add_list_items() sends JSON $batch requests of 20 creates each.
+"""
+import logging
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlparse
+
+from connectors.sharepoint_connector import (
+    is_rejected_error,
+    is_transient_error,
+    requests,
+    retry_after_seconds,
+)
+from utils.auth_helper import GraphAuth
+from utils.config_loader import Config
+from utils.error_handling import ErrorCategory, ErrorSeverity, handle_exceptions
+from utils.metrics import current_metrics
+from utils.resilience import get_resilience
+
+logger = logging.getLogger(__name__)
+
+GRAPH_BATCH_LIMIT = 20  # requests per JSON $batch call
+MAX_BATCH_ROUNDS = 5  # resend rounds for throttled batch parts
+
+_DATETIME_LITERAL = re.compile(r"datetime'([^']*)'")
+_FILTER_FIELD = re.compile(r"(?<![\w/])([A-Za-z_]\w*)(?=\s+(?:eq|ne|gt|ge|lt|le)\s)")
+
+
+def graph_filter(filter_query: str) -> str:
+    """Translate a SharePoint REST $filter to Graph's fields/ syntax"""
+    translated = _DATETIME_LITERAL.sub(r"'\1'", filter_query)
+    return _FILTER_FIELD.sub(r"fields/\1", translated)
+
+
+class GraphListConnector:
+    """
+    SharePoint list access through Microsoft Graph. Uses the same app
+    registration (client ID/secret, tenant) as the REST connector.
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.auth = GraphAuth(config)
+        self.base_url = getattr(
+            config, "graph_base_url", "https://graph.microsoft.com/v1.0"
+        ).rstrip("/")
+        self.session = requests.Session()
+        self.session.timeout = getattr(config, "connection_timeout", 30)
+        self.session.headers.update(
+            {"User-Agent": "DENSO-Neural-Matrix/1.0", "Accept": "application/json"}
+        )
+        self.resilience = get_resilience()
+        self._site_id: Optional[str] = None
+        self._list_ids: Dict[str, str] = {}
+
+        logger.info("GraphListConnector initialized")
+
+    # ------------------------------------------------------------------
+    # HTTP plumbing
+    # ------------------------------------------------------------------
+    def _request(
+        self, method: str, url: str, endpoint: str, retryable=True, **kwargs
+    ) -> "requests.Response":
+        """Send a Graph request through the shared circuit breaker"""
+        token = self.auth.get_access_token()
+        if not token:
+            raise ConnectionError("Failed to get Microsoft Graph access token")
+        headers = {"Authorization": f"Bearer {token}"}
+        headers.update(kwargs.pop("headers", {}))
+        if not url.startswith("http"):
+            url = f"{self.base_url}{url}"
+
+        def send():
+            with current_metrics().span(f"http:graph:{endpoint}") as span:
+                response = self.session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    timeout=self.session.timeout,
+                    **kwargs,
+                )
+                span["bytes"] = len(response.content)
+                response.raise_for_status()
+            return response
+
+        return self.resilience.call(
+            f"graph:{endpoint}",
+            send,
+            is_transient=is_transient_error,
+            retryable=retryable,
+            retry_after=retry_after_seconds,
+        )
+
+    def _site_path(self) -> str:
+        """/sites/{site-id}, resolved once from the configured site URL"""
+        if self._site_id is None:
+            site = urlparse(self.config.sharepoint_site or "")
+            if not site.netloc:
+                raise ValueError("SharePoint site URL is not configured")
+            url = f"/sites/{site.netloc}"
+            path = site.path.rstrip("/")
+            if path:
+                url += f":{quote(path)}"
+            self._site_id = self._request("GET", url, "sites").json()["id"]
+        return f"/sites/{self._site_id}"
+
+    def _list_path(self, list_name: str) -> str:
+        """/sites/{site-id}/lists/{list-id} for a list title"""
+        list_id = self._list_ids.get(list_name)
+        if list_id is None:
+            title = list_name.replace("'", "''")
+            response = self._request(
+                "GET",
+                f"{self._site_path()}/lists",
+                "lists",
+                params={"$filter": f"displayName eq '{title}'", "$select": "id"},
+            )
+            lists = response.json().get("value", [])
+            if not lists:
+                raise ValueError(f"List '{list_name}' not found")
+            list_id = self._list_ids[list_name] = lists[0]["id"]
+        return f"{self._site_path()}/lists/{list_id}"
+
+    @staticmethod
+    def _expand(select_fields: List[str] = None) -> str:
+        if not select_fields:
+            return "fields"
+        return f"fields($select={','.join(select_fields)})"
+
+    @staticmethod
+    def _flatten(item: Dict[str, Any]) -> Dict[str, Any]:
+        """Graph listItem -> the flat record shape of the REST connector"""
+        record = dict(item.get("fields") or {})
+        record.pop("@odata.etag", None)
+        item_id = int(item["id"])
+        record["Id"] = record["ID"] = item_id
+        return record
+
+    @staticmethod
+    def _fields_payload(item_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Item fields for a write; list values get a collection annotation"""
+        payload = {}
+        for key, value in item_data.items():
+            if isinstance(value, list):
+                kind = "Int32" if all(isinstance(v, int) for v in value) else "String"
+                payload[f"{key}@odata.type"] = f"Collection(Edm.{kind})"
+            payload[key] = value
+        return payload
+
+    def _collect(
+        self, url: str, endpoint: str, params=None, headers=None, limit: int = None
+    ):
+        """Follow @odata.nextLink until `limit` items; returns (items, final page)"""
+        items, page = [], {}
+        while url and not (limit and len(items) >= limit):
+            page = self._request(
+                "GET", url, endpoint, params=params, headers=headers or {}
+            ).json()
+            params = None  # nextLink already carries the query
+            items.extend(page.get("value", []))
+            url = page.get("@odata.nextLink")
+            logger.debug(f"Retrieved {len(items)} Graph items so far")
+        return items, page
+
+    # ------------------------------------------------------------------
+    # Connector interface
+    # ------------------------------------------------------------------
+    @handle_exceptions(ErrorCategory.CONNECTION, ErrorSeverity.HIGH)
+    def test_connection(self) -> bool:
+        """Resolve the site through Graph"""
+        try:
+            self._site_id = None
+            self._site_path()
+            logger.info("Successfully connected to Microsoft Graph")
+            return True
+        except Exception as e:
+            logger.error(f"Microsoft Graph connection failed: {e}")
+            return False
+
+    @handle_exceptions(ErrorCategory.DATA, ErrorSeverity.MEDIUM)
+    def read_list_items(
+        self,
+        list_name: str,
+        select_fields: List[str] = None,
+        filter_query: str = None,
+        top: int = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Read list items; `filter_query` uses the REST $filter syntax"""
+        if not list_name:
+            logger.error("List name is required")
+            return None
+
+        logger.info(f"Reading items from list '{list_name}' via Graph")
+        try:
+            params = {
+                "$expand": self._expand(select_fields),
+                "$top": min(top, 999) if top else 999,
+            }
+            headers = {}
+            if filter_query:
+                params["$filter"] = graph_filter(filter_query)
+                # Filtering on non-indexed columns is otherwise refused
+                headers["Prefer"] = "HonorNonIndexedQueriesWarningMayFailRandomly"
+            items, _ = self._collect(
+                f"{self._list_path(list_name)}/items",
+                "items",
+                params,
+                headers,
+                limit=top,
+            )
+            if top:
+                items = items[:top]
+            records = [self._flatten(item) for item in items]
+            logger.info(
+                f"Successfully retrieved {len(records)} items from list '{list_name}'"
+            )
+            return records
+        except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+            logger.error(f"Failed to read list '{list_name}' via Graph: {e}")
+            return None
+
+    @handle_exceptions(ErrorCategory.DATA, ErrorSeverity.MEDIUM)
+    def read_list_changes(
+        self,
+        list_name: str,
+        delta_link: str = None,
+        select_fields: List[str] = None,
+    ) -> Optional[Tuple[List[Dict[str, Any]], List[int], str]]:
+        """
+        Items changed since `delta_link` via /items/delta. Without a link
+        every item is returned (a full read that also yields the first
+        link). Returns (changed records, deleted item IDs, next delta link).
+        """
+        try:
+            if delta_link:
+                items, page = self._collect(delta_link, "delta")
+            else:
+                items, page = self._collect(
+                    f"{self._list_path(list_name)}/items/delta",
+                    "delta",
+                    {"$expand": self._expand(select_fields)},
+                )
+        except requests.exceptions.HTTPError as e:
+            if delta_link and getattr(e.response, "status_code", None) == 410:
+                logger.warning(f"Delta link for '{list_name}' expired; reading all")
+                return self.read_list_changes(list_name, None, select_fields)
+            raise
+
+        changed, deleted = [], []
+        for item in items:
+            if "@removed" in item or "deleted" in item:
+                deleted.append(int(item["id"]))
+            else:
+                changed.append(self._flatten(item))
+        logger.info(
+            f"Delta for '{list_name}': {len(changed)} changed, {len(deleted)} deleted"
+        )
+        return changed, deleted, page.get("@odata.deltaLink")
+
+    @handle_exceptions(ErrorCategory.DATA, ErrorSeverity.MEDIUM)
+    def add_list_item(self, list_name: str, item_data: Dict[str, Any]) -> bool:
+        """Add new item to the list"""
+        if not list_name or not item_data:
+            logger.error("List name and item data are required")
+            return False
+        try:
+            self._request(
+                "POST",
+                f"{self._list_path(list_name)}/items",
+                "items",
+                json={"fields": self._fields_payload(item_data)},
+                retryable=is_rejected_error,
+            )
+            return True
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(f"Failed to add item to list '{list_name}' via Graph: {e}")
+            return False
+
+    @handle_exceptions(ErrorCategory.DATA, ErrorSeverity.MEDIUM)
+    def add_list_items(self, list_name: str, items: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Create items with JSON $batch calls of 20 requests. Parts that were
+        throttled are resent after their Retry-After; returns one success
+        flag per item.
+        """
+        results = [False] * len(items)
+        if not items:
+            return results
+        items_url = f"{self._list_path(list_name)}/items"
+        pending = list(range(len(items)))
+
+        for _ in range(MAX_BATCH_ROUNDS):
+            throttled, wait = [], 0.0
+            for start in range(0, len(pending), GRAPH_BATCH_LIMIT):
+                chunk = pending[start : start + GRAPH_BATCH_LIMIT]
+                requests_json = [
+                    {
+                        "id": str(index),
+                        "method": "POST",
+                        "url": items_url,
+                        "headers": {"Content-Type": "application/json"},
+                        "body": {"fields": self._fields_payload(items[index])},
+                    }
+                    for index in chunk
+                ]
+                with current_metrics().span("graph:batch", rows=len(chunk)):
+                    # Only whole-batch rejections are safe to resend as is
+                    response = self._request(
+                        "POST",
+                        "/$batch",
+                        "batch",
+                        json={"requests": requests_json},
+                        retryable=is_rejected_error,
+                    )
+                for part in response.json().get("responses", []):
+                    index = int(part["id"])
+                    status = int(part.get("status", 0))
+                    if 200 <= status < 300:
+                        results[index] = True
+                    elif status in (429, 503):
+                        throttled.append(index)
+                        retry = (part.get("headers") or {}).get("Retry-After")
+                        wait = max(wait, float(retry or 1))
+                    else:
+                        error = (part.get("body") or {}).get("error", {})
+                        logger.warning(
+                            f"Graph create failed ({status}): "
+                            f"{error.get('message', 'unknown error')}"
+                        )
+            if not throttled:
+                break
+            current_metrics().incr("throttle_wait_seconds", wait)
+            logger.info(f"{len(throttled)} batch parts throttled; waiting {wait:.0f}s")
+            time.sleep(wait)
+            pending = sorted(throttled)
+
+        logger.info(
+            f"Added {sum(results)}/{len(items)} items to list '{list_name}' via Graph"
+        )
+        return results
+
+    @handle_exceptions(ErrorCategory.DATA, ErrorSeverity.MEDIUM)
+    def update_list_item(
+        self, list_name: str, item_id: int, item_data: Dict[str, Any]
+    ) -> bool:
+        """Update an existing item's fields (PATCH is idempotent)"""
+        if not list_name or not item_id or not item_data:
+            logger.error("List name, item ID, and item data are required")
+            return False
+        try:
+            self._request(
+                "PATCH",
+                f"{self._list_path(list_name)}/items/{item_id}/fields",
+                "items",
+                json=self._fields_payload(item_data),
+            )
+            return True
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(f"Failed to update item {item_id} via Graph: {e}")
+            return False
+
+    @handle_exceptions(ErrorCategory.DATA, ErrorSeverity.LOW)
+    def get_list_info(self, list_name: str) -> Optional[Dict]:
+        """List metadata in the REST connector's shape"""
+        try:
+            data = self._request("GET", self._list_path(list_name), "lists").json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(f"Failed to get info for list '{list_name}': {e}")
+            return None
+        return {
+            "Id": data.get("id"),
+            "Title": data.get("displayName"),
+            "Description": data.get("description"),
+            "ItemCount": None,  # not exposed by Graph
+            "Created": data.get("createdDateTime"),
+            "LastItemModifiedDate": data.get("lastModifiedDateTime"),
+        }
+
+    def close(self):
+        """Close the requests session"""
+        if self.session:
+            self.session.close()
+            logger.debug("Graph session closed")
@@ -1,15 +1,135 @@
 # connectors/sharepoint_connector.py - Fixed SharePoint Connector
-import requests
-from typing import List, Dict, Optional, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Iterator, Optional, Any, Tuple
+import json
 import logging
+import re
+import threading
 import time
+import uuid
+from urllib.parse import urlparse
 
 from utils.auth_helper import SharePointAuth
 from utils.error_handling import handle_exceptions, ErrorCategory, ErrorSeverity
-from utils.config_manager import Config
+from utils.config_loader import Config
+from utils.resilience import get_resilience
+from utils.metrics import activate, current_metrics
+from utils.batch_tuner import get_batch_tuner
+from utils.memory_budget import get_memory_budget
+from utils.lazy_imports import lazy_module
 
 logger = logging.getLogger(__name__)
 
+requests = lazy_module("requests")  # imported on first request
+
+# Responses that mean "try again later" rather than "request is wrong"
+TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+# Responses that guarantee the server did not apply the request
+REJECTED_STATUS_CODES = {429, 503}
+# Items a query may scan before SharePoint refuses it; also the largest $top
+LIST_VIEW_THRESHOLD = 5000
+_THRESHOLD_MARKERS = ("SPQueryThrottledException", "list view threshold")
+_TOP_PARAM = re.compile(r"((?:\$|%24)top=)\d+", re.IGNORECASE)
+REST_BATCH_LIMIT = 100  # create requests per $batch call
+MAX_BATCH_ROUNDS = 5  # resend rounds for throttled batch parts
+_PART_STATUS = re.compile(r"^HTTP/1\.\d (\d{3})", re.MULTILINE)
+_PART_RETRY_AFTER = re.compile(r"^Retry-After:\s*(\d+)", re.IGNORECASE | re.MULTILINE)
+_PART_ERROR = re.compile(r'"value"\s*:\s*"([^"]*)"')
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Throttling, server errors, timeouts and dropped connections"""
+    if isinstance(
+        error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+    ):
+        return True
+    if is_threshold_error(error):
+        return False  # repeating the same query fails the same way
+    return _status_code(error) in TRANSIENT_STATUS_CODES
+
+
+def is_threshold_error(error: Exception) -> bool:
+    """The query would scan more items than the list view threshold allows"""
+    response = getattr(error, "response", None)
+    if response is None or response.status_code < 400:
+        return False
+    try:
+        text = response.text[:4096]
+    except Exception:
+        return False
+    return any(marker in text for marker in _THRESHOLD_MARKERS)
+
+
+def is_rejected_error(error: Exception) -> bool:
+    """Safe to retry even for non-idempotent writes"""
+    return _status_code(error) in REJECTED_STATUS_CODES
+
+
+def _verbose_payload(entity_type: str, item_data: Dict[str, Any]) -> Dict[str, Any]:
+    """odata=verbose item body; list values become typed collections"""
+    payload = {"__metadata": {"type": entity_type}}
+    for key, value in item_data.items():
+        if isinstance(value, list):
+            kind = "Int32" if all(isinstance(v, int) for v in value) else "String"
+            value = {
+                "__metadata": {"type": f"Collection(Edm.{kind})"},
+                "results": value,
+            }
+        payload[key] = value
+    return payload
+
+
+def _batch_body(boundary: str, url: str, payloads: List[Dict[str, Any]]) -> str:
+    """multipart/mixed $batch body: the creates as one changeset"""
+    changeset = f"changeset_{uuid.uuid4()}"
+    parts = [
+        f"--{changeset}\r\n"
+        "Content-Type: application/http\r\n"
+        "Content-Transfer-Encoding: binary\r\n\r\n"
+        f"POST {url} HTTP/1.1\r\n"
+        "Content-Type: application/json;odata=verbose\r\n"
+        "Accept: application/json;odata=verbose\r\n\r\n"
+        f"{json.dumps(payload)}\r\n"
+        for payload in payloads
+    ]
+    return (
+        f"--{boundary}\r\n"
+        f"Content-Type: multipart/mixed; boundary={changeset}\r\n\r\n"
+        f"{''.join(parts)}--{changeset}--\r\n"
+        f"--{boundary}--\r\n"
+    )
+
+
+def _batch_responses(text: str) -> List[Tuple[int, str]]:
+    """(status, rest of the part) per embedded HTTP response, in request order"""
+    matches = list(_PART_STATUS.finditer(text))
+    return [
+        (
+            int(match.group(1)),
+            text[
+                match.end() : matches[n + 1].start() if n + 1 < len(matches) else None
+            ],
+        )
+        for n, match in enumerate(matches)
+    ]
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read the Retry-After header from a throttled response"""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("Retry-After", ""))
+    except (TypeError, ValueError):
+        return None
+
 
 class SharePointConnector:
     """
@@ -22,10 +142,13 @@ class SharePointConnector:
         self.auth = SharePointAuth(config)
         self.session = requests.Session()
         self.session.timeout = getattr(config, "connection_timeout", 30)
+        self.resilience = get_resilience()
+        self._host = urlparse(config.sharepoint_site or "").netloc or "sharepoint"
 
-        # Rate limiting
+        # Rate limiting (shared by parallel window reads)
         self.last_request_time = 0
         self.min_request_interval = 0.1  # 100ms between requests
+        self._rate_lock = threading.Lock()
 
         # Setup session headers
         self.session.headers.update(
@@ -40,14 +163,43 @@ class SharePointConnector:
 
     def _rate_limit(self):
         """Implement rate limiting to avoid throttling"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
+        # Reserve the next free slot, then sleep outside the lock
+        with self._rate_lock:
+            current_time = time.time()
+            slot = max(current_time, self.last_request_time + self.min_request_interval)
+            self.last_request_time = slot
+
+        sleep_time = slot - current_time
+        if sleep_time > 0:
+            current_metrics().incr("rate_limit_wait_seconds", sleep_time)
             time.sleep(sleep_time)
 
-        self.last_request_time = time.time()
+    def _request(
+        self, method: str, url: str, endpoint: str, retryable=True, **kwargs
+    ) -> "requests.Response":
+        """
+        Send a request through the shared circuit breaker and retry budget.
+        Raises requests exceptions (or CircuitOpenError) on failure.
+        """
+
+        def send():
+            self._rate_limit()
+            # One span per attempt: latency and payload size per page/call
+            with current_metrics().span(f"http:{endpoint}") as span:
+                response = self.session.request(
+                    method, url, timeout=self.session.timeout, **kwargs
+                )
+                span["bytes"] = len(response.content)
+                response.raise_for_status()
+            return response
+
+        return self.resilience.call(
+            f"sharepoint:{self._host}:{endpoint}",
+            send,
+            is_transient=is_transient_error,
+            retryable=retryable,
+            retry_after=retry_after_seconds,
+        )
 
     def _get_site_url(self) -> str:
         """Get properly formatted site URL"""
@@ -75,9 +227,10 @@ class SharePointConnector:
                 "Accept": "application/json;odata=verbose",
             }
 
-            self._rate_limit()
-            response = self.session.get(url, headers=headers)
-            response.raise_for_status()
+            # Probes fail fast - the health monitor has its own backoff
+            response = self._request(
+                "GET", url, "web", headers=headers, retryable=False
+            )
 
             # Verify response contains expected data
             data = response.json()
@@ -153,8 +306,21 @@ class SharePointConnector:
             if filter_query:
                 query_params.append(f"$filter={filter_query}")
 
+            # Without an explicit top the page size is tuned per list and
+            # projection (an Id-only page is far cheaper than a full one)
+            tuner = None
             if top:
                 query_params.append(f"$top={top}")
+            else:
+                projection = ",".join(sorted(select_fields or [])) or "*"
+                tuner = get_batch_tuner(
+                    self.config,
+                    f"sharepoint:{self._host}:{list_name}:page:{projection}",
+                    initial=1000,
+                    minimum=100,
+                    maximum=LIST_VIEW_THRESHOLD,
+                )
+                query_params.append(f"$top={tuner.size}")
 
             if query_params:
                 url += "?" + "&".join(query_params)
@@ -165,36 +331,13 @@ class SharePointConnector:
             }
 
             all_items = []
-            max_retries = getattr(self.config, "max_retries", 3)
 
             # Handle pagination
+            metrics = current_metrics()
             while url:
-                retry_count = 0
-                while retry_count < max_retries:
-                    try:
-                        self._rate_limit()
-                        response = self.session.get(url, headers=headers)
-                        response.raise_for_status()
-                        break
-                    except requests.exceptions.HTTPError as e:
-                        if e.response.status_code == 429:  # Too Many Requests
-                            retry_after = int(e.response.headers.get("Retry-After", 1))
-                            logger.warning(
-                                f"Rate limited, waiting {retry_after} seconds"
-                            )
-                            time.sleep(retry_after)
-                            retry_count += 1
-                        else:
-                            raise
-                    except requests.exceptions.RequestException as e:
-                        retry_count += 1
-                        if retry_count >= max_retries:
-                            raise
-                        wait_time = 2**retry_count
-                        logger.warning(
-                            f"Request failed, retrying in {wait_time} seconds"
-                        )
-                        time.sleep(wait_time)
+                retries = metrics.counters.get("retries", 0)
+                page_started = time.perf_counter()
+                response = self._request("GET", url, "items", headers=headers)
 
                 data = response.json().get("d", {})
                 items = data.get("results", [])
@@ -203,13 +346,36 @@ class SharePointConnector:
                 # Check for next page
                 url = data.get("__next")
 
+                if tuner:
+                    # Retried pages (timeouts, throttling) shrink the size
+                    if metrics.counters.get("retries", 0) > retries:
+                        tuner.backoff()
+                    else:
+                        tuner.record(len(items), time.perf_counter() - page_started)
+                    if url:
+                        url = _TOP_PARAM.sub(rf"\g<1>{tuner.size}", url)
+
                 logger.debug(f"Retrieved {len(items)} items, total: {len(all_items)}")
 
+            if tuner:
+                tuner.save()
+
             logger.info(
                 f"Successfully retrieved {len(all_items)} items from list '{list_name}'"
             )
             return all_items
 
+        except requests.exceptions.HTTPError as e:
+            if not is_threshold_error(e):
+                logger.error(f"Failed to read SharePoint list '{list_name}': {e}")
+                return None
+            logger.warning(
+                f"Query on '{list_name}' exceeds the list view threshold - "
+                "reading by ID windows instead"
+            )
+            current_metrics().incr("threshold_fallbacks")
+            items = self.read_list_items_by_id(list_name, select_fields, filter_query)
+            return items[:top] if items is not None and top else items
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to read SharePoint list '{list_name}': {e}")
             return None
@@ -217,6 +383,162 @@ class SharePointConnector:
             logger.error(f"Unexpected error reading SharePoint list '{list_name}': {e}")
             return None
 
+    @handle_exceptions(ErrorCategory.DATA, ErrorSeverity.MEDIUM)
+    def read_list_items_by_id(
+        self,
+        list_name: str,
+        select_fields: List[str] = None,
+        filter_query: str = None,
+        max_id: int = None,
+        workers: int = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Threshold-safe read of a whole list (see iter_list_items_by_id)"""
+        if not list_name:
+            logger.error("List name is required")
+            return None
+
+        if max_id is None:
+            max_id = self.get_max_item_id(list_name)
+            if max_id is None:
+                return None
+        all_items = []
+        for _, items in self.iter_list_items_by_id(
+            list_name, max_id, select_fields, filter_query, workers
+        ):
+            all_items.extend(items)
+        logger.info(
+            f"Successfully retrieved {len(all_items)} items from list '{list_name}'"
+        )
+        return all_items
+
+    def iter_list_items_by_id(
+        self,
+        list_name: str,
+        max_id: int,
+        select_fields: List[str] = None,
+        filter_query: str = None,
+        workers: int = None,
+    ) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Threshold-safe read for large lists. Splits 1..max_id into windows
+        of LIST_VIEW_THRESHOLD IDs; each window is filtered on the indexed
+        ID column first (`ID gt N and ID le M`, ordered by ID), so
+        `filter_query` only ever scans one window. Windows are fetched by
+        up to `workers` threads (sharepoint_read_workers) and yielded in ID
+        order as (highest ID of the window, items). Closing the generator
+        early cancels the windows not started yet; errors are raised.
+
+        Windows are submitted as earlier ones are consumed: at most the
+        running windows plus as many finished ones are held, and under
+        memory pressure (memory_budget_mb) fewer of both.
+        """
+        windows = [
+            (low, min(low + LIST_VIEW_THRESHOLD, max_id))
+            for low in range(0, max_id, LIST_VIEW_THRESHOLD)
+        ]
+        if workers is None:
+            workers = getattr(self.config, "sharepoint_read_workers", 4)
+        workers = max(1, min(workers, len(windows) or 1))
+        logger.info(
+            f"Reading '{list_name}' in {len(windows)} ID windows "
+            f"({workers} parallel)"
+        )
+
+        # Worker threads record into the caller's run metrics
+        metrics = current_metrics()
+
+        def read_window(bounds: Tuple[int, int]) -> List[Dict[str, Any]]:
+            with activate(metrics):
+                return self._read_id_window(
+                    list_name, bounds, select_fields, filter_query
+                )
+
+        if workers == 1:
+            for bounds in windows:
+                yield bounds[1], read_window(bounds)
+            return
+
+        budget = get_memory_budget(self.config)
+        upcoming = iter(windows)
+        pending = deque()
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="spo-window")
+        try:
+            while True:
+                running = budget.workers(workers)
+                while len(pending) < running + budget.queue_depth(running):
+                    bounds = next(upcoming, None)
+                    if bounds is None:
+                        break
+                    pending.append((bounds, pool.submit(read_window, bounds)))
+                if not pending:
+                    return
+                bounds, future = pending.popleft()
+                yield bounds[1], future.result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _read_id_window(
+        self,
+        list_name: str,
+        bounds: Tuple[int, int],
+        select_fields: List[str] = None,
+        filter_query: str = None,
+    ) -> List[Dict[str, Any]]:
+        """Items with low < ID <= high; raises on request errors"""
+        token = self.auth.get_access_token()
+        if not token:
+            raise ConnectionError("Failed to get access token for reading list items")
+
+        low, high = bounds
+        window_filter = f"ID gt {low} and ID le {high}"
+        if filter_query:
+            window_filter += f" and ({filter_query})"
+        query_params = [
+            f"$filter={window_filter}",
+            "$orderby=ID",
+            f"$top={LIST_VIEW_THRESHOLD}",
+        ]
+        if select_fields:
+            query_params.insert(0, f"$select={','.join(select_fields)}")
+
+        url = (
+            f"{self._get_site_url()}/_api/web/lists/GetByTitle('{list_name}')/items?"
+            + "&".join(query_params)
+        )
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/json;odata=verbose",
+        }
+
+        items = []
+        while url:
+            response = self._request("GET", url, "items", headers=headers)
+            data = response.json().get("d", {})
+            items.extend(data.get("results", []))
+            url = data.get("__next")
+        logger.debug(f"Window {low}-{high} of '{list_name}': {len(items)} items")
+        return items
+
+    @handle_exceptions(ErrorCategory.DATA, ErrorSeverity.LOW)
+    def get_max_item_id(self, list_name: str) -> Optional[int]:
+        """Highest item ID in a list (0 when empty)"""
+        token = self.auth.get_access_token()
+        if not token:
+            logger.error("Failed to get access token for reading list items")
+            return None
+
+        url = (
+            f"{self._get_site_url()}/_api/web/lists/GetByTitle('{list_name}')"
+            "/items?$select=ID&$orderby=ID desc&$top=1"
+        )
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/json;odata=verbose",
+        }
+        response = self._request("GET", url, "items", headers=headers)
+        results = response.json().get("d", {}).get("results", [])
+        return int(results[0]["ID"]) if results else 0
+
     @handle_exceptions(ErrorCategory.DATA, ErrorSeverity.MEDIUM)
     def add_list_item(self, list_name: str, item_data: Dict[str, Any]) -> bool:
         """Add new item to SharePoint list"""
@@ -241,8 +563,7 @@ class SharePointConnector:
                 return False
 
             # Prepare payload
-            payload = {"__metadata": {"type": entity_type}}
-            payload.update(item_data)
+            payload = _verbose_payload(entity_type, item_data)
 
             url = f"{site_url}/_api/web/lists/GetByTitle('{list_name}')/items"
 
@@ -259,9 +580,16 @@ class SharePointConnector:
                 "X-RequestDigest": request_digest,
             }
 
-            self._rate_limit()
-            response = self.session.post(url, headers=headers, json=payload)
-            response.raise_for_status()
+            # A timed-out create may have been applied, so only retry
+            # responses the server explicitly rejected
+            self._request(
+                "POST",
+                url,
+                "items",
+                headers=headers,
+                json=payload,
+                retryable=is_rejected_error,
+            )
 
             logger.info(f"Successfully added item to SharePoint list '{list_name}'")
             return True
@@ -275,6 +603,92 @@ class SharePointConnector:
             )
             return False
 
+    @handle_exceptions(ErrorCategory.DATA, ErrorSeverity.MEDIUM)
+    def add_list_items(self, list_name: str, items: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Create items with $batch calls of up to REST_BATCH_LIMIT requests,
+        sharing one request digest and entity type lookup. Parts that were
+        throttled are resent after their Retry-After; returns one success
+        flag per item.
+        """
+        results = [False] * len(items)
+        if not list_name or not items:
+            return results
+
+        try:
+            token = self.auth.get_access_token()
+            if not token:
+                logger.error("Failed to get access token for adding list items")
+                return results
+
+            site_url = self._get_site_url()
+            entity_type = self._get_list_entity_type(list_name)
+            if not entity_type:
+                logger.error(f"Could not determine entity type for list '{list_name}'")
+                return results
+            request_digest = self._get_request_digest(site_url, token)
+            if not request_digest:
+                logger.error("Failed to get request digest")
+                return results
+
+            items_url = f"{site_url}/_api/web/lists/GetByTitle('{list_name}')/items"
+            pending = list(range(len(items)))
+            for _ in range(MAX_BATCH_ROUNDS):
+                throttled, wait = [], 0.0
+                for start in range(0, len(pending), REST_BATCH_LIMIT):
+                    chunk = pending[start : start + REST_BATCH_LIMIT]
+                    boundary = f"batch_{uuid.uuid4()}"
+                    body = _batch_body(
+                        boundary,
+                        items_url,
+                        [_verbose_payload(entity_type, items[i]) for i in chunk],
+                    )
+                    headers = {
+                        "Authorization": f"Bearer {token}",
+                        "Accept": "application/json;odata=verbose",
+                        "Content-Type": f"multipart/mixed; boundary={boundary}",
+                        "X-RequestDigest": request_digest,
+                    }
+                    with current_metrics().span("sharepoint:batch", rows=len(chunk)):
+                        # Only whole-batch rejections are safe to resend as is
+                        response = self._request(
+                            "POST",
+                            f"{site_url}/_api/$batch",
+                            "batch",
+                            headers=headers,
+                            data=body.encode("utf-8"),
+                            retryable=is_rejected_error,
+                        )
+                    for index, (status, part) in zip(
+                        chunk, _batch_responses(response.text)
+                    ):
+                        if 200 <= status < 300:
+                            results[index] = True
+                        elif status in REJECTED_STATUS_CODES:
+                            throttled.append(index)
+                            retry = _PART_RETRY_AFTER.search(part)
+                            wait = max(wait, float(retry.group(1) if retry else 1))
+                        else:
+                            error = _PART_ERROR.search(part)
+                            logger.warning(
+                                f"SharePoint create failed ({status}): "
+                                f"{error.group(1) if error else 'unknown error'}"
+                            )
+                if not throttled:
+                    break
+                current_metrics().incr("throttle_wait_seconds", wait)
+                logger.info(
+                    f"{len(throttled)} batch parts throttled; waiting {wait:.0f}s"
+                )
+                time.sleep(wait)
+                pending = sorted(throttled)
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to add items to SharePoint list '{list_name}': {e}")
+
+        logger.info(f"Added {sum(results)}/{len(items)} items to list '{list_name}'")
+        return results
+
     @handle_exceptions(ErrorCategory.DATA, ErrorSeverity.MEDIUM)
     def update_list_item(
         self, list_name: str, item_id: int, item_data: Dict[str, Any]
@@ -301,8 +715,7 @@ class SharePointConnector:
                 return False
 
             # Prepare payload
-            payload = {"__metadata": {"type": entity_type}}
-            payload.update(item_data)
+            payload = _verbose_payload(entity_type, item_data)
 
             url = (
                 f"{site_url}/_api/web/lists/GetByTitle('{list_name}')/items({item_id})"
@@ -323,9 +736,8 @@ class SharePointConnector:
                 "X-RequestDigest": request_digest,
             }
 
-            self._rate_limit()
-            response = self.session.post(url, headers=headers, json=payload)
-            response.raise_for_status()
+            # MERGE with If-Match: * is idempotent
+            self._request("POST", url, "items", headers=headers, json=payload)
 
             logger.info(
                 f"Successfully updated item ID {item_id} in SharePoint list '{list_name}'"
@@ -353,9 +765,7 @@ class SharePointConnector:
                 "Accept": "application/json;odata=verbose",
             }
 
-            self._rate_limit()
-            response = self.session.post(url, headers=headers)
-            response.raise_for_status()
+            response = self._request("POST", url, "contextinfo", headers=headers)
 
             data = response.json().get("d", {}).get("GetContextWebInformation", {})
             request_digest = data.get("FormDigestValue")
@@ -387,9 +797,7 @@ class SharePointConnector:
                 "Accept": "application/json;odata=verbose",
             }
 
-            self._rate_limit()
-            response = self.session.get(url, headers=headers)
-            response.raise_for_status()
+            response = self._request("GET", url, "lists", headers=headers)
 
             data = response.json().get("d", {}).get("ListItemEntityTypeFullName")
             if data:
@@ -421,18 +829,18 @@ class SharePointConnector:
                 "Accept": "application/json;odata=verbose",
             }
 
-            self._rate_limit()
-            response = self.session.get(url, headers=headers)
-            response.raise_for_status()
+            response = self._request("GET", url, "lists", headers=headers)
 
             data = response.json().get("d", {})
 
             list_info = {
+                "Id": data.get("Id"),
                 "Title": data.get("Title"),
                 "Description": data.get("Description"),
                 "ItemCount": data.get("ItemCount"),
                 "Created": data.get("Created"),
                 "LastItemModifiedDate": data.get("LastItemModifiedDate"),
+                "LastItemDeletedDate": data.get("LastItemDeletedDate"),
                 "ListItemEntityTypeFullName": data.get("ListItemEntityTypeFullName"),
             }
 
@@ -443,8 +851,172 @@ class SharePointConnector:
             logger.error(f"Failed to get info for list '{list_name}': {e}")
             return None
 
+    def _read_headers(self) -> Optional[Dict[str, str]]:
+        token = self.auth.get_access_token()
+        if not token:
+            logger.error("Failed to get SharePoint access token")
+            return None
+        return {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/json;odata=verbose",
+        }
+
+    def _collect(self, url: str, endpoint: str, headers: Dict[str, str]) -> List[Dict]:
+        """All results of a collection query, following __next"""
+        results = []
+        while url:
+            data = self._request("GET", url, endpoint, headers=headers).json()
+            data = data.get("d", {})
+            results.extend(data.get("results", []))
+            url = data.get("__next")
+        return results
+
+    @handle_exceptions(ErrorCategory.DATA, ErrorSeverity.LOW)
+    def get_list_fields(self, list_name: str) -> Optional[List[Dict]]:
+        """Field schema of a list (internal name, type, lookup target, ...)"""
+        headers = self._read_headers()
+        if not headers:
+            return None
+        url = f"{self._get_site_url()}/_api/web/lists/GetByTitle('{list_name}')/fields"
+        fields = self._collect(url, "fields", headers)
+        return [
+            {
+                "InternalName": field.get("InternalName"),
+                "Title": field.get("Title"),
+                "TypeAsString": field.get("TypeAsString"),
+                "LookupList": field.get("LookupList"),
+                "LookupField": field.get("LookupField"),
+                "AllowMultipleValues": bool(field.get("AllowMultipleValues")),
+                "ReadOnlyField": bool(field.get("ReadOnlyField")),
+            }
+            for field in fields
+        ]
+
+    @handle_exceptions(ErrorCategory.DATA, ErrorSeverity.LOW)
+    def read_lookup_values(self, list_id: str, field_name: str) -> Optional[Dict]:
+        """{item ID: value of `field_name`} for the list with GUID `list_id`"""
+        headers = self._read_headers()
+        if not headers:
+            return None
+        list_id = list_id.strip("{}")
+        url = (
+            f"{self._get_site_url()}/_api/web/lists(guid'{list_id}')/items"
+            f"?$select=ID,{field_name}&$top={LIST_VIEW_THRESHOLD}"
+        )
+        items = self._collect(url, "items", headers)
+        return {int(item["ID"]): item.get(field_name) for item in items}
+
+    @handle_exceptions(ErrorCategory.DATA, ErrorSeverity.LOW)
+    def get_site_users(self) -> Optional[List[Dict]]:
+        """Users and groups known to the site (what person fields point at)"""
+        headers = self._read_headers()
+        if not headers:
+            return None
+        url = (
+            f"{self._get_site_url()}/_api/web/siteusers"
+            "?$select=Id,Title,Email,LoginName"
+        )
+        users = self._collect(url, "siteusers", headers)
+        return [
+            {key: user.get(key) for key in ("Id", "Title", "Email", "LoginName")}
+            for user in users
+        ]
+
+    def _subscriptions_url(self, list_name: str, subscription_id: str = None) -> str:
+        url = f"{self._get_site_url()}/_api/web/lists/GetByTitle('{list_name}')"
+        url += "/subscriptions"
+        if subscription_id:
+            url += f"('{subscription_id}')"
+        return url
+
+    def _subscription_headers(self) -> Optional[Dict[str, str]]:
+        token = self.auth.get_access_token()
+        if not token:
+            logger.error("Failed to get access token for webhook subscriptions")
+            return None
+        # The subscriptions endpoint takes plain JSON, not odata=verbose
+        return {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+
+    @handle_exceptions(ErrorCategory.CONNECTION, ErrorSeverity.MEDIUM)
+    def list_subscriptions(self, list_name: str) -> Optional[List[Dict]]:
+        """Webhook subscriptions registered on a list"""
+        headers = self._subscription_headers()
+        if not headers:
+            return None
+        response = self._request(
+            "GET", self._subscriptions_url(list_name), "subscriptions", headers=headers
+        )
+        return response.json().get("value", [])
+
+    @handle_exceptions(ErrorCategory.CONNECTION, ErrorSeverity.MEDIUM)
+    def create_subscription(
+        self,
+        list_name: str,
+        notification_url: str,
+        expiration: str,
+        client_state: str = "",
+    ) -> Optional[Dict]:
+        """
+        Register a webhook. SharePoint validates `notification_url` before
+        answering, so the receiver must already be running.
+        """
+        headers = self._subscription_headers()
+        if not headers:
+            return None
+        list_id = (self.get_list_info(list_name) or {}).get("Id")
+        if not list_id:
+            logger.error(f"Could not determine the ID of list '{list_name}'")
+            return None
+        payload = {
+            "resource": f"{self._get_site_url()}/_api/web/lists('{list_id}')",
+            "notificationUrl": notification_url,
+            "expirationDateTime": expiration,
+            "clientState": client_state,
+        }
+        response = self._request(
+            "POST",
+            self._subscriptions_url(list_name),
+            "subscriptions",
+            headers=headers,
+            json=payload,
+            retryable=is_rejected_error,
+        )
+        logger.info(f"Webhook subscription created for list '{list_name}'")
+        return response.json()
+
+    @handle_exceptions(ErrorCategory.CONNECTION, ErrorSeverity.MEDIUM)
+    def renew_subscription(
+        self, list_name: str, subscription_id: str, expiration: str
+    ) -> bool:
+        """Move a subscription's expiration date (at most 180 days ahead)"""
+        headers = self._subscription_headers()
+        if not headers:
+            return False
+        self._request(
+            "PATCH",
+            self._subscriptions_url(list_name, subscription_id),
+            "subscriptions",
+            headers=headers,
+            json={"expirationDateTime": expiration},
+        )
+        logger.info(f"Webhook subscription renewed for list '{list_name}'")
+        return True
+
     def close(self):
         """Close the requests session"""
         if self.session:
             self.session.close()
             logger.info("SharePoint requests session closed")
+
+
+def create_sharepoint_connector(config: Config):
+    """The list connector for `config`: REST, or Graph with use_graph_api"""
+    if getattr(config, "use_graph_api", False):
+        from connectors.graph_connector import GraphListConnector
+
+        return GraphListConnector(config)
+    return SharePointConnector(config)
@@ -1,11 +1,37 @@
 # controller/app_controller.py - Fixed App Controller without debug prints
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer, pyqtSlot
+from datetime import datetime
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 from typing import Any
 import logging
 
+from controller.scheduler import JobScheduler, build_schedules
+from controller.sync_core import (
+    SyncEvents,
+    SyncJob,
+    build_job_config,
+    validate_sync_config,
+)
+from controller.webhooks import WebhookService, is_webhook_job, run_webhook_job
+from utils.profiling import profile_run
+
 logger = logging.getLogger(__name__)
 
 
+class ScheduledSyncEvents(SyncEvents):
+    """Forwards a scheduled job's events to the controller signals"""
+
+    def __init__(self, controller, job_name: str):
+        self.controller = controller
+        self.job_name = job_name
+
+    def on_log(self, message: str, level: str):
+        self.controller.log_message.emit(f"[{self.job_name}] {message}", level)
+
+    def on_completed(self, success: bool, message: str, stats: dict):
+        self.controller.last_sync_status_update.emit("success" if success else "failed")
+        self.controller.sync_completed.emit(success, message, stats)
+
+
 class AppController(QObject):
     """
     Enhanced App Controller for DENSO Neural Matrix.
@@ -16,6 +42,7 @@ class AppController(QObject):
     # Core signals
     status_changed = pyqtSignal(str, str)  # service_name, status
     progress_updated = pyqtSignal(str, int, str)  # task_name, percentage, message
+    progress_stats = pyqtSignal(dict)  # rows/sec, ETA for the running sync
     sync_completed = pyqtSignal(bool, str, dict)  # success, message, stats
     log_message = pyqtSignal(str, str)  # message, level
 
@@ -31,6 +58,7 @@ class AppController(QObject):
     auto_sync_status_update = pyqtSignal(bool)
     progress_update = pyqtSignal(int)
     current_task_update = pyqtSignal(str)
+    connection_health_update = pyqtSignal(str, dict)  # service_name, health
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -68,15 +96,24 @@ class AppController(QObject):
                 from .connection_manager import ConnectionManager
 
                 self.connection_manager = ConnectionManager()
+                self.connection_manager.configure_pool(self.config)
                 logger.info("Connection manager created")
             except Exception as e:
                 logger.error(f"Connection manager creation failed: {e}")
                 self.connection_manager = None
 
+            self.connection_tester = None
+            if self.connection_manager:
+                from .connection_tester import ConnectionTester
+
+                self.connection_tester = ConnectionTester(self.connection_manager, self)
+
             try:
                 from .sync_engine import SyncEngine
 
-                self.sync_engine = SyncEngine(self.config)
+                self.sync_engine = SyncEngine(
+                    self.config, connection_manager=self.connection_manager
+                )
                 logger.info("Sync engine created")
             except Exception as e:
                 logger.error(f"Sync engine creation failed: {e}")
@@ -85,7 +122,9 @@ class AppController(QObject):
             try:
                 from utils.excel_import_handler import ExcelImportHandler
 
-                self.excel_import_handler = ExcelImportHandler(self.config)
+                self.excel_import_handler = ExcelImportHandler(
+                    self.config, connection_manager=self.connection_manager
+                )
                 logger.info("Excel import handler created")
             except Exception as e:
                 logger.error(f"Excel import handler creation failed: {e}")
@@ -107,9 +146,13 @@ class AppController(QObject):
             # Initialize data
             self._initialize_data()
 
-            # Setup auto sync timer
-            self.auto_sync_timer = QTimer(self)
-            self.auto_sync_timer.timeout.connect(self._on_auto_sync_timeout)
+            # Scheduled jobs run on a bounded pool off the GUI thread
+            self.scheduler = JobScheduler(
+                self._run_scheduled_job,
+                max_workers=getattr(self.config, "scheduler_max_workers", 2),
+                state_file=getattr(self.config, "scheduler_state_file", None),
+            )
+            self.webhook_service = None
             self.toggle_auto_sync(getattr(self.config, "auto_sync_enabled", False))
 
             logger.info("AppController initialized successfully.")
@@ -118,6 +161,33 @@ class AppController(QObject):
             logger.error(f"AppController initialization error: {e}", exc_info=True)
             # Don't raise - continue with partial initialization
 
+    def start_background_services(self):
+        """Start work deferred until after the first paint"""
+        # Background health probing replaces per-access connection tests
+        if self.connection_manager and getattr(
+            self.config, "health_monitor_enabled", True
+        ):
+            self.connection_manager.start_health_monitor(self.config)
+
+        # Webhook-triggered syncs run on the scheduler pool, with or without
+        # auto-sync; polling schedules remain the fallback
+        if getattr(self.config, "webhook_enabled", False):
+            try:
+                self.webhook_service = WebhookService(
+                    self.config, self._trigger_webhook_job
+                )
+                self.webhook_service.start()
+                self.scheduler.start()
+                self.log_message.emit(
+                    f"Webhook receiver listening for "
+                    f"{', '.join(self.webhook_service.lists)}",
+                    "info",
+                )
+            except OSError as e:
+                self.webhook_service = None
+                logger.error(f"Webhook receiver could not start: {e}")
+                self.log_message.emit(f"Webhook receiver not started: {e}", "error")
+
     def _connect_signals(self):
         """Connect signals between components"""
         try:
@@ -131,6 +201,17 @@ class AppController(QObject):
                 self.connection_manager.log_message.connect(
                     lambda msg, level: self.log_message.emit(f"[CONN] {msg}", level)
                 )
+                self.connection_manager.health_monitor.health_updated.connect(
+                    self.connection_health_update.emit
+                )
+
+            if self.connection_tester:
+                self.connection_tester.test_finished.connect(
+                    self._handle_connection_test_result
+                )
+                self.connection_tester.all_tests_finished.connect(
+                    self._handle_connection_tests_finished
+                )
 
             # SyncEngine signals
             if self.sync_engine:
@@ -138,6 +219,8 @@ class AppController(QObject):
                     self.sync_engine.progress_updated.connect(
                         self.progress_updated.emit
                     )
+                if hasattr(self.sync_engine, "progress_stats"):
+                    self.sync_engine.progress_stats.connect(self.progress_stats.emit)
                 if hasattr(self.sync_engine, "sync_completed"):
                     self.sync_engine.sync_completed.connect(self._handle_sync_completed)
                 if hasattr(self.sync_engine, "log_message"):
@@ -180,9 +263,9 @@ class AppController(QObject):
     def _handle_service_status_change(self, service_name: str, status: str):
         """Handle status updates from ConnectionManager"""
         logger.info(f"Service status changed: {service_name} - {status}")
-        if service_name == "SharePoint":
+        if service_name.lower() == "sharepoint":
             self.sharepoint_status_update.emit(status)
-        elif service_name == "Database":
+        elif service_name.lower() == "database":
             self.database_status_update.emit(status)
 
     @pyqtSlot(bool, str, dict)
@@ -205,60 +288,63 @@ class AppController(QObject):
 
     @pyqtSlot()
     def test_all_connections(self):
-        """Test connections to SharePoint and Database"""
+        """Test SharePoint and Database concurrently without blocking the UI"""
+        if not self.connection_tester:
+            self.log_message.emit("Connection manager is not available", "error")
+            return
+
+        if not self.connection_tester.start(self.config):
+            self.log_message.emit("Connection test already in progress", "warning")
+            return
+
         logger.info("Testing all connections...")
         self.ui_enable_request.emit(False)
         self.current_task_update.emit("Testing connections...")
 
-        sp_status = "disconnected"
-        db_status = "disconnected"
-
-        try:
-            if self.connection_manager:
-                sp_connector = self.connection_manager.get_sharepoint_connector(
-                    self.config
-                )
-                sp_connected = sp_connector.test_connection() if sp_connector else False
-                sp_status = "connected" if sp_connected else "error"
-                self.sharepoint_status_update.emit(sp_status)
-                self.log_message.emit(
-                    f"SharePoint connection: {'Connected' if sp_connected else 'Failed'}",
-                    "info" if sp_connected else "error",
-                )
-        except Exception as e:
-            sp_status = "error"
-            self.sharepoint_status_update.emit(sp_status)
-            self.log_message.emit(f"SharePoint connection error: {e}", "critical")
-
-        try:
-            if self.connection_manager:
-                db_connector = self.connection_manager.get_database_connector(
-                    self.config
-                )
-                db_connected = db_connector.test_connection() if db_connector else False
-                db_status = "connected" if db_connected else "error"
-                self.database_status_update.emit(db_status)
-                self.log_message.emit(
-                    f"Database connection: {'Connected' if db_connected else 'Failed'}",
-                    "info" if db_connected else "error",
-                )
-        except Exception as e:
-            db_status = "error"
-            self.database_status_update.emit(db_status)
-            self.log_message.emit(f"Database connection error: {e}", "critical")
+    @pyqtSlot(str, bool, str)
+    def _handle_connection_test_result(self, service: str, success: bool, error: str):
+        """Log one probe result; status cards update via status_changed"""
+        label = "SharePoint" if service == "sharepoint" else "Database"
+        if error:
+            # The probe raised before a status could be recorded
+            if service == "sharepoint":
+                self.sharepoint_status_update.emit("error")
+            else:
+                self.database_status_update.emit("error")
+            self.log_message.emit(f"{label} connection error: {error}", "critical")
+        else:
+            self.log_message.emit(
+                f"{label} connection: {'Connected' if success else 'Failed'}",
+                "info" if success else "error",
+            )
 
+    @pyqtSlot(dict)
+    def _handle_connection_tests_finished(self, results: dict):
         self.ui_enable_request.emit(True)
         self.current_task_update.emit("Idle")
         logger.info(
-            f"Connection test completed. SharePoint: {sp_status}, Database: {db_status}"
+            f"Connection test completed in {results.get('elapsed')}s. "
+            f"SharePoint: {results.get('sharepoint')}, "
+            f"Database: {results.get('database')}"
         )
 
+    def get_connection_health(self) -> dict:
+        """Return cached connection health for the dashboard"""
+        if not self.connection_manager:
+            return {}
+        return self.connection_manager.get_connection_health()
+
     @pyqtSlot(str)
     def run_full_sync(self, direction: str = "spo_to_sql"):
         """Initiate a full data synchronization"""
         if not self.sync_engine:
             self.log_message.emit("Sync engine not available", "error")
             return
+        if self.scheduler.is_active(direction):
+            self.log_message.emit(
+                f"A scheduled {direction} sync is already running", "warning"
+            )
+            return
 
         logger.info(f"Initiating full sync in direction: {direction}")
         self.ui_enable_request.emit(False)
@@ -347,27 +433,79 @@ class AppController(QObject):
             self.config.auto_sync_enabled = enabled
         self.auto_sync_status_update.emit(enabled)
 
-        if enabled and hasattr(self.config, "sync_interval"):
-            interval_ms = self.config.sync_interval * 1000
-            self.auto_sync_timer.start(interval_ms)
-            logger.info(
-                f"Auto-sync enabled with interval: {self.config.sync_interval} seconds"
-            )
+        if not enabled:
+            self.scheduler.configure({})
+            if getattr(self, "webhook_service", None) is None:
+                # Running jobs finish on their own threads; don't block the GUI
+                self.scheduler.stop(timeout=0)
+            logger.info("Auto-sync disabled")
+            self.log_message.emit("Auto-sync disabled.", "info")
+            return
+
+        self.scheduler.configure(build_schedules(self.config))
+        self.scheduler.start()
+
+        for job in self.scheduler.status():
+            next_run = datetime.fromtimestamp(job["next_run"]).strftime("%H:%M:%S")
             self.log_message.emit(
-                f"Auto-sync enabled. Next sync in {self.config.sync_interval} seconds.",
+                f"Auto-sync '{job['name']}' ({job['schedule']}) next run at {next_run}",
                 "info",
             )
-        else:
-            self.auto_sync_timer.stop()
-            logger.info("Auto-sync disabled")
-            self.log_message.emit("Auto-sync disabled.", "info")
+        logger.info(f"Auto-sync enabled: {len(self.scheduler.status())} jobs")
+
+    def _trigger_webhook_job(self, job_name: str):
+        """Webhook debouncer thread: queue an incremental sync of one list"""
+        # Above timed jobs: a webhook means the data changed just now
+        self.scheduler.run_on_demand(job_name, priority=10)
+
+    def _run_scheduled_job(self, job_name: str) -> bool:
+        """Scheduler worker thread: run one named job without the SyncEngine UI"""
+        if is_webhook_job(job_name):
+            worker = getattr(self.sync_engine, "sync_worker", None)
+            if worker and worker.isRunning():
+                self.log_message.emit(
+                    f"[{job_name}] Skipped: a manual sync is running", "warning"
+                )
+                return False
+            return run_webhook_job(
+                self.config,
+                job_name,
+                events=ScheduledSyncEvents(self, job_name),
+                connection_manager=self.connection_manager,
+            )
 
-    @pyqtSlot()
-    def _on_auto_sync_timeout(self):
-        """Triggered by the auto-sync timer"""
-        logger.info("Auto-sync triggered")
-        direction = getattr(self.config, "auto_sync_direction", "spo_to_sql")
-        self.run_full_sync(direction)
+        try:
+            job_config, direction = build_job_config(self.config, job_name)
+        except KeyError as e:
+            self.log_message.emit(str(e).strip("'\""), "error")
+            return False
+
+        worker = getattr(self.sync_engine, "sync_worker", None)
+        if worker and worker.isRunning() and worker.direction == direction:
+            self.log_message.emit(
+                f"[{job_name}] Skipped: a manual {direction} sync is running",
+                "warning",
+            )
+            return False
+
+        errors = validate_sync_config(job_config, direction)
+        if errors:
+            for error_msg in errors:
+                self.log_message.emit(
+                    f"[{job_name}] Config error: {error_msg}", "error"
+                )
+            return False
+
+        job = SyncJob(
+            job_config,
+            direction,
+            events=ScheduledSyncEvents(self, job_name),
+            connection_manager=self.connection_manager,
+        )
+        with profile_run(job_config, job_name) as profiler:
+            success, _, stats = job.run()
+            profiler.run_id = stats.get("run_id")
+        return success
 
     @pyqtSlot()
     def update_ui_with_config(self):
@@ -387,14 +525,17 @@ class AppController(QObject):
         logger.info("Initiating AppController cleanup...")
 
         try:
-            # Stop auto-sync timer
-            if hasattr(self, "auto_sync_timer") and self.auto_sync_timer.isActive():
-                self.auto_sync_timer.stop()
-                self.auto_sync_timer.deleteLater()
+            # Stop the scheduler (gives a running job a moment to finish)
+            if hasattr(self, "scheduler"):
+                self.scheduler.stop(timeout=5)
+            if getattr(self, "webhook_service", None):
+                self.webhook_service.stop()
 
             # Cleanup components
             if hasattr(self, "sync_engine") and self.sync_engine:
                 self.sync_engine.cleanup()
+            if hasattr(self, "connection_tester") and self.connection_tester:
+                self.connection_tester.cleanup()
             if hasattr(self, "connection_manager") and self.connection_manager:
                 self.connection_manager.cleanup()
             if hasattr(self, "excel_import_handler") and self.excel_import_handler:
@@ -2,11 +2,17 @@
 from PyQt6.QtCore import QObject, pyqtSignal
 from typing import Optional, Dict
 import logging
-import hashlib
+import threading
 import time
 
-from connectors.sharepoint_connector import SharePointConnector
+from connectors.sharepoint_connector import (
+    SharePointConnector,
+    create_sharepoint_connector,
+)
 from connectors.database_connector import DatabaseConnector
+from connectors.connection_pool import ConnectorPool, connector_cache_key
+from controller.health_monitor import HealthMonitor
+from utils.resilience import get_resilience
 from utils.error_handling import handle_exceptions, ErrorCategory, ErrorSeverity
 from utils.config_manager import Config
 
@@ -22,19 +28,7 @@ class ConnectionCache:
 
     def _generate_key(self, config: Config, connector_type: str) -> str:
         """Generate cache key based on configuration"""
-        if connector_type == "sharepoint":
-            config_str = f"{config.sharepoint_site}_{config.sharepoint_client_id}_{config.tenant_id}"
-        elif connector_type == "database":
-            if config.database_type == "sqlserver":
-                config_str = (
-                    f"{config.sql_server}_{config.sql_database}_{config.sql_username}"
-                )
-            else:
-                config_str = f"{config.sqlite_file}"
-        else:
-            config_str = str(config)
-
-        return hashlib.md5(config_str.encode()).hexdigest()
+        return connector_cache_key(config, connector_type)
 
     def get(self, config: Config, connector_type: str):
         """Get cached connector if valid"""
@@ -74,6 +68,8 @@ class ConnectionManager(QObject):
     """
     Manages connections to external services (SharePoint, Database).
     Enhanced with caching, health monitoring, and robust error handling.
+    Also owns the connector pool that leases long-lived connectors to
+    sync and import workers.
     """
 
     status_changed = pyqtSignal(str, str)  # service_name, status
@@ -84,6 +80,13 @@ class ConnectionManager(QObject):
 
         # Connection cache with 5-minute TTL
         self.cache = ConnectionCache(ttl_seconds=300)
+        self._lock = threading.RLock()
+
+        # Long-lived connectors leased to worker threads
+        self.pool = ConnectorPool()
+
+        # Background prober that owns the cached health state
+        self.health_monitor = HealthMonitor(self)
 
         # Connection status tracking
         self.connection_status = {
@@ -98,154 +101,143 @@ class ConnectionManager(QObject):
 
     @handle_exceptions(ErrorCategory.CONNECTION, ErrorSeverity.HIGH)
     def get_sharepoint_connector(self, config: Config) -> Optional[SharePointConnector]:
-        """Get SharePoint connector instance with caching"""
-        try:
-            # Try to get from cache first
-            connector = self.cache.get(config, "sharepoint")
-            if connector:
-                # Test if cached connector still works
-                if self._test_sharepoint_connector(connector):
-                    return connector
-                else:
-                    logger.warning(
-                        "Cached SharePoint connector failed test, creating new one"
-                    )
-
-            # Create new connector
-            logger.info("Creating new SharePoint connector")
-            connector = SharePointConnector(config)
-
-            # Test connection before caching
-            if self._test_sharepoint_connector(connector):
-                self.cache.set(config, "sharepoint", connector)
-                self._update_connection_status("sharepoint", "connected")
-                self.log_message.emit("✅ SharePoint connection established", "success")
-                return connector
-            else:
-                self._update_connection_status("sharepoint", "error")
-                self.log_message.emit("❌ SharePoint connection failed", "error")
-                return None
-
-        except Exception as e:
-            self._update_connection_status("sharepoint", "error")
-            self.log_message.emit(f"❌ SharePoint connector error: {e}", "critical")
-            logger.error(f"Error creating SharePoint connector: {e}", exc_info=True)
-            return None
+        """Get SharePoint connector instance with caching (no synchronous probe)"""
+        return self._get_cached_connector(
+            config, "sharepoint", create_sharepoint_connector
+        )
 
     @handle_exceptions(ErrorCategory.CONNECTION, ErrorSeverity.HIGH)
     def get_database_connector(self, config: Config) -> Optional[DatabaseConnector]:
-        """Get database connector instance with caching"""
+        """Get database connector instance with caching (no synchronous probe)"""
+        return self._get_cached_connector(config, "database", DatabaseConnector)
+
+    def _get_cached_connector(self, config: Config, service: str, factory):
+        """
+        Return a cached connector, creating one if needed.
+        Health is tracked by the background HealthMonitor, so neither cache
+        hits nor new connectors pay for a test round trip here.
+        """
+        label = "SharePoint" if service == "sharepoint" else "Database"
+
+        if not self.health_monitor.is_available(service):
+            health = self.health_monitor.get_health(service)
+            self.log_message.emit(
+                f"⚠️ {label} circuit open - skipping connection "
+                f"({health.get('last_error') or 'recent failures'})",
+                "warning",
+            )
+            return None
+
         try:
-            # Try to get from cache first
-            connector = self.cache.get(config, "database")
+            with self._lock:
+                connector = self.cache.get(config, service)
             if connector:
-                # Test if cached connector still works
-                if self._test_database_connector(connector):
-                    return connector
-                else:
-                    logger.warning(
-                        "Cached database connector failed test, creating new one"
-                    )
-
-            # Create new connector
-            logger.info(f"Creating new {config.database_type} database connector")
-            connector = DatabaseConnector(config)
-
-            # Test connection before caching
-            if self._test_database_connector(connector):
-                self.cache.set(config, "database", connector)
-                self._update_connection_status("database", "connected")
-                self.log_message.emit("✅ Database connection established", "success")
                 return connector
-            else:
-                self._update_connection_status("database", "error")
-                self.log_message.emit("❌ Database connection failed", "error")
-                return None
+
+            logger.info(f"Creating new {label} connector")
+            connector = factory(config)
+
+            with self._lock:
+                self.cache.set(config, service, connector)
+
+            # Verify in the background and keep probing from now on
+            self.health_monitor.config = config
+            self.health_monitor.watch(service)
+            return connector
 
         except Exception as e:
-            self._update_connection_status("database", "error")
-            self.log_message.emit(f"❌ Database connector error: {e}", "critical")
-            logger.error(f"Error creating database connector: {e}", exc_info=True)
+            self._update_connection_status(service, "error")
+            self.log_message.emit(f"❌ {label} connector error: {e}", "critical")
+            logger.error(f"Error creating {label} connector: {e}", exc_info=True)
             return None
 
-    def _test_sharepoint_connector(self, connector: SharePointConnector) -> bool:
-        """Test SharePoint connector functionality"""
-        try:
-            return connector.test_connection()
-        except Exception as e:
-            logger.debug(f"SharePoint connector test failed: {e}")
-            return False
+    def configure_pool(self, config: Config):
+        """Apply pool sizing and retry/breaker settings from configuration"""
+        self.pool.max_per_key = max(1, getattr(config, "connection_pool_size", 2))
+        self.pool.idle_ttl = getattr(config, "connection_idle_ttl", 900)
+        self.pool.acquire_timeout = getattr(config, "connection_timeout", 30)
+        get_resilience().configure(config)
+
+    def start_health_monitor(self, config: Config):
+        """Start background health probing for configured services"""
+        self.health_monitor.start(config)
+        if self._is_sharepoint_configured(config):
+            self.health_monitor.watch("sharepoint")
+        if self._is_database_configured(config):
+            self.health_monitor.watch("database")
+
+    @staticmethod
+    def _is_sharepoint_configured(config: Config) -> bool:
+        return all(
+            getattr(config, field, None)
+            for field in (
+                "sharepoint_site",
+                "sharepoint_client_id",
+                "sharepoint_client_secret",
+                "tenant_id",
+            )
+        )
 
-    def _test_database_connector(self, connector: DatabaseConnector) -> bool:
-        """Test database connector functionality"""
-        try:
-            return connector.test_connection()
-        except Exception as e:
-            logger.debug(f"Database connector test failed: {e}")
-            return False
+    @staticmethod
+    def _is_database_configured(config: Config) -> bool:
+        if getattr(config, "database_type", "") == "sqlite":
+            return bool(getattr(config, "sqlite_file", None))
+        return bool(config.sql_server and config.sql_database)
+
+    def acquire_connector(self, config: Config, connector_type: str):
+        """Lease a pooled connector ("sharepoint" or "database") to a worker"""
+        return self.pool.acquire(config, connector_type)
+
+    def release_connector(self, connector, discard: bool = False):
+        """Return a leased connector so the next run can reuse it"""
+        self.pool.release(connector, discard=discard)
+
+    def lease(self, config: Config, connector_type: str):
+        """Context manager around acquire_connector/release_connector"""
+        return self.pool.lease(config, connector_type)
 
     def _update_connection_status(self, service_name: str, status: str):
         """Update connection status and emit signal"""
-        old_status = self.connection_status.get(service_name, "unknown")
-        if old_status != status:
-            self.connection_status[service_name] = status
+        with self._lock:
+            old_status = self.connection_status.get(service_name, "unknown")
+            changed = old_status != status
+            if changed:
+                self.connection_status[service_name] = status
+                self.last_test_time[service_name] = time.time()
+
+        if changed:
             self.status_changed.emit(service_name.title(), status)
-            self.last_test_time[service_name] = time.time()
             logger.info(
                 f"{service_name.title()} status changed: {old_status} → {status}"
             )
 
     @handle_exceptions(ErrorCategory.CONNECTION, ErrorSeverity.MEDIUM)
     def test_sharepoint_connection(self, config: Config) -> bool:
-        """Test SharePoint connection without caching"""
-        try:
-            logger.info("Testing SharePoint connection")
-            self._update_connection_status("sharepoint", "connecting")
-
-            connector = SharePointConnector(config)
-            result = connector.test_connection()
-
-            if result:
-                self._update_connection_status("sharepoint", "connected")
-                logger.info("SharePoint connection test successful")
-            else:
-                self._update_connection_status("sharepoint", "error")
-                logger.warning("SharePoint connection test failed")
-
-            # Clean up test connector
-            connector.close()
-            return result
-
-        except Exception as e:
-            self._update_connection_status("sharepoint", "error")
-            logger.error(f"SharePoint connection test error: {e}")
-            return False
+        """Probe SharePoint once through the pool and refresh cached health"""
+        logger.info("Testing SharePoint connection")
+        self._update_connection_status("sharepoint", "connecting")
+        self.health_monitor.config = config
+        result = self.health_monitor.probe_service("sharepoint")
+
+        if result:
+            logger.info("SharePoint connection test successful")
+        else:
+            logger.warning("SharePoint connection test failed")
+        return result
 
     @handle_exceptions(ErrorCategory.CONNECTION, ErrorSeverity.MEDIUM)
     def test_database_connection(self, config: Config) -> bool:
-        """Test database connection without caching"""
-        try:
-            logger.info(f"Testing {config.database_type} database connection")
-            self._update_connection_status("database", "connecting")
-
-            connector = DatabaseConnector(config)
-            result = connector.test_connection()
-
-            if result:
-                self._update_connection_status("database", "connected")
-                logger.info("Database connection test successful")
-            else:
-                self._update_connection_status("database", "error")
-                logger.warning("Database connection test failed")
-
-            # Clean up test connector
-            connector.close()
-            return result
-
-        except Exception as e:
-            self._update_connection_status("database", "error")
-            logger.error(f"Database connection test error: {e}")
-            return False
+        """Probe the database once through the pool and refresh cached health"""
+        logger.info(f"Testing {config.database_type} database connection")
+        self._update_connection_status("database", "connecting")
+        self.health_monitor.config = config
+        result = self.health_monitor.probe_service("database")
+
+        if result:
+            logger.info("Database connection test successful")
+        else:
+            logger.warning("Database connection test failed")
+        return result
 
     @handle_exceptions(ErrorCategory.CONNECTION, ErrorSeverity.MEDIUM)
     def test_all_connections(self, config: Config) -> Dict[str, bool]:
@@ -287,29 +279,30 @@ class ConnectionManager(QObject):
 
     def get_connection_status(self) -> Dict[str, str]:
         """Get current connection status for all services"""
-        return self.connection_status.copy()
+        with self._lock:
+            return self.connection_status.copy()
 
     def get_connection_health(self) -> Dict[str, dict]:
-        """Get detailed connection health information"""
-        health = {}
-
-        for service, status in self.connection_status.items():
-            last_test = self.last_test_time.get(service)
-            health[service] = {
-                "status": status,
-                "last_test": last_test,
-                "last_test_age": time.time() - last_test if last_test else None,
-                "is_stale": (
-                    (time.time() - last_test > 300) if last_test else True
-                ),  # 5 minutes
-            }
+        """Get detailed connection health information (cached, no probing)"""
+        health = self.health_monitor.get_health()
+
+        for service, info in health.items():
+            last_check = info.get("last_check")
+            info["last_test"] = last_check
+            info["last_test_age"] = time.time() - last_check if last_check else None
+            info["is_stale"] = (
+                (time.time() - last_check > 300) if last_check else True
+            )  # 5 minutes
 
         return health
 
     def refresh_connections(self):
         """Force refresh of all cached connections"""
         logger.info("Refreshing all connections")
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
+        self.pool.clear()
+        get_resilience().reset()
 
         # Reset status
         for service in self.connection_status:
@@ -322,8 +315,12 @@ class ConnectionManager(QObject):
         logger.info("ConnectionManager cleanup initiated")
 
         try:
+            self.health_monitor.stop()
+
             # Clear cache (this will also close cached connectors)
-            self.cache.clear()
+            with self._lock:
+                self.cache.clear()
+            self.pool.close()
 
             # Reset status
             for service in self.connection_status:
@@ -0,0 +1,87 @@
+# controller/connection_tester.py - Concurrent connection tests off the GUI thread
+from PyQt6.QtCore import QObject, pyqtSignal
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+import logging
+import threading
+import time
+
+from utils.config_manager import Config
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionTester(QObject):
+    """
+    Runs the SharePoint and database probes concurrently on a small worker
+    pool, so a connection test takes max(SP, DB) instead of the sum and the
+    GUI thread never blocks. Status changes reach the UI through the
+    ConnectionManager status signals; these signals report the outcome.
+    """
+
+    test_finished = pyqtSignal(str, bool, str)  # service, success, error
+    all_tests_finished = pyqtSignal(dict)  # service -> success, elapsed
+
+    SERVICES = ("sharepoint", "database")
+
+    def __init__(self, connection_manager, parent=None):
+        super().__init__(parent)
+        self.connection_manager = connection_manager
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.SERVICES), thread_name_prefix="ConnTest"
+        )
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Optional[bool]] = {}
+        self._started_at = 0.0
+
+    def is_running(self) -> bool:
+        with self._lock:
+            return bool(self._pending)
+
+    def start(self, config: Config) -> bool:
+        """Start probing all services; returns False if a test is in progress"""
+        with self._lock:
+            if self._pending:
+                return False
+            self._pending = {service: None for service in self.SERVICES}
+            self._started_at = time.monotonic()
+
+        for service in self.SERVICES:
+            future = self._executor.submit(self._probe, service, config)
+            future.add_done_callback(
+                lambda f, name=service: self._on_probe_done(name, f)
+            )
+        return True
+
+    def _probe(self, service: str, config: Config) -> bool:
+        if service == "sharepoint":
+            result = self.connection_manager.test_sharepoint_connection(config)
+        else:
+            result = self.connection_manager.test_database_connection(config)
+        return bool(result)
+
+    def _on_probe_done(self, service: str, future):
+        error = ""
+        try:
+            success = future.result()
+        except Exception as e:
+            success = False
+            error = str(e)
+            logger.error(f"{service} connection test raised: {e}")
+
+        self.test_finished.emit(service, success, error)
+
+        with self._lock:
+            self._pending[service] = success
+            if any(result is None for result in self._pending.values()):
+                return
+            results = dict(self._pending)
+            results["elapsed"] = round(time.monotonic() - self._started_at, 2)
+            self._pending = {}
+
+        self.all_tests_finished.emit(results)
+
+    def cleanup(self):
+        """Stop the worker pool without waiting for in-flight probes"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("ConnectionTester shut down")
@@ -0,0 +1,214 @@
+# controller/health_monitor.py - Background connection health prober
+from PyQt6.QtCore import QObject, pyqtSignal
+from typing import Dict, Optional
+import logging
+import random
+import threading
+import time
+
+from utils.config_manager import Config
+from utils.resilience import CircuitBreaker, CircuitState
+
+logger = logging.getLogger(__name__)
+
+SERVICES = ("sharepoint", "database")
+
+
+class HealthMonitor(QObject):
+    """
+    Probes pooled connectors on a background thread and keeps a cached
+    health state per service, so callers never block on a test round trip.
+    Failed probes back off exponentially (with jitter) up to a ceiling.
+    """
+
+    health_updated = pyqtSignal(str, dict)  # service_name, health snapshot
+
+    def __init__(self, connection_manager, parent=None):
+        super().__init__(parent)
+        self.connection_manager = connection_manager
+        self.config: Optional[Config] = None
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._watched = set()
+        self._next_due: Dict[str, float] = {}
+        self._breakers = {
+            service: CircuitBreaker(f"health:{service}", failure_threshold=3)
+            for service in SERVICES
+        }
+        self._health: Dict[str, dict] = {
+            service: self._empty_health(service) for service in SERVICES
+        }
+
+        logger.info("HealthMonitor initialized")
+
+    @staticmethod
+    def _empty_health(service: str) -> dict:
+        return {
+            "service": service,
+            "status": "disconnected",
+            "healthy": False,
+            "last_check": None,
+            "latency_ms": None,
+            "consecutive_failures": 0,
+            "circuit": CircuitState.CLOSED.value,
+            "last_error": None,
+        }
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self, config: Config):
+        """Start the prober thread (idempotent)"""
+        self.config = config
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="HealthMonitor", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"HealthMonitor started (interval: {self._interval()}s)")
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the prober thread"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout)
+        self._thread = None
+        logger.info("HealthMonitor stopped")
+
+    def watch(self, service: str, probe_now: bool = True):
+        """Start tracking a service; optionally probe it immediately"""
+        with self._lock:
+            self._watched.add(service)
+            if probe_now or service not in self._next_due:
+                self._next_due[service] = time.monotonic()
+        self._wake.set()
+
+    def request_probe(self, service: str = None):
+        """Schedule an immediate background probe"""
+        with self._lock:
+            for name in [service] if service else list(self._watched):
+                self._next_due[name] = time.monotonic()
+        self._wake.set()
+
+    # ------------------------------------------------------------------
+    # Cached state
+    # ------------------------------------------------------------------
+    def get_health(self, service: str = None) -> dict:
+        """Return cached health for one service or all services"""
+        with self._lock:
+            if service:
+                return dict(self._health.get(service, self._empty_health(service)))
+            return {name: dict(health) for name, health in self._health.items()}
+
+    def is_available(self, service: str) -> bool:
+        """False while the service circuit is open"""
+        return self._breakers[service].state != CircuitState.OPEN
+
+    # ------------------------------------------------------------------
+    # Probing
+    # ------------------------------------------------------------------
+    def probe_service(self, service: str) -> bool:
+        """Run one probe synchronously and update the cached state"""
+        if self.config is None:
+            return False
+
+        self.watch(service, probe_now=False)
+        started = time.monotonic()
+        error = None
+        healthy = False
+        connector = None
+        pool = self.connection_manager.pool
+
+        try:
+            # Never wait for a busy pool - a leased connector is in active use
+            connector = pool.acquire(self.config, service, timeout=0)
+            healthy = bool(connector.test_connection())
+        except TimeoutError:
+            logger.debug(f"Skipping {service} probe - all connectors are leased")
+            self._schedule_next(service, healthy=True)
+            return self.get_health(service)["healthy"]
+        except Exception as e:
+            error = str(e)
+            logger.debug(f"{service} health probe failed: {e}")
+        finally:
+            if connector is not None:
+                pool.release(connector, discard=not healthy)
+
+        latency_ms = (time.monotonic() - started) * 1000
+        self._record_result(service, healthy, latency_ms, error)
+        return healthy
+
+    def _record_result(self, service, healthy, latency_ms, error):
+        breaker = self._breakers[service]
+        if healthy:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+
+        breaker_state = breaker.snapshot()
+        with self._lock:
+            health = self._health[service]
+            health.update(
+                {
+                    "status": "connected" if healthy else "error",
+                    "healthy": healthy,
+                    "last_check": time.time(),
+                    "latency_ms": round(latency_ms, 1),
+                    "consecutive_failures": breaker_state["consecutive_failures"],
+                    "circuit": breaker_state["state"],
+                    "last_error": error,
+                }
+            )
+            snapshot = dict(health)
+
+        self._schedule_next(service, healthy)
+        self.connection_manager._update_connection_status(service, snapshot["status"])
+        self.health_updated.emit(service, snapshot)
+
+    def _interval(self) -> float:
+        return max(5, getattr(self.config, "health_check_interval", 60))
+
+    def _schedule_next(self, service: str, healthy: bool):
+        """Compute the next probe time with exponential backoff and jitter"""
+        interval = self._interval()
+        if not healthy:
+            failures = self._breakers[service].snapshot()["consecutive_failures"]
+            ceiling = getattr(self.config, "health_check_max_backoff", 600)
+            interval = min(ceiling, interval * (2 ** min(failures, 10)))
+
+        jitter = getattr(self.config, "health_check_jitter", 0.2)
+        delay = interval * random.uniform(1 - jitter, 1 + jitter)
+        with self._lock:
+            self._next_due[service] = time.monotonic() + delay
+
+    def _run(self):
+        """Prober loop: sleep until the earliest due probe, then run it"""
+        while not self._stop.is_set():
+            with self._lock:
+                now = time.monotonic()
+                due = [s for s in self._watched if self._next_due.get(s, now) <= now]
+                pending = [self._next_due[s] for s in self._watched if s not in due]
+
+            for service in due:
+                if self._stop.is_set():
+                    return
+                try:
+                    self.probe_service(service)
+                except Exception as e:
+                    logger.error(f"Unexpected error probing {service}: {e}")
+                    self._schedule_next(service, healthy=False)
+
+            if due:
+                continue
+
+            timeout = max(0.0, min(pending) - time.monotonic()) if pending else None
+            self._wake.wait(timeout)
+            self._wake.clear()
@@ -0,0 +1,200 @@
+# controller/lookup_resolver.py - Lookup and person fields as display values
+"""
+SharePoint returns lookup and person columns as `<Field>Id` integers
+(`{"results": [...]}` when multi-valued). Instead of `$expand` on every
+page, the resolver loads each referenced lookup list and the site users
+once into {ID: value} maps, cached with a TTL in memory and on disk
+(lookup_cache_file), and maps whole columns at a time:
+
+- SharePoint -> SQL: a mapping key naming a lookup field ("Customer") is
+  filled from "CustomerId" with the display values;
+- SQL -> SharePoint: a mapping target naming a lookup field has its
+  display values translated back and is sent as "CustomerId".
+
+Mapping the raw "CustomerId" column keeps working as before.
+"""
+import logging
+from typing import Any, Dict, Iterable, List
+
+from controller.value_converter import get_field_schema
+from utils.config_loader import Config
+from utils.lazy_imports import lazy_module
+from utils.ttl_cache import get_ttl_cache
+
+logger = logging.getLogger(__name__)
+
+pd = lazy_module("pandas")
+
+LOOKUP_TYPES = {"Lookup", "LookupMulti"}
+PERSON_TYPES = {"User", "UserMulti"}
+MULTI_SEPARATOR = "; "
+
+
+def _ids(value) -> list:
+    """IDs of a lookup value: 3, [3, 4] or {"results": [3, 4]}"""
+    if isinstance(value, dict):
+        value = value.get("results", [])
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    if value is None or value != value:  # None or NaN
+        return []
+    return [value]
+
+
+def _normalise(value) -> str:
+    return str(value).strip().lower()
+
+
+class LookupResolver:
+    """Translates lookup/person columns of one list in both directions"""
+
+    def __init__(self, config: Config, connector):
+        self.config = config
+        self.connector = connector
+        self.enabled = getattr(config, "resolve_lookup_fields", True) and all(
+            hasattr(connector, name)
+            for name in ("get_list_fields", "read_lookup_values", "get_site_users")
+        )
+        self.cache = get_ttl_cache(
+            getattr(config, "lookup_cache_file", None),
+            getattr(config, "lookup_cache_ttl", 3600),
+        )
+        self.person_value = getattr(config, "person_field_value", "Title")
+        self._fields: Dict[str, dict] = {}
+        self._maps: Dict[str, Dict[Any, Any]] = {}
+
+    def _key(self, *parts: str) -> str:
+        return "|".join((self.config.sharepoint_site or "",) + parts)
+
+    def lookup_fields(self, list_name: str, names: Iterable[str]) -> Dict[str, dict]:
+        """The lookup and person fields among `names`, by internal name"""
+        if not self.enabled:
+            return {}
+        schema = get_field_schema(self.config, self.connector, list_name)
+        wanted = set(names)
+        return {
+            field["InternalName"]: field
+            for field in schema
+            if field["InternalName"] in wanted
+            and field.get("TypeAsString") in LOOKUP_TYPES | PERSON_TYPES
+        }
+
+    def source_columns(self, list_name: str, names: Iterable[str]) -> List[str]:
+        """Columns to read for `names` - lookup fields arrive as <name>Id"""
+        names = list(names)
+        self._fields = self.lookup_fields(list_name, names)
+        return [f"{name}Id" if name in self._fields else name for name in names]
+
+    # ------------------------------------------------------------------
+    # ID <-> value maps
+    # ------------------------------------------------------------------
+    def _users(self) -> List[dict]:
+        return self.cache.get_or_load(self._key("users"), self.connector.get_site_users)
+
+    def _lookup_pairs(self, field: dict) -> list:
+        list_id = (field.get("LookupList") or "").strip("{}")
+        lookup_field = field.get("LookupField") or "Title"
+        if not list_id:
+            return []
+
+        def load():
+            values = self.connector.read_lookup_values(list_id, lookup_field)
+            # JSON has no integer keys - keep the map as [id, value] pairs
+            return None if values is None else [[k, v] for k, v in values.items()]
+
+        return self.cache.get_or_load(self._key("lookup", list_id, lookup_field), load)
+
+    def id_map(self, field: dict) -> Dict[int, Any]:
+        """{ID: display value} for a lookup or person field"""
+        key = f"id:{field['InternalName']}"
+        if key not in self._maps:
+            if field["TypeAsString"] in PERSON_TYPES:
+                self._maps[key] = {
+                    user["Id"]: user.get(self.person_value) or user.get("Title")
+                    for user in self._users() or []
+                }
+            else:
+                self._maps[key] = dict(self._lookup_pairs(field) or [])
+        return self._maps[key]
+
+    def value_map(self, field: dict) -> Dict[str, int]:
+        """{normalised display value: ID}; the first ID wins for duplicates"""
+        key = f"value:{field['InternalName']}"
+        if key not in self._maps:
+            reverse: Dict[str, int] = {}
+            if field["TypeAsString"] in PERSON_TYPES:
+                # Person values may be given as name, e-mail or login
+                for user in self._users() or []:
+                    for attr in ("Title", "Email", "LoginName"):
+                        if user.get(attr):
+                            reverse.setdefault(_normalise(user[attr]), user["Id"])
+            else:
+                for item_id, value in self._lookup_pairs(field) or []:
+                    if value is not None:
+                        reverse.setdefault(_normalise(value), item_id)
+            self._maps[key] = reverse
+        return self._maps[key]
+
+    # ------------------------------------------------------------------
+    # Column translation
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _is_multi(field: dict) -> bool:
+        return bool(field.get("AllowMultipleValues")) or field["TypeAsString"].endswith(
+            "Multi"
+        )
+
+    def resolve_frame(self, df: "pd.DataFrame") -> "pd.DataFrame":
+        """Add display-value columns for the fields from source_columns()"""
+        for name, field in self._fields.items():
+            source = f"{name}Id"
+            if source not in df.columns:
+                continue
+            ids = self.id_map(field)
+            column = df[source]
+            if self._is_multi(field):
+                df[name] = column.map(
+                    lambda value: MULTI_SEPARATOR.join(
+                        str(ids.get(item_id, item_id)) for item_id in _ids(value)
+                    )
+                    or None
+                )
+            else:
+                df[name] = column.map(ids)
+                unresolved = int((column.notna() & df[name].isna()).sum())
+                if unresolved:
+                    logger.warning(f"{unresolved} '{name}' IDs could not be resolved")
+        return df
+
+    def encode_frame(self, df: "pd.DataFrame", list_name: str) -> "pd.DataFrame":
+        """Replace lookup/person value columns with <name>Id ID columns"""
+        for name, field in self.lookup_fields(list_name, df.columns).items():
+            column = df[name]
+            if pd.api.types.is_numeric_dtype(column):
+                ids = column  # the SQL side already stores IDs
+            else:
+                reverse = self.value_map(field)
+                if self._is_multi(field):
+                    ids = column.map(
+                        lambda value: (
+                            [
+                                reverse[_normalise(part)]
+                                for part in str(value).split(";")
+                                if _normalise(part) in reverse
+                            ]
+                            if isinstance(value, str)
+                            else None
+                        )
+                    )
+                else:
+                    ids = column.astype(str).str.strip().str.lower().map(reverse)
+                    ids = ids.where(column.notna())
+                    unresolved = int((column.notna() & ids.isna()).sum())
+                    if unresolved:
+                        logger.warning(
+                            f"{unresolved} '{name}' values have no matching ID"
+                        )
+                    ids = ids.astype("Int64").astype(object).where(ids.notna(), None)
+            df = df.drop(columns=[name])
+            df[f"{name}Id"] = ids
+        return df
@@ -0,0 +1,197 @@
+# controller/read_planner.py - How a SharePoint -> SQL run reads its list
+"""
+Before reading, the planner asks the list for ItemCount and
+LastItemModifiedDate (one request) and decides:
+
+- unchanged: the list has not been modified since the incremental
+  watermark, or since the last successful full run into the same table
+  with the same mapping - the run can stop right there;
+- id_windows: lists over the view threshold are read by parallel ID
+  windows (SharePointConnector.iter_list_items_by_id) up to the max ID;
+- item_count: sizes the column buffers and drives read progress.
+"""
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from connectors.sharepoint_connector import LIST_VIEW_THRESHOLD
+from utils.config_loader import Config
+from utils.lazy_imports import lazy_module
+from utils.memory_budget import object_row_bytes
+
+logger = logging.getLogger(__name__)
+
+pd = lazy_module("pandas")
+
+
+@dataclass
+class ReadPlan:
+    target_key: str
+    item_count: Optional[int] = None
+    last_modified: Optional[str] = None
+    last_deleted: Optional[str] = None
+    max_id: Optional[int] = None
+    id_windows: bool = False
+    unchanged: bool = False
+
+    def list_state(self) -> Dict[str, Optional[str]]:
+        return {
+            "item_count": self.item_count,
+            "last_modified": self.last_modified,
+            "last_deleted": self.last_deleted,
+        }
+
+
+def _parse_time(value: str) -> Optional[datetime]:
+    try:
+        moment = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+class ReadPlanner:
+    """Plans list reads and remembers the list state of successful runs"""
+
+    _lock = threading.Lock()  # one state file shared by all jobs
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.path = Path(
+            getattr(config, "read_plan_state_file", "data/read_plan_state.json")
+        )
+
+    def target_key(self) -> str:
+        """Site, list, table and mapping - a run only counts for the same four"""
+        mapping = json.dumps(
+            self.config.sharepoint_to_sql_mapping or {}, sort_keys=True
+        )
+        return "|".join(
+            (
+                self.config.sharepoint_site or "",
+                self.config.sharepoint_list or "",
+                self.config.database_type,
+                self.config.sql_table_name or "",
+                hashlib.sha1(mapping.encode("utf-8")).hexdigest()[:12],
+            )
+        )
+
+    def plan(self, connector, modified_since: str = None) -> ReadPlan:
+        list_name = self.config.sharepoint_list
+        plan = ReadPlan(target_key=self.target_key())
+        info = connector.get_list_info(list_name) or {}
+        plan.item_count = info.get("ItemCount")
+        plan.last_modified = info.get("LastItemModifiedDate")
+        plan.last_deleted = info.get("LastItemDeletedDate")
+
+        if modified_since:
+            last = _parse_time(plan.last_modified) if plan.last_modified else None
+            since = _parse_time(modified_since)
+            plan.unchanged = bool(last and since and last < since)
+        elif plan.last_modified and getattr(self.config, "skip_unchanged_lists", True):
+            plan.unchanged = self._load().get(plan.target_key) == plan.list_state()
+        if plan.unchanged:
+            return plan
+
+        if (plan.item_count or 0) > LIST_VIEW_THRESHOLD and hasattr(
+            connector, "iter_list_items_by_id"
+        ):
+            plan.max_id = connector.get_max_item_id(list_name)
+            plan.id_windows = plan.max_id is not None
+
+        logger.info(
+            f"Read plan for '{list_name}': {plan.item_count} items, "
+            + (f"ID windows up to {plan.max_id}" if plan.id_windows else "paged")
+        )
+        return plan
+
+    def record(self, plan: ReadPlan):
+        """Remember the list state a successful full run has written"""
+        if not plan.last_modified:
+            return
+        with self._lock:
+            state = self._load()
+            state[plan.target_key] = plan.list_state()
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(".tmp")
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(state, f, indent=2)
+                tmp.replace(self.path)
+            except OSError as e:
+                logger.warning(f"Could not save read plan state: {e}")
+
+    def _load(self) -> dict:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable read plan state: {e}")
+            return {}
+
+
+class ColumnBuffers:
+    """
+    Preallocated per-column lists for the mapped SharePoint fields. Pages
+    are copied in as they arrive, so only the wanted columns are kept and
+    no list of item dicts is built for the whole list.
+    """
+
+    def __init__(self, columns: Iterable[str], capacity: int = 0):
+        self.capacity = max(capacity or 0, 0)
+        self.rows = 0
+        self._data: Dict[str, list] = {
+            column: [None] * self.capacity for column in dict.fromkeys(columns)
+        }
+        self._seen = set()
+        self._row_bytes = 0.0  # measured on the first page
+
+    @property
+    def approx_bytes(self) -> int:
+        """Estimated memory held by the buffered values"""
+        return int(self.rows * self._row_bytes + self.capacity * 8 * len(self._data))
+
+    def extend(self, items: List[dict]):
+        count = len(items)
+        if not count:
+            return
+        if not self._row_bytes:
+            self._row_bytes = object_row_bytes(items, self._data)
+        end = self.rows + count
+        if end > self.capacity:
+            grow = max(end - self.capacity, self.capacity // 2)
+            for values in self._data.values():
+                values.extend([None] * grow)
+            self.capacity += grow
+
+        for column, values in self._data.items():
+            values[self.rows : end] = [item.get(column) for item in items]
+            if column not in self._seen and any(column in item for item in items):
+                self._seen.add(column)
+        self.rows = end
+
+    def to_frame(self, all_columns: bool = False) -> "pd.DataFrame":
+        """
+        DataFrame of the columns present in at least one item (of every
+        column with all_columns, so spilled parts share one layout)
+        """
+        return pd.DataFrame(
+            {
+                column: values if len(values) == self.rows else values[: self.rows]
+                for column, values in self._data.items()
+                if all_columns or column in self._seen
+            }
+        )
+
+    def clear(self):
+        """Drop the buffered rows (after they were spilled)"""
+        for column in self._data:
+            self._data[column] = []
+        self.rows = self.capacity = 0
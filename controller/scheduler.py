@@ -0,0 +1,559 @@
+# controller/scheduler.py - Qt-free multi-job scheduler for auto-sync and headless runs
+"""
+Runs named sync jobs on cron or interval schedules:
+
+    "sync_schedules": {
+        "nightly": {"schedule": "0 2 * * *", "priority": 1, "catch_up": "once"},
+        "spo_to_sql": {"schedule": "every 10m", "jitter": 30}
+    }
+
+A job never overlaps itself. Due runs are queued by priority (higher first)
+onto a bounded pool of worker threads, so a long reload only ever occupies
+one worker. Missed ticks (sleep, downtime, busy pool) follow the job's
+catch-up policy: "skip" drops them, "once" coalesces them into one run and
+"all" replays them (up to max_catch_up).
+"""
+import heapq
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CATCH_UP_POLICIES = ("skip", "once", "all")
+
+CRON_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+}
+MONTH_NAMES = {
+    name: i + 1
+    for i, name in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun"]
+        + ["jul", "aug", "sep", "oct", "nov", "dec"]
+    )
+}
+DAY_NAMES = {
+    name: i for i, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])
+}
+DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+class IntervalSchedule:
+    """Every N seconds, anchored so that ticks do not drift with run time"""
+
+    def __init__(self, seconds: float, anchor: float = 0.0):
+        if seconds <= 0:
+            raise ValueError("Interval must be positive")
+        self.seconds = float(seconds)
+        self.anchor = anchor
+
+    def next_after(self, timestamp: float) -> float:
+        steps = math.floor((timestamp - self.anchor) / self.seconds) + 1
+        tick = self.anchor + steps * self.seconds
+        # Float rounding can land on `timestamp` itself
+        return tick if tick > timestamp else tick + self.seconds
+
+    def __str__(self):
+        return f"every {self.seconds:g}s"
+
+
+class CronSchedule:
+    """Five-field cron expression (minute hour day-of-month month day-of-week)"""
+
+    FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))  # day-of-week 7 = Sun
+
+    def __init__(self, expression: str):
+        self.expression = expression.strip()
+        text = CRON_ALIASES.get(self.expression.lower(), self.expression)
+        parts = text.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: '{expression}'")
+
+        names = (None, None, None, MONTH_NAMES, DAY_NAMES)
+        (
+            self.minutes,
+            self.hours,
+            self.days,
+            self.months,
+            self.weekdays,
+        ) = (
+            self._parse_field(part, low, high, names[i])
+            for i, (part, (low, high)) in enumerate(zip(parts, self.FIELDS))
+        )
+        # Vixie cron: when both day fields are restricted, either may match
+        self._days_restricted = parts[2] != "*"
+        self._weekdays_restricted = parts[4] != "*"
+
+    @staticmethod
+    def _parse_field(text: str, low: int, high: int, names=None) -> set:
+        def value(token: str) -> int:
+            token = token.lower()
+            if names and token[:3] in names:
+                return names[token[:3]]
+            return int(token)
+
+        values = set()
+        for part in text.split(","):
+            step = 1
+            if "/" in part:
+                part, step_text = part.split("/", 1)
+                step = int(step_text)
+            if part == "*":
+                start, end = low, high
+            elif "-" in part:
+                start, end = (value(v) for v in part.split("-", 1))
+                if names is DAY_NAMES and end == 0 < start:
+                    end = 7  # "sat-sun": Sunday closes the range
+            else:
+                start = value(part)
+                end = high if step > 1 else start
+            if not (low <= start <= high and low <= end <= high) or step < 1:
+                raise ValueError(f"Cron field out of range: '{text}'")
+            values.update(range(start, end + 1, step))
+        if names is DAY_NAMES:
+            values = {v % 7 for v in values}
+        return values
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._days_restricted and self._weekdays_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, timestamp: float) -> float:
+        moment = datetime.fromtimestamp(timestamp).replace(second=0, microsecond=0)
+        moment += timedelta(minutes=1)
+        limit = moment.year + 5
+
+        while moment.year <= limit:
+            if moment.month not in self.months:
+                year, month = divmod(moment.month, 12)
+                moment = moment.replace(
+                    year=moment.year + year, month=month + 1, day=1, hour=0, minute=0
+                )
+            elif not self._day_matches(moment):
+                moment = (moment + timedelta(days=1)).replace(hour=0, minute=0)
+            elif moment.hour not in self.hours:
+                moment = (moment + timedelta(hours=1)).replace(minute=0)
+            elif moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment.timestamp()
+        raise ValueError(f"Cron expression never fires: '{self.expression}'")
+
+    def __str__(self):
+        return self.expression
+
+
+def parse_duration(text: str) -> float:
+    """'90', '90s', '15m', '2h', '1d' or '1h30m' -> seconds"""
+    text = str(text).strip().lower()
+    if re.fullmatch(r"\d+(\.\d+)?", text):
+        return float(text)
+    parts = re.findall(r"(\d+(?:\.\d+)?)\s*([smhd])", text)
+    if not parts or "".join(n + u for n, u in parts) != text.replace(" ", ""):
+        raise ValueError(f"Invalid duration: '{text}'")
+    return sum(float(number) * DURATION_UNITS[unit] for number, unit in parts)
+
+
+def parse_schedule(spec, anchor: float = 0.0):
+    """Seconds, 'every 10m' / '@every 10m', or a cron expression"""
+    if isinstance(spec, (int, float)):
+        return IntervalSchedule(spec, anchor)
+    text = str(spec).strip()
+    match = re.match(r"^@?every\s+(.+)$", text, re.IGNORECASE)
+    if match:
+        return IntervalSchedule(parse_duration(match.group(1)), anchor)
+    return CronSchedule(text)
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    schedule: object
+    priority: int = 0
+    jitter: float = 0.0  # seconds added at random to each tick
+    catch_up: str = "skip"
+    next_fire: float = 0.0  # nominal tick
+    next_run: float = 0.0  # tick plus jitter
+    last_fire: Optional[float] = None
+    running: bool = False
+    queued: int = 0
+    skipped: int = 0
+    last_started: Optional[float] = None
+    last_duration: Optional[float] = None
+    last_success: Optional[bool] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "schedule": str(self.schedule or "on demand"),
+            "priority": self.priority,
+            "next_run": self.next_run,
+            "running": self.running,
+            "queued": self.queued,
+            "skipped": self.skipped,
+            "last_started": self.last_started,
+            "last_duration": self.last_duration,
+            "last_success": self.last_success,
+        }
+
+
+def build_schedules(config) -> Dict[str, dict]:
+    """
+    Schedules from `sync_schedules`, or the legacy single auto-sync
+    (auto_sync_direction every sync_interval seconds) when none are set.
+    """
+    schedules = dict(getattr(config, "sync_schedules", None) or {})
+    if not schedules and getattr(config, "auto_sync_enabled", False):
+        direction = getattr(config, "auto_sync_direction", "spo_to_sql")
+        schedules[direction] = {"schedule": getattr(config, "sync_interval", 600)}
+    return {
+        name: spec
+        for name, spec in schedules.items()
+        if spec.get("enabled", True) and spec.get("schedule") is not None
+    }
+
+
+class JobScheduler:
+    """
+    Dispatches due jobs onto a bounded worker pool. `runner(job_name)` is
+    called on a worker thread and should return True on success.
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[str], bool],
+        max_workers: int = 2,
+        state_file: str = None,
+        misfire_grace: float = 60.0,
+        max_catch_up: int = 10,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.runner = runner
+        self.max_workers = max(1, max_workers)
+        self.state_file = Path(state_file) if state_file else None
+        self.misfire_grace = misfire_grace
+        self.max_catch_up = max_catch_up
+        self.clock = clock
+
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self._queue: List[tuple] = []
+        self._active = set()  # names of running jobs (survives configure())
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._running = False
+        self._generation = 0  # bumped by start(); older loops exit on a mismatch
+        self._threads: List[threading.Thread] = []
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+    def add_job(
+        self,
+        name: str,
+        schedule,
+        priority: int = 0,
+        jitter: float = 0.0,
+        catch_up: str = "skip",
+    ) -> ScheduledJob:
+        if catch_up not in CATCH_UP_POLICIES:
+            raise ValueError(f"Unknown catch_up policy: {catch_up}")
+        if schedule is not None and not hasattr(schedule, "next_after"):
+            schedule = parse_schedule(schedule, anchor=self.clock())
+        job = ScheduledJob(name, schedule, int(priority), float(jitter), catch_up)
+        with self._cond:
+            job.running = name in self._active
+            self.jobs[name] = job
+            if self._running:
+                self._schedule_first(job, self._load_state().get(name))
+                self._cond.notify_all()
+        return job
+
+    def configure(self, schedules: Dict[str, dict]):
+        """
+        Replace the timed jobs from a {name: {"schedule": ..., ...}} mapping.
+        On-demand jobs (schedule None, started with run_now) are kept.
+        """
+        with self._cond:
+            self.jobs = {
+                name: job for name, job in self.jobs.items() if job.schedule is None
+            }
+            self._queue = [entry for entry in self._queue if entry[3] in self.jobs]
+            heapq.heapify(self._queue)
+        for name, spec in schedules.items():
+            try:
+                self.add_job(
+                    name,
+                    spec["schedule"],
+                    priority=spec.get("priority", 0),
+                    jitter=parse_duration(spec.get("jitter", 0)),
+                    catch_up=spec.get("catch_up", "skip"),
+                )
+            except (KeyError, ValueError) as e:
+                logger.error(f"Invalid schedule for job '{name}': {e}")
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self):
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._generation += 1
+            generation = self._generation
+            state = self._load_state()
+            for job in self.jobs.values():
+                self._schedule_first(job, state.get(job.name))
+            # Threads of an earlier start() that have not exited yet see the
+            # new generation and stop instead of running alongside these
+            self._cond.notify_all()
+
+        self._threads = [
+            threading.Thread(
+                target=self._dispatch_loop,
+                args=(generation,),
+                name="Scheduler",
+                daemon=True,
+            )
+        ]
+        self._threads += [
+            threading.Thread(
+                target=self._worker_loop,
+                args=(generation,),
+                name=f"SchedulerWorker-{i}",
+                daemon=True,
+            )
+            for i in range(self.max_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info(
+            f"Scheduler started: {len(self.jobs)} jobs, {self.max_workers} workers"
+        )
+
+    def stop(self, timeout: float = None):
+        """Stop dispatching; running jobs finish on their own threads"""
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._queue.clear()
+            for job in self.jobs.values():
+                job.queued = 0
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        logger.info("Scheduler stopped")
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def is_active(self, name: str) -> bool:
+        """True while a run of job `name` is executing"""
+        with self._cond:
+            return name in self._active
+
+    def run_now(self, name: str) -> bool:
+        """Queue a job immediately (still never overlaps a running instance)"""
+        with self._cond:
+            job = self.jobs.get(name)
+            if job is None:
+                return False
+            self._enqueue(job, self.clock())
+            self._cond.notify_all()
+            return True
+
+    def run_on_demand(self, name: str, priority: int = 0) -> bool:
+        """run_now() for a job without a schedule, added on first use"""
+        with self._cond:
+            if name not in self.jobs:
+                self.add_job(name, None, priority=priority)
+            return self.run_now(name)
+
+    def status(self) -> List[dict]:
+        with self._cond:
+            return [job.to_dict() for job in self.jobs.values()]
+
+    # ------------------------------------------------------------------
+    # Dispatching
+    # ------------------------------------------------------------------
+    def _schedule_first(self, job: ScheduledJob, last_fire: Optional[float]):
+        """Pick the first tick, replaying ticks missed since the last run"""
+        now = self.clock()
+        job.last_fire = last_fire
+        if job.schedule is None:
+            job.next_fire = job.next_run = math.inf
+            return
+        if last_fire is not None and job.catch_up != "skip":
+            missed = self._count_ticks(job, last_fire, now)
+            runs = min(missed, 1 if job.catch_up == "once" else self.max_catch_up)
+            for _ in range(runs):
+                self._enqueue(job, now)
+            if runs:
+                logger.info(f"Job '{job.name}': catching up {runs} missed run(s)")
+        self._set_next(job, now)
+
+    def _count_ticks(self, job: ScheduledJob, since: float, until: float) -> int:
+        count, tick = 0, job.schedule.next_after(since)
+        while tick <= until and count <= self.max_catch_up:
+            count += 1
+            tick = job.schedule.next_after(tick)
+        return count
+
+    def _set_next(self, job: ScheduledJob, now: float):
+        job.next_fire = job.schedule.next_after(now)
+        jitter = random.uniform(0, job.jitter) if job.jitter else 0.0
+        job.next_run = job.next_fire + jitter
+
+    def _is_current(self, generation: int) -> bool:
+        """Whether loops started with `generation` should keep going (lock held)"""
+        return self._running and self._generation == generation
+
+    def _dispatch_loop(self, generation: int):
+        with self._cond:
+            while self._is_current(generation):
+                now = self.clock()
+                for job in list(self.jobs.values()):
+                    if job.next_run <= now:
+                        self._fire(job, now)
+
+                next_due = min((j.next_run for j in self.jobs.values()), default=None)
+                timeout = 60.0 if next_due is None else max(0.0, next_due - now)
+                # Wake at least once a minute so clock jumps (sleep) are noticed
+                self._cond.wait(min(timeout, 60.0))
+
+    def _fire(self, job: ScheduledJob, now: float):
+        """Queue the runs owed for ticks up to `now` and schedule the next one"""
+        late_ticks = self._count_ticks(job, job.next_fire, now)
+        on_time = now - job.next_run <= self.misfire_grace + job.jitter
+        runs = 1 if on_time else 0
+        missed = late_ticks + (0 if on_time else 1)
+        if missed and job.catch_up == "once":
+            runs = 1
+        elif missed and job.catch_up == "all":
+            runs += min(missed, self.max_catch_up)
+        if missed:
+            logger.warning(
+                f"Job '{job.name}' missed {missed} tick(s); "
+                f"catch_up={job.catch_up} -> {runs} run(s)"
+            )
+
+        if job.name in self._active or job.queued:
+            # Never overlap: keep at most one follow-up run for catch-up jobs
+            job.skipped += 1
+            if job.catch_up != "skip" and not job.queued:
+                self._enqueue(job, now)
+            logger.info(f"Job '{job.name}' is still running; tick skipped")
+        else:
+            for _ in range(runs):
+                self._enqueue(job, now)
+
+        job.last_fire = now
+        self._set_next(job, now)
+        self._save_state()
+
+    def _enqueue(self, job: ScheduledJob, due: float):
+        self._seq += 1
+        job.queued += 1
+        heapq.heappush(self._queue, (-job.priority, due, self._seq, job.name))
+        self._cond.notify_all()
+
+    def _take_runnable(self) -> Optional[ScheduledJob]:
+        """Highest-priority queued job whose previous run has finished"""
+        held = []
+        job = None
+        while self._queue:
+            entry = heapq.heappop(self._queue)
+            candidate = self.jobs.get(entry[3])
+            if candidate is None:
+                continue
+            if candidate.name in self._active:
+                held.append(entry)
+                continue
+            job = candidate
+            break
+        for entry in held:
+            heapq.heappush(self._queue, entry)
+        return job
+
+    def _worker_loop(self, generation: int):
+        while True:
+            with self._cond:
+                job = None
+                while self._is_current(generation):
+                    job = self._take_runnable()
+                    if job:
+                        break
+                    self._cond.wait()
+                if not self._is_current(generation):
+                    return
+                job.queued -= 1
+                job.running = True
+                self._active.add(job.name)
+                job.last_started = self.clock()
+
+            success = False
+            started = time.perf_counter()
+            try:
+                logger.info(f"Scheduled job '{job.name}' started")
+                success = bool(self.runner(job.name))
+            except Exception as e:
+                logger.error(f"Scheduled job '{job.name}' failed: {e}", exc_info=True)
+            finally:
+                with self._cond:
+                    self._active.discard(job.name)
+                    job.running = False
+                    job.last_success = success
+                    job.last_duration = time.perf_counter() - started
+                    self._cond.notify_all()
+            logger.info(
+                f"Scheduled job '{job.name}' finished in "
+                f"{job.last_duration:.1f}s (success={success})"
+            )
+
+    # ------------------------------------------------------------------
+    # State (last tick per job, for catch-up after a restart)
+    # ------------------------------------------------------------------
+    def _load_state(self) -> Dict[str, float]:
+        if not self.state_file or not self.state_file.exists():
+            return {}
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                return {k: float(v) for k, v in json.load(f).items()}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable scheduler state: {e}")
+            return {}
+
+    def _save_state(self):
+        if not self.state_file:
+            return
+        state = {
+            name: job.last_fire
+            for name, job in self.jobs.items()
+            if job.last_fire is not None
+        }
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.state_file.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(state, f, indent=2)
+            tmp.replace(self.state_file)
+        except OSError as e:
+            logger.warning(f"Could not save scheduler state: {e}")
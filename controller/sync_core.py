@@ -0,0 +1,782 @@
+# controller/sync_core.py - Qt-free synchronization core (GUI and headless runner)
+import copy
+import threading
+import time
+from contextlib import closing
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+import logging
+
+from connectors.sharepoint_connector import create_sharepoint_connector
+from connectors.database_connector import DatabaseConnector
+from controller.lookup_resolver import LookupResolver
+from controller.read_planner import ColumnBuffers, ReadPlanner
+from controller.value_converter import ValueConverter
+from utils.error_handling import handle_exceptions, ErrorCategory, ErrorSeverity
+from utils.config_loader import Config
+from utils.progress import ProgressThrottle
+from utils.metrics import RunMetrics, activate
+from utils.batch_tuner import get_batch_tuner
+from utils.memory_budget import SpillFile, can_spill, frame_row_bytes, get_memory_budget
+from utils.run_history import get_run_history
+from utils.lazy_imports import lazy_module
+
+logger = logging.getLogger(__name__)
+
+pd = lazy_module("pandas")  # first sync pays the import, not startup
+
+SYNC_DIRECTIONS = ("spo_to_sql", "sql_to_spo")
+
+# Records per add_list_items call in SQL -> SharePoint: starts at one Graph
+# JSON $batch (REST $batch calls take up to 100) and is tuned per list
+# between the limits
+WRITE_CHUNK_SIZE = 20
+MAX_WRITE_CHUNK_SIZE = 200
+
+# Job keys that describe the job itself rather than override Config fields
+JOB_META_KEYS = {"direction", "description", "enabled"}
+
+
+class SyncEvents:
+    """
+    Plain-Python event sink for a running sync.
+    SyncWorker forwards these to Qt signals; the headless runner logs them.
+    """
+
+    def on_progress(self, task_name: str, percentage: int, message: str):
+        pass
+
+    def on_progress_stats(self, stats: dict):
+        """Throughput and ETA for the update that follows (see ProgressThrottle)"""
+        pass
+
+    def on_log(self, message: str, level: str):
+        pass
+
+    def on_completed(self, success: bool, message: str, stats: dict):
+        pass
+
+
+def list_jobs(config: Config) -> Dict[str, Dict[str, Any]]:
+    """Built-in direction jobs plus the named jobs from `sync_jobs`"""
+    jobs = {direction: {"direction": direction} for direction in SYNC_DIRECTIONS}
+    jobs.update(getattr(config, "sync_jobs", None) or {})
+    return jobs
+
+
+def build_job_config(config: Config, job_name: str) -> Tuple[Config, str]:
+    """Return a copy of `config` with the job overrides applied, and its direction"""
+    jobs = list_jobs(config)
+    if job_name not in jobs:
+        raise KeyError(f"Unknown sync job: {job_name}")
+
+    job = jobs[job_name]
+    direction = job.get("direction", "spo_to_sql")
+    job_config = copy.deepcopy(config)
+    for key, value in job.items():
+        if key in JOB_META_KEYS:
+            continue
+        if hasattr(job_config, key):
+            setattr(job_config, key, value)
+        else:
+            logger.warning(f"Ignoring unknown setting '{key}' in job '{job_name}'")
+
+    return job_config, direction
+
+
+def validate_sync_config(config: Config, direction: str) -> List[str]:
+    """Return the configuration problems that would prevent a sync"""
+    errors = []
+
+    # General checks
+    if not config.sharepoint_site or not config.sharepoint_list:
+        errors.append("SharePoint site URL or list name is missing")
+
+    if not (
+        config.sharepoint_client_id
+        and config.sharepoint_client_secret
+        and config.tenant_id
+    ):
+        errors.append("SharePoint authentication credentials are missing")
+
+    # Database checks
+    db_type = config.database_type.lower()
+    if db_type == "sqlserver":
+        if not (
+            config.sql_server
+            and config.sql_database
+            and config.sql_username
+            and config.sql_password
+        ):
+            errors.append("SQL Server connection details are incomplete")
+        if not config.sql_table_name:
+            errors.append("SQL table name is not specified")
+    elif db_type == "sqlite":
+        if not config.sqlite_file:
+            errors.append("SQLite database file path is not specified")
+        if not config.sqlite_table_name:
+            errors.append("SQLite table name is not specified")
+    else:
+        errors.append(f"Unsupported database type: {config.database_type}")
+
+    # Direction-specific mapping checks
+    if direction == "spo_to_sql":
+        if not config.sharepoint_to_sql_mapping:
+            errors.append("SharePoint to SQL field mapping is empty")
+        elif not isinstance(config.sharepoint_to_sql_mapping, dict):
+            errors.append("SharePoint to SQL field mapping is not valid")
+
+    elif direction == "sql_to_spo":
+        if not config.sql_to_sharepoint_mapping:
+            errors.append("SQL to SharePoint field mapping is empty")
+        elif not isinstance(config.sql_to_sharepoint_mapping, dict):
+            errors.append("SQL to SharePoint field mapping is not valid")
+    else:
+        errors.append(f"Unknown sync direction: {direction}")
+
+    return errors
+
+
+_target_locks: Dict[str, threading.Lock] = {}
+_target_locks_lock = threading.Lock()
+
+
+def sync_target(config: Config, direction: str) -> str:
+    """The table or list a run writes to; runs on the same target never overlap"""
+    if direction == "sql_to_spo":
+        target = f"sharepoint:{config.sharepoint_site}:{config.sharepoint_list}"
+    elif config.database_type.lower() == "sqlserver":
+        target = (
+            f"sqlserver:{config.sql_server}:{config.sql_database}:"
+            f"{config.sql_table_name}"
+        )
+    else:
+        target = f"sqlite:{config.sqlite_file}:{config.sql_table_name}"
+    return target.lower()
+
+
+def _target_lock(target: str) -> threading.Lock:
+    with _target_locks_lock:
+        return _target_locks.setdefault(target, threading.Lock())
+
+
+class SyncJob:
+    """
+    One synchronization run between SharePoint and the database.
+    Supports SharePoint to SQL and SQL to SharePoint synchronization and
+    reports through a SyncEvents sink, so it runs with or without Qt.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        direction: str = "spo_to_sql",
+        events: SyncEvents = None,
+        connection_manager=None,
+        modified_since: str = None,
+        delta: bool = False,
+        delta_link: str = None,
+    ):
+        self.config = config
+        self.direction = direction
+        # ISO timestamp: only SharePoint items modified since then are synced
+        self.modified_since = modified_since
+        # Graph change feed: without a link the run reads everything and
+        # stores the first link in sync_stats["delta_link"]
+        self.delta = delta
+        self.delta_link = delta_link
+        self.events = events or SyncEvents()
+        self.connection_manager = connection_manager
+        self._should_stop = False
+        self.sync_stats = self._init_stats()
+        self.sharepoint_connector = None
+        self.database_connector = None
+        self.metrics = RunMetrics()
+        self.budget = get_memory_budget(config)
+        self._spills: List[SpillFile] = []
+        self.progress = ProgressThrottle(
+            self._emit_progress,
+            max_rate_hz=getattr(config, "progress_update_hz", 10.0),
+        )
+        logger.debug(f"SyncJob initialized for direction: {self.direction}")
+
+    def _init_stats(self) -> dict:
+        """Initialize synchronization statistics"""
+        return {
+            "total_records": 0,
+            "records_added": 0,
+            "records_updated": 0,
+            "errors": 0,
+            "duration_seconds": 0.0,
+            "rows_per_sec": 0.0,
+            "start_time": None,
+            "end_time": None,
+            "sync_direction": self.direction,
+        }
+
+    def run(self) -> Tuple[bool, str, dict]:
+        """
+        Run the synchronization and return (success, message, stats).
+        Waits while another run (scheduled, webhook or manual) writes to the
+        same table or list.
+        """
+        target = sync_target(self.config, self.direction)
+        lock = _target_lock(target)
+        if not lock.acquire(blocking=False):
+            self.events.on_log(
+                f"⏳ Waiting for another sync of {target} to finish...", "info"
+            )
+            while not lock.acquire(timeout=1.0):
+                if self._should_stop:
+                    self.sync_stats = self._init_stats()
+                    message = "Sync cancelled by user"
+                    self.events.on_completed(False, message, self.sync_stats)
+                    return False, message, self.sync_stats
+        try:
+            return self._run()
+        finally:
+            lock.release()
+
+    def _run(self) -> Tuple[bool, str, dict]:
+        self.sync_stats = self._init_stats()
+        self.sync_stats["start_time"] = datetime.now(timezone.utc)
+        self.metrics = RunMetrics()
+        self.progress.reset()
+        self.events.on_log(f"🚀 Starting {self.direction} synchronization...", "info")
+        logger.info(f"SyncJob started: {self.direction}")
+
+        success = False
+        message = ""
+
+        try:
+            # Connectors record spans into the metrics active on this thread
+            with activate(self.metrics):
+                # Lease warm connectors from the pool (or create one-off ones)
+                self.sharepoint_connector = self._acquire_connector("sharepoint")
+                self.database_connector = self._acquire_connector("database")
+
+                if self.direction == "spo_to_sql":
+                    success, message = self._sync_sharepoint_to_sql()
+                elif self.direction == "sql_to_spo":
+                    success, message = self._sync_sql_to_sharepoint()
+                else:
+                    message = f"Invalid sync direction: {self.direction}"
+                    self.events.on_log(f"❌ Error: {message}", "error")
+                    logger.error(message)
+
+        except Exception as e:
+            message = f"Critical error during sync: {e}"
+            self.events.on_log(f"❌ Critical Sync Error: {e}", "critical")
+            logger.critical(message, exc_info=True)
+            success = False
+        finally:
+            self.sync_stats["end_time"] = datetime.now(timezone.utc)
+            if self.sync_stats["start_time"] and self.sync_stats["end_time"]:
+                self.sync_stats["duration_seconds"] = (
+                    self.sync_stats["end_time"] - self.sync_stats["start_time"]
+                ).total_seconds()
+            duration = self.sync_stats["duration_seconds"]
+            self.sync_stats["rows_per_sec"] = (
+                round(self.sync_stats["total_records"] / duration, 1)
+                if duration > 0
+                else 0.0
+            )
+
+            # Return pooled connectors (or close one-off ones)
+            self._release_connector(self.sharepoint_connector)
+            self._release_connector(self.database_connector)
+            self.sharepoint_connector = None
+            self.database_connector = None
+            self._discard_spills()
+
+            self.sync_stats["run_id"] = self.metrics.run_id
+            self.sync_stats["metrics"] = self.metrics.to_dict()
+            self._log_stage_summary()
+            self._record_history(success, message)
+
+            self.events.on_completed(success, message, self.sync_stats)
+            logger.info(f"SyncJob finished. Success: {success}")
+
+        return success, message, self.sync_stats
+
+    def _log_stage_summary(self):
+        """One log line with the time spent in each stage"""
+        stages = self.sync_stats["metrics"]["stages"]
+        if not stages:
+            return
+        parts = [
+            f"{name} {stats['total_seconds']:.2f}s"
+            + (f" x{stats['count']}" if stats["count"] > 1 else "")
+            for name, stats in sorted(
+                stages.items(), key=lambda item: -item[1]["total_seconds"]
+            )
+        ]
+        self.events.on_log(f"⏱️ Stage timings: {', '.join(parts)}", "info")
+
+    def _record_history(self, success: bool, message: str):
+        """Persist the run and its metrics to the local run-history store"""
+        if not getattr(self.config, "run_history_enabled", True):
+            return
+        try:
+            get_run_history(getattr(self.config, "run_history_file", None)).record_run(
+                self.sync_stats, message, success
+            )
+        except Exception as e:
+            logger.warning(f"Could not record run history: {e}")
+
+    def _acquire_connector(self, connector_type: str):
+        """Lease a connector from the connection manager pool"""
+        if self.connection_manager:
+            return self.connection_manager.acquire_connector(
+                self.config, connector_type
+            )
+        if connector_type == "sharepoint":
+            return create_sharepoint_connector(self.config)
+        return DatabaseConnector(self.config)
+
+    def _spill_file(self, prefix: str) -> SpillFile:
+        """A spill file removed when the run ends"""
+        spill = self.budget.spill_file(prefix)
+        self._spills.append(spill)
+        return spill
+
+    def _discard_spills(self):
+        for spill in self._spills:
+            spill.close()
+        self._spills.clear()
+        self.budget.track(self.metrics.run_id, 0)
+
+    def _release_connector(self, connector):
+        """Hand a connector back to the pool, or close it if unpooled"""
+        if not connector:
+            return
+        if self.connection_manager:
+            self.connection_manager.release_connector(connector)
+        else:
+            connector.close()
+
+    @handle_exceptions(ErrorCategory.SYNC, ErrorSeverity.HIGH)
+    def _sync_sharepoint_to_sql(self) -> Tuple[bool, str]:
+        """Synchronize data from SharePoint to SQL Server"""
+        self.events.on_log("📥 Fetching data from SharePoint...", "info")
+        logger.info("Starting SharePoint to SQL sync")
+
+        if self._should_stop:
+            return False, "Sync cancelled by user"
+
+        spo_to_sql_mapping = self.config.sharepoint_to_sql_mapping
+        if not spo_to_sql_mapping:
+            return False, "SharePoint to SQL mapping is not configured"
+
+        # Progress update
+        self._progress("SharePoint to SQL", 0, "Connecting to SharePoint...")
+
+        # Get SharePoint data (only changed items for an incremental run)
+        use_delta = self.delta and hasattr(
+            self.sharepoint_connector, "read_list_changes"
+        )
+        incremental = bool(self.delta_link if use_delta else self.modified_since)
+
+        # The change feed already reads only what changed; otherwise check
+        # the list metadata first and pick paging or parallel ID windows
+        plan = None
+        if not use_delta:
+            with self.metrics.span("plan"):
+                plan = ReadPlanner(self.config).plan(
+                    self.sharepoint_connector, self.modified_since
+                )
+            if plan.unchanged and (incremental or self._table_exists()):
+                message = "SharePoint list unchanged since the last sync"
+                self.events.on_log(f"✅ {message} - nothing to do", "success")
+                self._progress("SharePoint to SQL", 100, message)
+                return True, message
+
+        deleted_ids = []
+        if use_delta and incremental:
+            self.events.on_log("🔁 Incremental sync from the Graph change feed", "info")
+        elif incremental:
+            self.events.on_log(
+                f"🔁 Incremental sync of items modified since {self.modified_since}",
+                "info",
+            )
+        filter_query = None
+        if incremental and not use_delta:
+            filter_query = f"Modified ge datetime'{self.modified_since}'"
+
+        # Only the mapped columns are kept, in buffers sized for a full read;
+        # lookup/person fields are read as their <Field>Id columns
+        resolver = LookupResolver(self.config, self.sharepoint_connector)
+        with self.metrics.span("lookups"):
+            source_columns = resolver.source_columns(
+                self.config.sharepoint_list, spo_to_sql_mapping
+            )
+        buffers = ColumnBuffers(
+            source_columns, 0 if incremental or not plan else plan.item_count
+        )
+        converter = ValueConverter(
+            self.config, self.sharepoint_connector, self.config.sharepoint_list
+        )
+        missing = set()
+
+        def prepare(df_spo: "pd.DataFrame") -> "pd.DataFrame":
+            """Resolved, converted and mapped rows ready for the database"""
+            with self.metrics.span("lookups", rows=len(df_spo)):
+                df_spo = resolver.resolve_frame(df_spo)
+            with self.metrics.span("convert", rows=len(df_spo)):
+                df_spo = converter.to_sql(df_spo)
+            with self.metrics.span("mapping", rows=len(df_spo)):
+                df_spo_mapped = pd.DataFrame()
+                for spo_col, sql_col in spo_to_sql_mapping.items():
+                    if spo_col in df_spo.columns:
+                        df_spo_mapped[sql_col] = df_spo[spo_col]
+                    elif spo_col not in missing:
+                        missing.add(spo_col)
+                        self.events.on_log(
+                            f"⚠️ Warning: SharePoint column '{spo_col}' not found",
+                            "warning",
+                        )
+            return df_spo_mapped
+
+        # Over the memory budget the buffered rows are prepared and staged
+        # on disk, so the buffers never hold much more than a window
+        spill = self._spill_file("spo_to_sql")
+
+        def relieve_memory():
+            self.budget.track(self.metrics.run_id, buffers.approx_bytes)
+            if buffers.rows and self.budget.should_spill() and can_spill():
+                with self.metrics.span("spill", rows=buffers.rows):
+                    spill.append(prepare(buffers.to_frame(all_columns=True)))
+                buffers.clear()
+
+        self._progress("SharePoint to SQL", 5, "Reading SharePoint list...")
+        with self.metrics.span("read") as span:
+            try:
+                if use_delta:
+                    changes = self.sharepoint_connector.read_list_changes(
+                        self.config.sharepoint_list, self.delta_link
+                    )
+                    if changes is None:
+                        return False, "Failed to retrieve data from SharePoint"
+                    sharepoint_data, deleted_ids, delta_link = changes
+                    self.sync_stats["delta_link"] = delta_link
+                    buffers.extend(sharepoint_data)
+                    del sharepoint_data
+                    relieve_memory()
+                elif plan.id_windows:
+                    if not self._read_windows(
+                        plan, buffers, filter_query, relieve_memory
+                    ):
+                        return False, "Sync cancelled by user"
+                else:
+                    sharepoint_data = self.sharepoint_connector.read_list_items(
+                        self.config.sharepoint_list, filter_query=filter_query
+                    )
+                    if sharepoint_data is None:
+                        return False, "Failed to retrieve data from SharePoint"
+                    buffers.extend(sharepoint_data)
+                    del sharepoint_data
+                    relieve_memory()
+            except Exception as e:
+                logger.error(f"Reading SharePoint failed: {e}", exc_info=True)
+                return False, f"Failed to retrieve data from SharePoint: {e}"
+            span["rows"] = buffers.rows + spill.rows
+
+        id_column = self._id_column()
+        if deleted_ids and incremental and id_column:
+            with self.metrics.span("delete", rows=len(deleted_ids)):
+                self.database_connector.delete_keys(
+                    self.config.sql_table_name, id_column, deleted_ids
+                )
+            self.events.on_log(
+                f"🗑️ Removed {len(deleted_ids)} items deleted in SharePoint",
+                "info",
+            )
+
+        total_rows = buffers.rows + spill.rows
+        self.sync_stats["total_records"] = total_rows
+        self.events.on_log(f"📊 Found {total_rows} items in SharePoint", "info")
+        logger.info(f"Retrieved {total_rows} items from SharePoint")
+
+        if not total_rows:
+            if plan and not incremental:
+                ReadPlanner(self.config).record(plan)
+            return True, "No data to synchronize from SharePoint"
+
+        self._progress("SharePoint to SQL", 65, "Applying column mapping...")
+        if spill.parts:
+            if buffers.rows:
+                with self.metrics.span("spill", rows=buffers.rows):
+                    spill.append(prepare(buffers.to_frame(all_columns=True)))
+            buffers.clear()
+            self.events.on_log(
+                f"💽 {spill.rows} rows staged on disk ({spill.parts} parts) "
+                "to stay within the memory budget",
+                "info",
+            )
+            frames = iter(spill)
+        else:
+            with self.metrics.span("parse", rows=buffers.rows):
+                df_spo = buffers.to_frame()
+            buffers.clear()
+            frames = iter([prepare(df_spo)])
+            del df_spo
+        self.budget.track(self.metrics.run_id, 0)
+
+        self._progress("SharePoint to SQL", 70, "Writing to database...")
+        self.events.on_log("💾 Writing data to SQL Database...", "info")
+
+        def write_progress(rows_done: int):
+            self._progress(
+                "SharePoint to SQL",
+                70 + int(rows_done / total_rows * 29),  # 70% to 99%
+                f"Writing {rows_done}/{total_rows} rows...",
+            )
+
+        try:
+            # Determine write mode; incremental runs replace changed rows by ID
+            if_exists_mode = "replace" if self.config.sql_truncate_before else "append"
+            replace_keys = None
+            if incremental:
+                if_exists_mode = "append"
+                replace_keys = id_column
+                if not replace_keys:
+                    self.events.on_log(
+                        "⚠️ No ID column mapped - changed items are appended",
+                        "warning",
+                    )
+
+            rows_written = 0
+            with self.metrics.span("write") as span:
+                # One frame, or the spilled parts one after another
+                for df_spo_mapped in frames:
+                    if df_spo_mapped.columns.empty:
+                        return False, "No valid columns after applying mapping"
+                    written = self.database_connector.write_dataframe(
+                        df_spo_mapped,
+                        table_name=self.config.sql_table_name,
+                        if_exists=if_exists_mode if not rows_written else "append",
+                        index=False,
+                        create_table=self.config.sql_create_table,
+                        replace_keys=replace_keys,
+                        progress=lambda done, offset=rows_written: write_progress(
+                            offset + done
+                        ),
+                    )
+                    if written is None:
+                        return False, "Failed to write data to SQL database"
+                    rows_written += written
+                    del df_spo_mapped
+                span["rows"] = rows_written
+
+            self.sync_stats["records_added"] = rows_written
+            if plan and not incremental and rows_written == total_rows:
+                ReadPlanner(self.config).record(plan)
+            self._progress("SharePoint to SQL", 100, "Sync completed!")
+
+            message = (
+                f"Successfully synced {rows_written} records from SharePoint to SQL"
+            )
+            self.events.on_log(f"✅ {message}", "success")
+            logger.info(message)
+            return True, message
+
+        except Exception as e:
+            message = f"Failed to write data to SQL database: {e}"
+            self.events.on_log(f"❌ {message}", "error")
+            logger.error(message, exc_info=True)
+            return False, message
+
+    def _read_windows(
+        self, plan, buffers, filter_query: str = None, after_window=None
+    ) -> bool:
+        """
+        Fill `buffers` from parallel ID windows, calling `after_window`
+        after each one; False when cancelled
+        """
+        windows = self.sharepoint_connector.iter_list_items_by_id(
+            self.config.sharepoint_list, plan.max_id, filter_query=filter_query
+        )
+        rows_read = 0
+        with closing(windows):
+            for high_id, items in windows:
+                if self._should_stop:
+                    return False
+                buffers.extend(items)
+                rows_read += len(items)
+                del items
+                if after_window:
+                    after_window()
+                self._progress(
+                    "SharePoint to SQL",
+                    5 + int(high_id / max(plan.max_id, 1) * 60),  # 5% to 65%
+                    f"Read {rows_read} of ~{plan.item_count} items...",
+                    rows_done=rows_read,
+                    rows_total=plan.item_count,
+                )
+        return True
+
+    def _table_exists(self) -> bool:
+        tables = self.database_connector.list_tables() or []
+        return self.config.sql_table_name in tables
+
+    def _id_column(self) -> str:
+        """SQL column the SharePoint item ID is mapped to, if any"""
+        mapping = self.config.sharepoint_to_sql_mapping or {}
+        return mapping.get("ID") or mapping.get("Id")
+
+    @handle_exceptions(ErrorCategory.SYNC, ErrorSeverity.HIGH)
+    def _sync_sql_to_sharepoint(self) -> Tuple[bool, str]:
+        """Synchronize data from SQL Server to SharePoint"""
+        self.events.on_log("📤 Fetching data from SQL Database...", "info")
+        logger.info("Starting SQL to SharePoint sync")
+
+        if self._should_stop:
+            return False, "Sync cancelled by user"
+
+        self._progress("SQL to SharePoint", 10, "Reading from database...")
+
+        # Get SQL data
+        with self.metrics.span("read"):
+            df_sql = self.database_connector.read_table(
+                self.config.sql_table_name, as_frame=True
+            )
+        if df_sql is None:
+            return False, "Failed to retrieve data from SQL database"
+
+        self.sync_stats["total_records"] = len(df_sql)
+        self.events.on_log(f"📊 Found {len(df_sql)} records in SQL", "info")
+
+        if df_sql.empty:
+            return True, "No data to synchronize from SQL"
+
+        self._progress("SQL to SharePoint", 30, "Applying column mapping...")
+
+        # Apply column mapping
+        sql_to_spo_mapping = self.config.sql_to_sharepoint_mapping
+        if not sql_to_spo_mapping:
+            return False, "SQL to SharePoint mapping is not configured"
+
+        with self.metrics.span("mapping", rows=len(df_sql)):
+            df_sql_mapped = pd.DataFrame()
+            for sql_col, spo_col in sql_to_spo_mapping.items():
+                if sql_col in df_sql.columns:
+                    df_sql_mapped[spo_col] = df_sql[sql_col]
+                else:
+                    self.events.on_log(
+                        f"⚠️ Warning: SQL column '{sql_col}' not found", "warning"
+                    )
+
+        del df_sql
+        if df_sql_mapped.empty:
+            return False, "No valid columns after applying mapping"
+
+        # Lookup/person values become the IDs SharePoint expects
+        with self.metrics.span("lookups", rows=len(df_sql_mapped)):
+            df_sql_mapped = LookupResolver(
+                self.config, self.sharepoint_connector
+            ).encode_frame(df_sql_mapped, self.config.sharepoint_list)
+
+        self._progress("SQL to SharePoint", 60, "Writing to SharePoint...")
+        self.events.on_log("📤 Writing data to SharePoint...", "info")
+
+        try:
+            # Records for SharePoint (ISO dates, lists, no NaN) are converted
+            # one chunk at a time rather than for the whole table up front
+            converter = ValueConverter(
+                self.config, self.sharepoint_connector, self.config.sharepoint_list
+            )
+            row_bytes = frame_row_bytes(df_sql_mapped)
+            added_count = 0
+            error_count = 0
+
+            total_records = len(df_sql_mapped)
+            tuner = get_batch_tuner(
+                self.config,
+                f"sharepoint:{self.config.sharepoint_site}:"
+                f"{self.config.sharepoint_list}:write",
+                initial=WRITE_CHUNK_SIZE,
+                minimum=1,
+                maximum=MAX_WRITE_CHUNK_SIZE,
+            )
+            i = 0
+            while i < total_records:
+                if self._should_stop:
+                    tuner.save()
+                    return False, "Sync cancelled by user"
+
+                size = self.budget.fit_rows(tuner.size, row_bytes)
+                with self.metrics.span("convert", rows=size):
+                    chunk = converter.to_records(df_sql_mapped.iloc[i : i + size])
+                progress = 60 + int((i / total_records) * 30)  # 60% to 90%
+                self._progress(
+                    "SQL to SharePoint",
+                    progress,
+                    f"Processing record {i+1}/{total_records}",
+                    rows_done=i,
+                    rows_total=total_records,
+                )
+
+                # For simplicity, always add new items (no update logic for now)
+                retries = self.metrics.counters.get("retries", 0)
+                throttled = self.metrics.counters.get("throttle_wait_seconds", 0)
+                with self.metrics.span("write", rows=len(chunk)):
+                    chunk_started = time.perf_counter()
+                    results = self.sharepoint_connector.add_list_items(
+                        self.config.sharepoint_list, chunk
+                    )
+                # Throttled or timed-out requests were retried, or $batch
+                # parts were throttled and resent: smaller chunks
+                if (
+                    self.metrics.counters.get("retries", 0) > retries
+                    or self.metrics.counters.get("throttle_wait_seconds", 0) > throttled
+                ):
+                    tuner.backoff()
+                else:
+                    tuner.record(len(chunk), time.perf_counter() - chunk_started)
+                added = sum(1 for ok in results or [] if ok)
+                added_count += added
+                error_count += len(chunk) - added
+                i += len(chunk)
+
+            tuner.save()
+
+            self.sync_stats["records_added"] = added_count
+            self.sync_stats["errors"] = error_count
+            self._progress(
+                "SQL to SharePoint",
+                100,
+                "Sync completed!",
+                rows_done=total_records,
+                rows_total=total_records,
+            )
+
+            message = f"Successfully synced to SharePoint: Added {added_count}, Errors {error_count}"
+            self.events.on_log(f"✅ {message}", "success")
+            logger.info(message)
+            return True, message
+
+        except Exception as e:
+            message = f"Failed to write data to SharePoint: {e}"
+            self.events.on_log(f"❌ {message}", "error")
+            logger.error(message, exc_info=True)
+            return False, message
+
+    def _progress(
+        self,
+        task_name: str,
+        percentage: int,
+        message: str,
+        rows_done: int = None,
+        rows_total: int = None,
+    ):
+        """Report progress through the throttle - safe to call per record"""
+        self.progress.update(task_name, percentage, message, rows_done, rows_total)
+
+    def _emit_progress(self, task_name: str, percentage: int, message: str, stats):
+        self.events.on_progress_stats(stats)
+        self.events.on_progress(task_name, percentage, message)
+
+    def stop(self):
+        """Set flag to stop sync process gracefully"""
+        self._should_stop = True
+        logger.info("SyncJob received stop signal")
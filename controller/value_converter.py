@@ -0,0 +1,152 @@
+# controller/value_converter.py - SharePoint <-> SQL value conversion by field type
+"""
+Whole-column conversions keyed by the list's field schema (/fields,
+cached with the lookup maps in lookup_cache_file):
+
+- SharePoint -> SQL: ISO-8601 DateTime strings are parsed in one
+  vectorised pass and normalised to naive `sql_timezone` timestamps;
+  numbers and booleans are coerced; multi-value fields
+  ({"results": [...]} or lists) are joined with "; "; complex values
+  (URL, taxonomy, location) are reduced to their display part.
+- SQL -> SharePoint: timestamps become UTC ISO strings, multi-value
+  fields become lists (each connector wraps them for its API) and
+  NaN/NaT become null before the frame is turned into records.
+"""
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from utils.config_loader import Config
+from utils.lazy_imports import lazy_module
+from utils.ttl_cache import get_ttl_cache
+
+logger = logging.getLogger(__name__)
+
+pd = lazy_module("pandas")
+
+DATETIME_TYPES = {"DateTime"}
+NUMBER_TYPES = {"Number", "Currency", "Integer", "Counter"}
+BOOLEAN_TYPES = {"Boolean", "AllDayEvent", "Attachments"}
+MULTI_TYPES = {"MultiChoice", "LookupMulti", "UserMulti", "TaxonomyFieldTypeMulti"}
+MULTI_SEPARATOR = "; "
+_BOOLEAN_TEXT = {
+    "true": True,
+    "1": True,
+    "1.0": True,
+    "yes": True,
+    "false": False,
+    "0": False,
+    "0.0": False,
+    "no": False,
+}
+
+# Display part of complex field values
+_COMPLEX_KEYS = ("Label", "Url", "DisplayName", "Title", "Value")
+
+
+def get_field_schema(config: Config, connector, list_name: str) -> List[dict]:
+    """The list's fields (cached); empty when the connector cannot tell"""
+    if not hasattr(connector, "get_list_fields"):
+        return []
+    cache = get_ttl_cache(
+        getattr(config, "lookup_cache_file", None),
+        getattr(config, "lookup_cache_ttl", 3600),
+    )
+    key = "|".join((config.sharepoint_site or "", "fields", list_name))
+    return cache.get_or_load(key, lambda: connector.get_list_fields(list_name)) or []
+
+
+def _flatten(value) -> Any:
+    """One SQL-storable value for a nested SharePoint value"""
+    if isinstance(value, dict):
+        if "results" in value:
+            value = value["results"]
+        else:
+            for key in _COMPLEX_KEYS:
+                if value.get(key) is not None:
+                    return value[key]
+            value = {k: v for k, v in value.items() if k != "__metadata"}
+            return json.dumps(value, ensure_ascii=False) if value else None
+    if isinstance(value, (list, tuple)):
+        parts = [_flatten(part) for part in value]
+        return MULTI_SEPARATOR.join(str(p) for p in parts if p is not None) or None
+    return value
+
+
+def _split(value) -> Optional[list]:
+    """A multi-value cell as a list ("a; b" -> ["a", "b"])"""
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    if isinstance(value, dict):
+        return list(value.get("results", []))
+    if value is None or value != value:  # None or NaN
+        return None
+    return [part.strip() for part in str(value).split(";") if part.strip()]
+
+
+class ValueConverter:
+    """Converts frames for one list in both directions"""
+
+    def __init__(self, config: Config, connector, list_name: str):
+        self.timezone = getattr(config, "sql_timezone", "UTC") or "UTC"
+        self.types: Dict[str, str] = {
+            field["InternalName"]: field.get("TypeAsString")
+            for field in get_field_schema(config, connector, list_name)
+        }
+
+    def to_sql(self, df: "pd.DataFrame") -> "pd.DataFrame":
+        """SharePoint values (as read) to plain SQL values, per column"""
+        for column in df.columns:
+            field_type = self.types.get(column)
+            series = df[column]
+            if field_type in DATETIME_TYPES:
+                parsed = pd.to_datetime(series, utc=True, errors="coerce")
+                df[column] = parsed.dt.tz_convert(self.timezone).dt.tz_localize(None)
+            elif field_type in NUMBER_TYPES:
+                df[column] = pd.to_numeric(series, errors="coerce")
+            elif field_type in BOOLEAN_TYPES:
+                df[column] = _to_boolean(series)
+            elif series.dtype == object and (
+                field_type in MULTI_TYPES or _holds_containers(series)
+            ):
+                df[column] = series.map(_flatten)
+        return df
+
+    def to_records(self, df: "pd.DataFrame") -> List[Dict[str, Any]]:
+        """SQL values to JSON-ready item payloads (NaN/NaT -> None)"""
+        df = df.copy()
+        for column in df.columns:
+            field_type = self.types.get(column)
+            series = df[column]
+            if field_type in DATETIME_TYPES or pd.api.types.is_datetime64_any_dtype(
+                series
+            ):
+                parsed = pd.to_datetime(series, errors="coerce")
+                if parsed.dt.tz is None:
+                    parsed = parsed.dt.tz_localize(
+                        self.timezone, ambiguous="NaT", nonexistent="shift_forward"
+                    )
+                df[column] = parsed.dt.tz_convert("UTC").dt.strftime(
+                    "%Y-%m-%dT%H:%M:%SZ"
+                )
+            elif field_type in MULTI_TYPES:
+                df[column] = series.map(_split)
+            elif field_type in NUMBER_TYPES:
+                df[column] = pd.to_numeric(series, errors="coerce")
+            elif field_type in BOOLEAN_TYPES:
+                df[column] = _to_boolean(series)
+
+        # object dtype turns numpy scalars into Python ones for JSON
+        df = df.astype(object)
+        return df.where(df.notna(), None).to_dict(orient="records")
+
+
+def _to_boolean(series: "pd.Series") -> "pd.Series":
+    text = series.astype(str).str.strip().str.lower()
+    return text.map(_BOOLEAN_TEXT).astype("boolean")
+
+
+def _holds_containers(series: "pd.Series") -> bool:
+    """Whether an unknown object column carries dicts/lists (first value)"""
+    first = series.first_valid_index()
+    return first is not None and isinstance(series[first], (dict, list, tuple))
@@ -0,0 +1,472 @@
+# controller/webhooks.py - SharePoint webhook receiver and event-driven list syncs
+"""
+Optional push trigger next to the polling schedules (which stay as the
+fallback). When `webhook_enabled` is set:
+
+1. A small HTTP receiver listens on webhook_host:webhook_port/webhook_path.
+   `webhook_public_url` is the HTTPS address SharePoint posts to (e.g. a
+   reverse proxy in front of the receiver).
+2. Each list in `webhook_lists` gets a subscription, renewed before it
+   expires. SharePoint's validation handshake is answered automatically.
+3. Notifications are checked against the client state, debounced per list
+   and then trigger an incremental SharePoint -> SQL sync of that list only
+   (items modified since the last webhook-triggered run).
+
+Deleted items are not visible to an incremental run; the regular full
+syncs reconcile them.
+"""
+import hmac
+import json
+import logging
+import secrets
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from connectors.sharepoint_connector import SharePointConnector
+from controller.sync_core import (
+    SyncEvents,
+    SyncJob,
+    build_job_config,
+    validate_sync_config,
+)
+from utils.config_loader import Config
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_JOB_PREFIX = "webhook:"
+MAX_EXPIRATION_DAYS = 180  # SharePoint limit for list subscriptions
+MAX_BODY_BYTES = 1024 * 1024
+WATERMARK_SKEW = timedelta(minutes=2)  # tolerate clock skew with SharePoint
+DEFAULT_STATE_FILE = "data/webhook_state.json"
+
+
+def webhook_lists(config: Config) -> Dict[str, str]:
+    """List title -> sync job used for its incremental runs"""
+    lists = dict(getattr(config, "webhook_lists", None) or {})
+    if not lists and config.sharepoint_list:
+        lists[config.sharepoint_list] = "spo_to_sql"
+    return lists
+
+
+def is_webhook_job(job_name: str) -> bool:
+    return job_name.startswith(WEBHOOK_JOB_PREFIX)
+
+
+def _utc_iso(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class WebhookState:
+    """
+    Client state secret, subscriptions and sync watermarks/delta links.
+    Use get_webhook_state() so the service and every webhook job share one
+    instance; each change re-reads the file first, so writes from another
+    process (e.g. the headless runner) are kept.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._data = {
+            "client_state": "",
+            "subscriptions": {},
+            "watermarks": {},
+            "delta_links": {},
+        }
+        self._load()
+
+    def get(self, section: str, key: str, default=None):
+        with self._lock:
+            return self._data[section].get(key, default)
+
+    def set(self, section: str, key: str, value):
+        with self._lock:
+            self._load()
+            self._data[section][key] = value
+            self._save()
+
+    def client_state(self, configured: str = "") -> str:
+        """The configured secret, or a generated one kept across restarts"""
+        with self._lock:
+            if configured:
+                return configured
+            self._load()
+            if not self._data.get("client_state"):
+                self._data["client_state"] = secrets.token_urlsafe(24)
+                self._save()
+            return self._data["client_state"]
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable webhook state: {e}")
+            return
+        for section, value in saved.items():
+            if isinstance(value, dict) and isinstance(self._data.get(section), dict):
+                self._data[section].update(value)
+            else:
+                self._data[section] = value
+
+    def _save(self):
+        # Unique temp name: other processes may be saving the same file
+        tmp = self.path.with_name(f"{self.path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, indent=2)
+            tmp.replace(self.path)
+        except OSError as e:
+            tmp.unlink(missing_ok=True)
+            logger.warning(f"Could not save webhook state: {e}")
+
+
+_states: Dict[str, WebhookState] = {}
+_states_lock = threading.Lock()
+
+
+def get_webhook_state(path: str = None) -> WebhookState:
+    """Returns the shared WebhookState for a file."""
+    path = str(path or DEFAULT_STATE_FILE)
+    with _states_lock:
+        if path not in _states:
+            _states[path] = WebhookState(path)
+        return _states[path]
+
+
+class NotificationDebouncer:
+    """
+    Collapses bursts of notifications per key into one callback, fired once
+    the key has been quiet for `delay` seconds (or after `max_delay` while
+    notifications keep arriving).
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[str], None],
+        delay: float = 10.0,
+        max_delay: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.callback = callback
+        self.delay = delay
+        self.max_delay = max(max_delay, delay)
+        self.clock = clock
+        self._pending: Dict[str, list] = {}  # key -> [first_seen, last_seen]
+        self._cond = threading.Condition()
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="WebhookDebouncer", daemon=True
+        )
+        self._thread.start()
+
+    def notify(self, key: str):
+        now = self.clock()
+        with self._cond:
+            if key in self._pending:
+                self._pending[key][1] = now
+            else:
+                self._pending[key] = [now, now]
+            self._cond.notify()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join(2)
+
+    def _due_at(self, first: float, last: float) -> float:
+        return min(last + self.delay, first + self.max_delay)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running:
+                    now = self.clock()
+                    due = [
+                        key
+                        for key, (first, last) in self._pending.items()
+                        if self._due_at(first, last) <= now
+                    ]
+                    if due:
+                        break
+                    next_due = min(
+                        (self._due_at(*times) for times in self._pending.values()),
+                        default=None,
+                    )
+                    self._cond.wait(None if next_due is None else next_due - now)
+                if not self._running:
+                    return
+                for key in due:
+                    del self._pending[key]
+
+            for key in due:
+                try:
+                    self.callback(key)
+                except Exception as e:
+                    logger.error(f"Webhook trigger for '{key}' failed: {e}")
+
+
+class _ReceiverHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        logger.debug(f"Webhook receiver: {format % args}")
+
+    def do_POST(self):
+        receiver: WebhookReceiver = self.server.receiver
+        parts = urlsplit(self.path)
+        if parts.path.rstrip("/") != receiver.path.rstrip("/"):
+            self._reply(404, "Not found")
+            return
+
+        # Subscription validation: echo the token as text/plain
+        token = parse_qs(parts.query).get("validationtoken")
+        if token:
+            self._reply(200, token[0])
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            self._reply(413, "Payload too large")
+            return
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            notifications = payload.get("value", [])
+        except (ValueError, AttributeError):
+            self._reply(400, "Invalid notification payload")
+            return
+
+        accepted = receiver.accept(notifications)
+        # SharePoint only needs a fast 2xx; the sync itself runs later
+        self._reply(202 if accepted else 403, "")
+
+    def _reply(self, status: int, text: str):
+        data = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class WebhookReceiver:
+    """Answers validation requests and hands valid notifications on"""
+
+    def __init__(
+        self,
+        on_notification: Callable[[dict], None],
+        client_state: str,
+        host: str = "0.0.0.0",
+        port: int = 8787,
+        path: str = "/spo-webhook",
+    ):
+        self.on_notification = on_notification
+        self.client_state = client_state
+        self.path = path
+        self.known_subscriptions = set()  # empty = accept any with the secret
+        self.rejected = 0
+        self._httpd = ThreadingHTTPServer((host, port), _ReceiverHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.receiver = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def local_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{self.path}"
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="WebhookReceiver", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Webhook receiver listening on {self.local_url}")
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(5)
+
+    def accept(self, notifications) -> bool:
+        """Validate notifications; returns False if any was rejected"""
+        valid = True
+        for notification in notifications:
+            state = str(notification.get("clientState") or "")
+            subscription = notification.get("subscriptionId")
+            if not hmac.compare_digest(state, self.client_state) or (
+                self.known_subscriptions
+                and subscription not in self.known_subscriptions
+            ):
+                self.rejected += 1
+                valid = False
+                logger.warning(f"Rejected webhook notification for {subscription}")
+                continue
+            self.on_notification(notification)
+        return valid
+
+
+class WebhookService:
+    """
+    Receiver, subscriptions and debouncing for the lists in `webhook_lists`.
+    `trigger(job_name)` is called with a webhook job name once a list's
+    notifications settle; run it with `run_webhook_job`.
+    """
+
+    def __init__(self, config: Config, trigger: Callable[[str], None]):
+        self.config = config
+        self.trigger = trigger
+        self.lists = webhook_lists(config)
+        self.state = get_webhook_state(getattr(config, "webhook_state_file", None))
+        self.client_state = self.state.client_state(
+            getattr(config, "webhook_client_state", "")
+        )
+        self.receiver = WebhookReceiver(
+            self._on_notification,
+            self.client_state,
+            host=getattr(config, "webhook_host", "0.0.0.0"),
+            port=getattr(config, "webhook_port", 8787),
+            path=getattr(config, "webhook_path", "/spo-webhook"),
+        )
+        self.debouncer = None
+        self._list_ids: Dict[str, str] = {}  # list GUID -> title
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def notification_url(self) -> str:
+        return getattr(self.config, "webhook_public_url", "") or self.receiver.local_url
+
+    def start(self):
+        self.debouncer = NotificationDebouncer(
+            self._on_settled,
+            delay=getattr(self.config, "webhook_debounce_seconds", 10.0),
+            max_delay=getattr(self.config, "webhook_max_delay_seconds", 60.0),
+        )
+        self.receiver.start()
+        # Registration waits for SharePoint's validation call, so the
+        # receiver must be serving before this thread subscribes
+        self._thread = threading.Thread(
+            target=self._maintain_subscriptions,
+            name="WebhookSubscriptions",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self.receiver.stop()
+        if self.debouncer:
+            self.debouncer.stop()
+
+    def _maintain_subscriptions(self):
+        """Subscribe each list, then renew well before expiry"""
+        while not self._stop.is_set():
+            connector = SharePointConnector(self.config)
+            try:
+                for title in self.lists:
+                    self._ensure_subscription(connector, title)
+            except Exception as e:
+                logger.error(f"Webhook subscription upkeep failed: {e}")
+            finally:
+                connector.close()
+            self._stop.wait(12 * 3600)
+
+    def _ensure_subscription(self, connector: SharePointConnector, title: str):
+        days = getattr(self.config, "webhook_expiration_days", 90)
+        days = min(days, MAX_EXPIRATION_DAYS)
+        now = datetime.now(timezone.utc)
+        expiration = _utc_iso(now + timedelta(days=days))
+
+        info = connector.get_list_info(title) or {}
+        if info.get("Id"):
+            self._list_ids[str(info["Id"]).strip("{}").lower()] = title
+
+        existing = [
+            s
+            for s in connector.list_subscriptions(title) or []
+            if s.get("notificationUrl") == self.notification_url
+        ]
+        if not existing:
+            created = connector.create_subscription(
+                title, self.notification_url, expiration, self.client_state
+            )
+            if not created:
+                logger.warning(f"No webhook for '{title}'; polling stays in charge")
+                return
+            existing = [created]
+
+        subscription = existing[0]
+        self.receiver.known_subscriptions.add(subscription.get("id"))
+        self.state.set("subscriptions", title, subscription)
+
+        expires = subscription.get("expirationDateTime", "")
+        try:
+            expires_at = datetime.fromisoformat(expires.replace("Z", "+00:00"))
+        except ValueError:
+            expires_at = now
+        if expires_at - now < timedelta(days=days / 2):
+            connector.renew_subscription(title, subscription.get("id"), expiration)
+
+    def _on_notification(self, notification: dict):
+        resource = str(notification.get("resource", "")).strip("{}").lower()
+        title = self._list_ids.get(resource)
+        if title is None and len(self.lists) == 1:
+            title = next(iter(self.lists))
+        if title is None:
+            logger.warning(f"Webhook notification for unknown list {resource}")
+            return
+        self.debouncer.notify(title)
+
+    def _on_settled(self, title: str):
+        logger.info(f"Webhook: changes in '{title}', starting incremental sync")
+        self.trigger(f"{WEBHOOK_JOB_PREFIX}{title}")
+
+
+def run_webhook_job(
+    config: Config,
+    job_name: str,
+    events: SyncEvents = None,
+    connection_manager=None,
+) -> bool:
+    """Incremental SharePoint -> SQL sync of the list named in `job_name`"""
+    title = job_name[len(WEBHOOK_JOB_PREFIX) :]
+    lists = webhook_lists(config)
+    if title not in lists:
+        logger.error(f"List '{title}' is not configured in webhook_lists")
+        return False
+
+    job_config, _ = build_job_config(config, lists[title])
+    job_config.sharepoint_list = title
+    errors = validate_sync_config(job_config, "spo_to_sql")
+    if errors:
+        for error_msg in errors:
+            logger.error(f"[{job_name}] Config error: {error_msg}")
+        return False
+
+    state = get_webhook_state(getattr(config, "webhook_state_file", None))
+    started = datetime.now(timezone.utc)
+    job = SyncJob(
+        job_config,
+        "spo_to_sql",
+        events=events,
+        connection_manager=connection_manager,
+        modified_since=state.get("watermarks", title),
+        # Graph reads the list's change feed instead of filtering on Modified
+        delta=getattr(job_config, "use_graph_api", False),
+        delta_link=state.get("delta_links", title),
+    )
+    success, _, stats = job.run()
+    if success:
+        state.set("watermarks", title, _utc_iso(started - WATERMARK_SKEW))
+        if (stats or {}).get("delta_link"):
+            state.set("delta_links", title, stats["delta_link"])
+    return success
@@ -111,32 +111,6 @@ def create_splash_screen():
         return None
 
 
-def import_components():
-    """Import all required components with error handling"""
-    components = {}
-
-    try:
-        # Core imports
-        from ui.styles.theme import apply_modern_theme
-        from controller.app_controller import AppController
-        from ui.main_window import OptimizedMainWindow
-
-        components.update(
-            {
-                "theme": apply_modern_theme,
-                "controller": AppController,
-                "main_window": OptimizedMainWindow,
-            }
-        )
-
-        print("✅ Core components imported")
-        return components
-
-    except ImportError as e:
-        print(f"❌ Component import failed: {e}")
-        return None
-
-
 def create_application():
     """Create and configure QApplication"""
     global app_instance
@@ -299,8 +273,9 @@ def connect_ui_logging():
             and hasattr(main_window_instance, "log_console")
         ):
 
-            logger_ui_handler.log_record_emitted.connect(
-                main_window_instance.log_console.add_log_message
+            # Records arrive in coalesced batches from the log listener thread
+            logger_ui_handler.log_batch_emitted.connect(
+                main_window_instance.log_console.add_log_messages
             )
             print("✅ UI logging connected")
 
@@ -319,6 +294,40 @@ def setup_signal_handlers():
 
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
+    install_signal_wakeup()
+
+
+def install_signal_wakeup():
+    """
+    Python only runs signal handlers between bytecodes, which never happens
+    while Qt sleeps in its event loop. Instead of polling with a timer, the
+    signal module writes to a socket that a QSocketNotifier watches, so the
+    loop wakes exactly when a signal arrives.
+    """
+    import socket
+    from PyQt6.QtCore import QSocketNotifier
+
+    try:
+        read_sock, write_sock = socket.socketpair()
+        for sock in (read_sock, write_sock):
+            sock.setblocking(False)
+        signal.set_wakeup_fd(write_sock.fileno())
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Signal wake-up unavailable: {e}")
+        return
+
+    def drain():
+        try:
+            read_sock.recv(64)
+        except OSError:
+            pass
+
+    notifier = QSocketNotifier(
+        read_sock.fileno(), QSocketNotifier.Type.Read, app_instance
+    )
+    notifier.activated.connect(drain)
+    # Keep the sockets and notifier alive as long as the application
+    app_instance._signal_wakeup = (read_sock, write_sock, notifier)
 
 
 def cleanup_application():
@@ -366,6 +375,28 @@ def cleanup_application():
         print(f"❌ Cleanup error: {e}")
 
 
+def start_deferred_services():
+    """Work that can wait until the window has painted"""
+    try:
+        from utils.lazy_imports import warm_up
+        from utils.startup_profile import get_startup_timer
+
+        timer = get_startup_timer()
+        timer.mark("first paint")
+        print(timer.report())
+
+        if controller_instance and hasattr(
+            controller_instance, "start_background_services"
+        ):
+            controller_instance.start_background_services()
+
+        # Import pandas/SQLAlchemy/requests before the user needs them
+        warm_up()
+
+    except Exception as e:
+        print(f"⚠️ Deferred startup failed: {e}")
+
+
 def run_application():
     """Run the main application event loop"""
     try:
@@ -376,10 +407,14 @@ def run_application():
         main_window_instance.show()
         print("🚀 Application started successfully")
 
-        # Process events timer
-        timer = QTimer()
-        timer.timeout.connect(lambda: None)
-        timer.start(100)
+        # Animations and repaint timers idle while the window is minimised
+        # or the application is in the background
+        from ui.render_budget import get_render_budget
+
+        get_render_budget().watch(main_window_instance)
+
+        # Runs once the event loop has painted the window
+        QTimer.singleShot(0, start_deferred_services)
 
         # Run event loop
         exit_code = app_instance.exec()
@@ -414,6 +449,9 @@ def main():
 
     try:
         print("🚀 Starting DENSO Neural Matrix 2025...")
+        from utils.startup_profile import get_startup_timer
+
+        startup_timer = get_startup_timer()
 
         # Setup environment
         if not setup_environment():
@@ -424,6 +462,7 @@ def main():
         if not create_application():
             handle_startup_error("QApplication creation failed")
             return exit_code
+        startup_timer.mark("QApplication")
 
         # Apply modern theme
         try:
@@ -433,6 +472,7 @@ def main():
             print("✅ Modern theme applied")
         except Exception as e:
             print(f"⚠️ Theme application failed: {e}")
+        startup_timer.mark("theme")
 
         # Show splash screen
         splash = create_splash_screen()
@@ -443,16 +483,19 @@ def main():
         if not setup_logging():
             handle_startup_error("Logging system failed")
             return exit_code
+        startup_timer.mark("logging")
 
         # Create controller
         if not create_controller():
             handle_startup_error("Controller creation failed")
             return exit_code
+        startup_timer.mark("controller")
 
         # Create main window
         if not create_main_window():
             handle_startup_error("Main window creation failed")
             return exit_code
+        startup_timer.mark("main window")
 
         # Connect UI logging
         connect_ui_logging()
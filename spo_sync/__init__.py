@@ -0,0 +1 @@
+# spo_sync/__init__.py - Headless sync runner (no PyQt6 imports)
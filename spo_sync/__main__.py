@@ -0,0 +1,6 @@
+# spo_sync/__main__.py - Entry point for `python -m spo_sync`
+import sys
+
+from spo_sync.cli import main
+
+sys.exit(main())
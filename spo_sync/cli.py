@@ -0,0 +1,379 @@
+# spo_sync/cli.py - Headless command line runner for scheduled syncs
+"""
+Runs the sync core without Qt, for servers and schedulers.
+
+    python -m spo_sync list
+    python -m spo_sync run --job spo_to_sql
+    python -m spo_sync daemon --job nightly --interval 600
+    python -m spo_sync schedule            # run the jobs in sync_schedules
+                                           # (+ webhook syncs if webhook_enabled)
+    python -m spo_sync metrics --format prometheus
+    python -m spo_sync history --days 30
+    python -m spo_sync --profile sampling run --job spo_to_sql
+
+Only Qt-free modules may be imported here (connectors, controller.sync_core,
+controller.scheduler, controller.webhooks, utils.config_loader, utils.error_handling,
+utils.resilience).
+"""
+
+import argparse
+import json
+import logging
+import signal
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from connectors.connection_pool import ConnectorPool
+from controller.scheduler import JobScheduler, build_schedules, parse_schedule
+from controller.sync_core import (
+    SyncEvents,
+    SyncJob,
+    build_job_config,
+    list_jobs,
+    validate_sync_config,
+)
+from controller.webhooks import WebhookService, is_webhook_job, run_webhook_job
+from utils.config_loader import DEFAULT_CONFIG_PATH, Config, load_config
+from utils.metrics import metrics_to_prometheus
+from utils.profiling import PROFILING_MODES, profile_run
+from utils.progress import format_eta
+from utils.resilience import get_resilience
+from utils.run_history import get_run_history
+
+logger = logging.getLogger("spo_sync")
+
+LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "success": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_CONFIG_ERROR = 2
+
+
+class ConsoleEvents(SyncEvents):
+    """Writes sync events to the standard logging system"""
+
+    def __init__(self, job_name: str):
+        self.job_name = job_name
+        self._stats = {}
+
+    def on_progress_stats(self, stats: dict):
+        self._stats = stats
+
+    def on_progress(self, task_name: str, percentage: int, message: str):
+        # SyncJob already throttles updates to new percentages
+        rate = ""
+        if self._stats.get("rows_per_sec"):
+            rate = f" ({self._stats['rows_per_sec']:,.0f} rows/s"
+            if percentage < 100 and self._stats.get("eta_seconds") is not None:
+                rate += f", ETA {format_eta(self._stats['eta_seconds'])}"
+            rate += ")"
+        logger.info(f"[{self.job_name}] {task_name}: {percentage}% {message}{rate}")
+
+    def on_log(self, message: str, level: str):
+        logger.log(LOG_LEVELS.get(level, logging.INFO), f"[{self.job_name}] {message}")
+
+    def on_completed(self, success: bool, message: str, stats: dict):
+        level = logging.INFO if success else logging.ERROR
+        logger.log(
+            level,
+            f"[{self.job_name}] {'Completed' if success else 'Failed'}: {message} "
+            f"(records: {stats.get('total_records', 0)}, "
+            f"duration: {stats.get('duration_seconds', 0.0):.1f}s)",
+        )
+
+
+def create_pool(config: Config) -> ConnectorPool:
+    """Connector pool and retry settings matching the GUI configuration"""
+    get_resilience().configure(config)
+    return ConnectorPool(
+        max_per_key=getattr(config, "connection_pool_size", 2),
+        idle_ttl_seconds=getattr(config, "connection_idle_ttl", 900),
+        acquire_timeout=getattr(config, "connection_timeout", 30),
+    )
+
+
+def run_job(config: Config, job_name: str, pool: ConnectorPool) -> int:
+    """Run one named job to completion and return an exit code"""
+    if is_webhook_job(job_name):
+        success = run_webhook_job(
+            config, job_name, events=ConsoleEvents(job_name), connection_manager=pool
+        )
+        return EXIT_OK if success else EXIT_FAILED
+
+    try:
+        job_config, direction = build_job_config(config, job_name)
+    except KeyError as e:
+        logger.error(str(e).strip("'\""))
+        return EXIT_CONFIG_ERROR
+
+    errors = validate_sync_config(job_config, direction)
+    if errors:
+        for error_msg in errors:
+            logger.error(f"[{job_name}] Config error: {error_msg}")
+        return EXIT_CONFIG_ERROR
+
+    job = SyncJob(
+        job_config, direction, events=ConsoleEvents(job_name), connection_manager=pool
+    )
+    with profile_run(job_config, job_name) as profiler:
+        success, _, stats = job.run()
+        profiler.run_id = stats.get("run_id")
+    return EXIT_OK if success else EXIT_FAILED
+
+
+def cmd_list(config: Config, args) -> int:
+    for name, job in list_jobs(config).items():
+        description = job.get("description", "")
+        print(f"{name:<24} {job.get('direction', 'spo_to_sql'):<12} {description}")
+    return EXIT_OK
+
+
+def cmd_run(config: Config, args) -> int:
+    pool = create_pool(config)
+    try:
+        exit_code = EXIT_OK
+        for job_name in args.job:
+            exit_code = max(exit_code, run_job(config, job_name, pool))
+        return exit_code
+    finally:
+        pool.close()
+
+
+def cmd_daemon(config: Config, args) -> int:
+    interval = args.interval or getattr(config, "sync_interval", 600)
+    stop_event = threading.Event()
+
+    def request_stop(signum, frame):
+        logger.info(f"Received signal {signum}, stopping after the current job")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    pool = create_pool(config)
+    logger.info(f"Daemon started: jobs={args.job}, interval={interval}s")
+    try:
+        while not stop_event.is_set():
+            for job_name in args.job:
+                if stop_event.is_set():
+                    break
+                run_job(config, job_name, pool)
+            pool.prune_idle()
+            stop_event.wait(interval)
+    finally:
+        pool.close()
+        logger.info("Daemon stopped")
+    return EXIT_OK
+
+
+def cmd_schedule(config: Config, args) -> int:
+    schedules = build_schedules(config)
+    use_webhooks = getattr(config, "webhook_enabled", False)
+    if not schedules and not use_webhooks:
+        logger.error("No schedules configured (sync_schedules / auto_sync_enabled)")
+        return EXIT_CONFIG_ERROR
+
+    if args.show:
+        now = time.time()
+        for name, spec in schedules.items():
+            schedule = parse_schedule(spec["schedule"], anchor=now)
+            ticks, tick = [], now
+            for _ in range(3):
+                tick = schedule.next_after(tick)
+                ticks.append(datetime.fromtimestamp(tick).strftime("%Y-%m-%d %H:%M"))
+            print(f"{name:<24} {str(schedule):<20} next: {', '.join(ticks)}")
+        return EXIT_OK
+
+    stop_event = threading.Event()
+
+    def request_stop(signum, frame):
+        logger.info(f"Received signal {signum}, stopping scheduler")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    pool = create_pool(config)
+    scheduler = JobScheduler(
+        lambda job_name: run_job(config, job_name, pool) == EXIT_OK,
+        max_workers=getattr(config, "scheduler_max_workers", 2),
+        state_file=getattr(config, "scheduler_state_file", None),
+    )
+    scheduler.configure(schedules)
+    scheduler.start()
+
+    webhooks = None
+    if use_webhooks:
+        try:
+            webhooks = WebhookService(
+                config, lambda job_name: scheduler.run_on_demand(job_name, 10)
+            )
+            webhooks.start()
+        except OSError as e:
+            logger.error(f"Webhook receiver could not start: {e}")
+            webhooks = None
+
+    try:
+        while not stop_event.wait(60):
+            pool.prune_idle()
+    finally:
+        if webhooks:
+            webhooks.stop()
+        scheduler.stop()
+        pool.close()
+    return EXIT_OK
+
+
+def cmd_metrics(config: Config, args) -> int:
+    history = get_run_history(getattr(config, "run_history_file", None))
+    run = history.get_run(args.run)
+    if run is None:
+        print(f"No recorded run{f' {args.run}' if args.run else 's'}")
+        return EXIT_FAILED
+
+    if args.format == "prometheus":
+        summary = {
+            "duration_seconds": run["duration_seconds"] or 0,
+            "rows_per_sec": run["rows_per_sec"] or 0,
+            "total_records": run["total_records"] or 0,
+            "success": int(run["success"]),
+        }
+        output = metrics_to_prometheus(
+            run["metrics"], {"direction": run["direction"] or ""}, summary=summary
+        )
+    else:
+        output = json.dumps(run, indent=2, default=str) + "\n"
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(output, encoding="utf-8")
+    else:
+        sys.stdout.write(output)
+    return EXIT_OK
+
+
+def cmd_history(config: Config, args) -> int:
+    history = get_run_history(getattr(config, "run_history_file", None))
+    stats = history.duration_percentiles(args.last, args.direction)
+    if not stats["runs"]:
+        print("No successful runs recorded")
+        return EXIT_OK
+
+    print(
+        f"Last {stats['runs']} successful runs: duration p50 "
+        f"{format_eta(stats['p50_duration'])} p95 {format_eta(stats['p95_duration'])}, "
+        f"rows/s p50 {stats['p50_rows_per_sec'] or 0:,.0f}"
+    )
+    print()
+    print(f"{'day':<12} {'runs':>5} {'failed':>7} {'avg rows/s':>11} {'avg time':>9}")
+    for day in history.throughput_trend(args.days, args.direction):
+        print(
+            f"{day['day']:<12} {day['runs']:>5} {day['failures']:>7} "
+            f"{day['avg_rows_per_sec']:>11,.0f} {format_eta(day['avg_duration']):>9}"
+        )
+    return EXIT_OK
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="spo_sync", description="Headless SharePoint <-> SQL sync runner"
+    )
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=DEFAULT_CONFIG_PATH,
+        help=f"configuration file (default: {DEFAULT_CONFIG_PATH})",
+    )
+    parser.add_argument(
+        "--log-level", default=None, help="override log_level from the configuration"
+    )
+    parser.add_argument("--log-file", type=Path, help="also write logs to this file")
+    parser.add_argument(
+        "--profile",
+        choices=PROFILING_MODES + ("off",),
+        help="profile each run (reports go to profiling_dir)",
+    )
+
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="list configured sync jobs").set_defaults(
+        handler=cmd_list
+    )
+
+    run = commands.add_parser("run", help="run jobs once and exit")
+    run.add_argument("--job", action="append", required=True, help="job name")
+    run.set_defaults(handler=cmd_run)
+
+    daemon = commands.add_parser("daemon", help="run jobs repeatedly")
+    daemon.add_argument("--job", action="append", required=True, help="job name")
+    daemon.add_argument(
+        "--interval", type=int, help="seconds between runs (default: sync_interval)"
+    )
+    daemon.set_defaults(handler=cmd_daemon)
+
+    schedule = commands.add_parser(
+        "schedule", help="run jobs on their sync_schedules (cron or interval)"
+    )
+    schedule.add_argument(
+        "--show", action="store_true", help="print the next run times and exit"
+    )
+    schedule.set_defaults(handler=cmd_schedule)
+
+    metrics = commands.add_parser("metrics", help="export metrics of a recorded run")
+    metrics.add_argument("--run", help="run ID (default: latest run)")
+    metrics.add_argument("--format", choices=("json", "prometheus"), default="json")
+    metrics.add_argument(
+        "--output", type=Path, help="write to a file (e.g. a textfile collector)"
+    )
+    metrics.set_defaults(handler=cmd_metrics)
+
+    history = commands.add_parser("history", help="run duration and throughput trend")
+    history.add_argument("--days", type=int, default=30)
+    history.add_argument("--last", type=int, default=100, help="runs for percentiles")
+    history.add_argument("--direction", choices=("spo_to_sql", "sql_to_spo"))
+    history.set_defaults(handler=cmd_history)
+
+    return parser
+
+
+def setup_logging(level_name: str, log_file: Path = None):
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if log_file:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        handlers.append(logging.FileHandler(log_file, encoding="utf-8"))
+
+    logging.basicConfig(
+        level=getattr(logging, str(level_name).upper(), logging.INFO),
+        format="%(asctime)s %(levelname)-8s %(name)s: %(message)s",
+        handlers=handlers,
+    )
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+
+    # Log config loading at INFO until the configured level is known
+    setup_logging(args.log_level or "INFO", args.log_file)
+    config = load_config(args.config)
+    if args.profile:
+        config.profiling_mode = args.profile
+    if not args.log_level:
+        logging.getLogger().setLevel(
+            getattr(logging, str(config.log_level).upper(), logging.INFO)
+        )
+
+    try:
+        return args.handler(config, args)
+    except KeyboardInterrupt:
+        logger.warning("Interrupted")
+        return 130
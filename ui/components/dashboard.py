@@ -3,13 +3,19 @@ from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
 import sys
+from collections import deque
 from pathlib import Path
+from datetime import datetime
 
 current_dir = Path(__file__).parent.absolute()
 project_root = current_dir.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+from utils.progress import format_eta
+from utils.run_history import get_run_history
+from ui.render_budget import get_render_budget
+
 try:
     from ui.styles.theme import ModernColors, Typography, BorderRadius, Spacing
     from ui.widgets.modern_button import ActionButton, IconButton
@@ -32,19 +38,27 @@ class StatusIndicator(QWidget):
         super().__init__(parent)
         self.status = "disconnected"
         self.size = size
+        self.opacity = 1.0
         self.setFixedSize(size, size)
 
-        # Pulse animation
-        self.pulse_animation = QPropertyAnimation(self, b"opacity")
+        # Pulse animation - painted opacity, idles with the render budget
+        self.pulse_animation = QVariantAnimation(self)
         self.pulse_animation.setDuration(1500)
         self.pulse_animation.setStartValue(0.3)
-        self.pulse_animation.setEndValue(1.0)
+        self.pulse_animation.setKeyValueAt(0.5, 1.0)
+        self.pulse_animation.setEndValue(0.3)
         self.pulse_animation.setLoopCount(-1)
         self.pulse_animation.setEasingCurve(QEasingCurve.Type.InOutSine)
+        self.pulse_animation.valueChanged.connect(self._set_opacity)
+
+    def _set_opacity(self, value):
+        self.opacity = value
+        self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setOpacity(self.opacity)
 
         colors = {
             "connected": ModernColors.SUCCESS,
@@ -60,11 +74,10 @@ class StatusIndicator(QWidget):
 
     def set_status(self, status):
         self.status = status
-        if status in ["connecting", "syncing"]:
-            self.pulse_animation.start()
-        else:
-            self.pulse_animation.stop()
-            self.setProperty("opacity", 1.0)
+        pulsing = status in ["connecting", "syncing"]
+        get_render_budget().set_running(self.pulse_animation, pulsing)
+        if not pulsing:
+            self.opacity = 1.0
         self.update()
 
 
@@ -308,6 +321,16 @@ class ProgressPanel(QWidget):
         self.progress_bar.setValue(0)
         layout.addWidget(self.progress_bar)
 
+        # Throughput / ETA
+        self.stats_label = QLabel("")
+        self.stats_label.setStyleSheet(
+            f"""
+            font-size: {Typography.TEXT_SM}px;
+            color: {ModernColors.TEXT_SECONDARY};
+        """
+        )
+        layout.addWidget(self.stats_label)
+
         # Card styling
         self.setStyleSheet(
             f"""
@@ -330,6 +353,21 @@ class ProgressPanel(QWidget):
             self.status_indicator.set_status("connected")
         else:
             self.status_indicator.set_status("disconnected")
+            self.stats_label.clear()
+
+    def update_stats(self, stats):
+        """Show rows done, rows/sec and ETA for the current task"""
+        parts = []
+        if stats.get("rows_done") is not None:
+            done = f"{stats['rows_done']:,}"
+            if stats.get("rows_total"):
+                done += f" / {stats['rows_total']:,}"
+            parts.append(f"{done} rows")
+        if stats.get("rows_per_sec"):
+            parts.append(f"{stats['rows_per_sec']:,.0f} rows/s")
+        if stats.get("eta_seconds") is not None and stats.get("percentage", 0) < 100:
+            parts.append(f"ETA {format_eta(stats['eta_seconds'])}")
+        self.stats_label.setText(" · ".join(parts))
 
 
 class SystemOverview(QWidget):
@@ -360,8 +398,8 @@ class SystemOverview(QWidget):
         grid.setSpacing(12)
 
         # Create metric cards
-        self.sp_card = MetricCard("SharePoint", "Disconnected")
-        self.db_card = MetricCard("Database", "Disconnected")
+        self.sp_card = MetricCard("SharePoint", "Disconnected", trend="Not checked")
+        self.db_card = MetricCard("Database", "Disconnected", trend="Not checked")
         self.sync_card = MetricCard("Last Sync", "Never")
         self.auto_sync_card = MetricCard("Auto Sync", "Disabled")
 
@@ -385,6 +423,113 @@ class SystemOverview(QWidget):
             self.cards[metric_type].update_value(value, status, trend)
 
 
+class ThroughputSparkline(QWidget):
+    """Rows/sec of the most recent runs as a painted line"""
+
+    def __init__(self, max_points=50, parent=None):
+        super().__init__(parent)
+        self.points = deque(maxlen=max_points)
+        self.setMinimumHeight(60)
+
+    def add_points(self, values):
+        self.points.extend(values)
+        self.update()
+
+    def paintEvent(self, event):
+        if len(self.points) < 2:
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(QColor(ModernColors.PRIMARY), 2))
+
+        peak = max(self.points) or 1.0
+        width, height = self.width() - 4, self.height() - 4
+        step = width / (len(self.points) - 1)
+        path = QPainterPath()
+        for i, value in enumerate(self.points):
+            point = QPointF(2 + i * step, 2 + height * (1 - value / peak))
+            if i == 0:
+                path.moveTo(point)
+            else:
+                path.lineTo(point)
+        painter.drawPath(path)
+
+
+class RunHistoryPanel(QWidget):
+    """Duration percentiles and rows/sec trend from the run-history store"""
+
+    def __init__(self, history=None, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self._last_id = 0
+        self._setup_ui()
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 16, 20, 16)
+        layout.setSpacing(12)
+
+        title = QLabel("Sync History")
+        title.setStyleSheet(
+            f"""
+            font-size: {Typography.TEXT_LG}px;
+            font-weight: {Typography.WEIGHT_SEMIBOLD};
+            color: {ModernColors.TEXT_PRIMARY};
+        """
+        )
+        layout.addWidget(title)
+
+        self.summary_label = QLabel("No runs recorded yet")
+        self.summary_label.setStyleSheet(
+            f"""
+            font-size: {Typography.TEXT_SM}px;
+            color: {ModernColors.TEXT_SECONDARY};
+        """
+        )
+        layout.addWidget(self.summary_label)
+
+        self.sparkline = ThroughputSparkline()
+        layout.addWidget(self.sparkline)
+
+        self.setStyleSheet(
+            f"""
+            QWidget {{
+                background: {ModernColors.SURFACE_SECONDARY};
+                border: 1px solid rgba(255, 255, 255, 0.1);
+                border-radius: {BorderRadius.MD}px;
+            }}
+        """
+        )
+
+    def refresh(self):
+        """Append runs recorded since the last refresh and update percentiles"""
+        if self.history is None:
+            return
+        try:
+            new_runs = self.history.runs_since(
+                self._last_id, limit=self.sparkline.points.maxlen
+            )
+            if not new_runs and self._last_id:
+                return
+            if new_runs:
+                self._last_id = new_runs[-1]["id"]
+                self.sparkline.add_points(
+                    run["rows_per_sec"] or 0.0 for run in new_runs if run["success"]
+                )
+
+            stats = self.history.duration_percentiles()
+            if not stats["runs"]:
+                return
+            self.summary_label.setText(
+                f"Last {stats['runs']} runs · duration p50 "
+                f"{format_eta(stats['p50_duration'])}, p95 "
+                f"{format_eta(stats['p95_duration'])} · "
+                f"{stats['p50_rows_per_sec'] or 0:,.0f} rows/s median"
+            )
+        except Exception as e:
+            self.summary_label.setText(f"Run history unavailable: {e}")
+
+
 class RecentActivity(QWidget):
     """Recent activity log display"""
 
@@ -525,8 +670,21 @@ class Dashboard(QWidget):
 
         layout.addLayout(middle_section)
 
+        # Bottom section - run history trend
+        self.history_panel = RunHistoryPanel(self._open_run_history())
+        layout.addWidget(self.history_panel)
+
         layout.addStretch()
 
+        # Query after the first paint
+        QTimer.singleShot(0, self.history_panel.refresh)
+
+    def _open_run_history(self):
+        config = getattr(self.controller, "config", None)
+        if not getattr(config, "run_history_enabled", True):
+            return None
+        return get_run_history(getattr(config, "run_history_file", None))
+
     def _connect_signals(self):
         """Connect internal signals"""
         self.actions_panel.sync_requested.connect(self.sync_requested.emit)
@@ -557,6 +715,22 @@ class Dashboard(QWidget):
         self.overview.update_metric("database", display, status_type)
         self.activity_panel.add_activity(f"Database: {display}", status_type)
 
+    def update_connection_health(self, service, health):
+        """Show cached probe latency and circuit state under a status card"""
+        if health.get("circuit") == "open":
+            detail = f"Circuit open ({health.get('consecutive_failures', 0)} failures)"
+        elif health.get("latency_ms") is not None:
+            detail = f"{health['latency_ms']:.0f} ms"
+            if health.get("last_check"):
+                checked = datetime.fromtimestamp(health["last_check"])
+                detail += f" · {checked.strftime('%H:%M:%S')}"
+        else:
+            detail = "Not checked"
+
+        card = self.overview.cards.get(service)
+        if card and hasattr(card, "trend_label"):
+            card.trend_label.setText(detail)
+
     def update_sync_status(self, status):
         self.overview.update_metric(
             "sync", status, "success" if status != "Never" else "neutral"
@@ -577,6 +751,12 @@ class Dashboard(QWidget):
         elif percentage == 0:
             self.activity_panel.add_activity(f"Started: {task}", "info")
 
+    def update_progress_stats(self, stats):
+        self.progress_panel.update_stats(stats)
+
+    def refresh_run_history(self):
+        self.history_panel.refresh()
+
     def update_current_task(self, task):
         self.progress_panel.task_label.setText(task)
         if task != "Ready" and task != "Idle":
@@ -613,12 +793,15 @@ class Dashboard(QWidget):
                 self.activity_panel.clear_activities()
 
             # Cleanup animations
+            budget = get_render_budget()
             for card in self.overview.cards.values():
                 if hasattr(card, "status_indicator"):
-                    card.status_indicator.pulse_animation.stop()
+                    budget.set_running(card.status_indicator.pulse_animation, False)
 
             if hasattr(self.progress_panel, "status_indicator"):
-                self.progress_panel.status_indicator.pulse_animation.stop()
+                budget.set_running(
+                    self.progress_panel.status_indicator.pulse_animation, False
+                )
 
             self.cleanup_done = True
 
@@ -15,8 +15,6 @@ if str(project_root) not in sys.path:
 try:
     from ui.styles.theme import ModernColors, Typography, BorderRadius
     from ui.components.dashboard import create_modern_dashboard
-    from ui.components.config_panel import create_config_panel
-    from ui.components.connection_form import create_connection_setup_widget
     from ui.widgets.cyber_log_console import LogConsoleWithControls
     from ui.widgets.modern_button import ActionButton
 except ImportError as e:
@@ -86,6 +84,27 @@ class ModernTabWidget(QTabWidget):
         )
 
 
+class LazyTab(QWidget):
+    """Tab placeholder that builds its content the first time it is shown"""
+
+    def __init__(self, factory, parent=None):
+        super().__init__(parent)
+        self._factory = factory
+        self.content = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    def ensure_built(self):
+        if self.content is None:
+            self.content = self._factory()
+            self.layout().addWidget(self.content)
+        return self.content
+
+    def showEvent(self, event):
+        self.ensure_built()
+        super().showEvent(event)
+
+
 class OptimizedMainWindow(QMainWindow):
     """Fixed 2025 Main Window with proper error handling and cleanup"""
 
@@ -94,6 +113,7 @@ class OptimizedMainWindow(QMainWindow):
         self.controller = controller
         self.cleanup_done = False
         self.dashboard = None
+        self.connection_setup = None
         self.config_panel = None
         self.log_console = None
 
@@ -154,13 +174,13 @@ class OptimizedMainWindow(QMainWindow):
             self.dashboard = create_modern_dashboard(self.controller)
             self.tab_widget.addTab(self.dashboard, "📊 Dashboard")
 
-            # Connection Setup tab (แยกออกจาก Config)
-            self.connection_setup = create_connection_setup_widget()
-            self.tab_widget.addTab(self.connection_setup, "🔗 Connections")
+            # Connection Setup tab (แยกออกจาก Config) - built on first view
+            self.tab_widget.addTab(
+                LazyTab(self._build_connection_setup), "🔗 Connections"
+            )
 
-            # Config tab (สำหรับ sync settings)
-            self.config_panel = create_config_panel(self.controller)
-            self.tab_widget.addTab(self.config_panel, "⚙️ Sync Settings")
+            # Config tab (สำหรับ sync settings) - built on first view
+            self.tab_widget.addTab(LazyTab(self._build_config_panel), "⚙️ Sync Settings")
 
             # Logs tab
             logs_widget = self._create_logs_tab()
@@ -175,6 +195,18 @@ class OptimizedMainWindow(QMainWindow):
         # Status bar
         self._setup_status_bar()
 
+    def _build_connection_setup(self):
+        from ui.components.connection_form import create_connection_setup_widget
+
+        self.connection_setup = create_connection_setup_widget()
+        return self.connection_setup
+
+    def _build_config_panel(self):
+        from ui.components.config_panel import create_config_panel
+
+        self.config_panel = create_config_panel(self.controller)
+        return self.config_panel
+
     def _create_header(self):
         """Create modern header bar"""
         header = QWidget()
@@ -357,7 +389,9 @@ class OptimizedMainWindow(QMainWindow):
                 ("log_message", self._handle_log_message),
                 ("sharepoint_status_update", self._update_sharepoint_status),
                 ("database_status_update", self._update_database_status),
+                ("connection_health_update", self._update_connection_health),
                 ("progress_updated", self._handle_progress),
+                ("progress_stats", self._handle_progress_stats),
                 ("current_task_update", self._update_current_task),
                 ("sync_completed", self._handle_sync_completed),
             ]
@@ -409,6 +443,15 @@ class OptimizedMainWindow(QMainWindow):
         except Exception as e:
             logger.debug(f"Error updating SharePoint status: {e}")
 
+    @pyqtSlot(str, dict)
+    def _update_connection_health(self, service: str, health: dict):
+        """Update cached connection health details"""
+        try:
+            if self.dashboard and hasattr(self.dashboard, "update_connection_health"):
+                self.dashboard.update_connection_health(service, health)
+        except Exception as e:
+            logger.debug(f"Error updating connection health: {e}")
+
     @pyqtSlot(str)
     def _update_database_status(self, status: str):
         """Update database status"""
@@ -427,6 +470,15 @@ class OptimizedMainWindow(QMainWindow):
         except Exception as e:
             logger.debug(f"Error handling progress: {e}")
 
+    @pyqtSlot(dict)
+    def _handle_progress_stats(self, stats: dict):
+        """Handle throughput/ETA updates"""
+        try:
+            if self.dashboard and hasattr(self.dashboard, "update_progress_stats"):
+                self.dashboard.update_progress_stats(stats)
+        except Exception as e:
+            logger.debug(f"Error handling progress stats: {e}")
+
     @pyqtSlot(str)
     def _update_current_task(self, task: str):
         """Update current task"""
@@ -444,6 +496,8 @@ class OptimizedMainWindow(QMainWindow):
             status = "success" if success else "failed"
             if self.dashboard and hasattr(self.dashboard, "update_sync_status"):
                 self.dashboard.update_sync_status(status)
+            if self.dashboard and hasattr(self.dashboard, "refresh_run_history"):
+                self.dashboard.refresh_run_history()
         except Exception as e:
             logger.debug(f"Error handling sync completion: {e}")
 
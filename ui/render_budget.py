@@ -0,0 +1,122 @@
+# ui/render_budget.py - Idles decorative animations and timers while the UI is not seen
+"""
+Pulses, glows and other decorative repaints only run while the
+application has focus and the main window is visible and not minimised.
+Widgets pass their QTimer / QAbstractAnimation to set_running() instead of
+calling start()/stop() themselves: the budget starts them while the UI is
+active, pauses them when it goes idle and resumes the ones still wanted
+when the user comes back, so an unattended sync PC does no UI work at all.
+
+Functional timers (auto-sync, scheduler, health checks, cache cleanup)
+are not registered here and keep running.
+"""
+import logging
+from typing import Dict, List, Optional
+
+from PyQt6 import sip
+from PyQt6.QtCore import QAbstractAnimation, QEvent, QObject, Qt, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QApplication, QWidget
+
+logger = logging.getLogger(__name__)
+
+_WINDOW_EVENTS = (QEvent.Type.WindowStateChange, QEvent.Type.Show, QEvent.Type.Hide)
+
+
+def _resume(item: QObject):
+    if isinstance(item, QTimer):
+        if not item.isActive():
+            item.start()
+    elif item.state() == QAbstractAnimation.State.Paused:
+        item.resume()
+    elif item.state() == QAbstractAnimation.State.Stopped:
+        item.start()
+
+
+def _pause(item: QObject):
+    if isinstance(item, QTimer):
+        item.stop()
+    elif item.state() == QAbstractAnimation.State.Running:
+        item.pause()
+
+
+class RenderBudget(QObject):
+    """Runs registered timers and animations only while the UI is active"""
+
+    active_changed = pyqtSignal(bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._wanted: Dict[int, QObject] = {}
+        self._windows: List[QWidget] = []
+        app = QApplication.instance()
+        self._app_active = (
+            app is None
+            or app.applicationState() == Qt.ApplicationState.ApplicationActive
+        )
+        self._active = self._app_active
+        if app is not None:
+            app.applicationStateChanged.connect(self._on_application_state)
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def watch(self, window: QWidget):
+        """Count `window` being minimised or hidden as idle"""
+        window.installEventFilter(self)
+        self._windows.append(window)
+        self._update()
+
+    def set_running(self, item: QObject, running: bool):
+        """Start (once the UI is active) or stop a QTimer/QAbstractAnimation"""
+        if running:
+            self._wanted[id(item)] = item
+            if self._active:
+                _resume(item)
+        else:
+            self._wanted.pop(id(item), None)
+            item.stop()
+
+    def eventFilter(self, obj, event) -> bool:
+        if event.type() in _WINDOW_EVENTS:
+            self._update()
+        return False
+
+    def _on_application_state(self, state):
+        self._app_active = state == Qt.ApplicationState.ApplicationActive
+        self._update()
+
+    def _update(self):
+        self._windows = [w for w in self._windows if not sip.isdeleted(w)]
+        active = self._app_active and (
+            not self._windows
+            or any(w.isVisible() and not w.isMinimized() for w in self._windows)
+        )
+        if active == self._active:
+            return
+        self._active = active
+
+        for key, item in list(self._wanted.items()):
+            if sip.isdeleted(item):
+                del self._wanted[key]
+            elif active:
+                _resume(item)
+            else:
+                _pause(item)
+        logger.debug(
+            f"UI {'active' if active else 'idle'} - "
+            f"{len(self._wanted)} animations/timers "
+            f"{'resumed' if active else 'paused'}"
+        )
+        self.active_changed.emit(active)
+
+
+_render_budget: Optional[RenderBudget] = None
+
+
+def get_render_budget() -> RenderBudget:
+    """Returns the shared RenderBudget (created on first use, GUI thread only)."""
+    global _render_budget
+    if _render_budget is None or sip.isdeleted(_render_budget):
+        _render_budget = RenderBudget(QApplication.instance())
+    return _render_budget
@@ -1,7 +1,25 @@
 # ui/widgets/cyber_log_console.py - Modern 2025 Log Console
-from PyQt6.QtWidgets import QTextEdit, QVBoxLayout, QHBoxLayout, QWidget
-from PyQt6.QtCore import Qt, pyqtSlot, QTimer, pyqtSignal
-from PyQt6.QtGui import QFont, QTextCursor, QColor, QTextCharFormat
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QHBoxLayout,
+    QListView,
+    QPushButton,
+    QStyle,
+    QStyledItemDelegate,
+    QVBoxLayout,
+    QWidget,
+)
+from PyQt6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    QTimer,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QKeySequence
 from datetime import datetime
 from collections import deque
 import sys
@@ -25,202 +43,365 @@ except ImportError:
         WARNING = "#F59E0B"
 
 
+ALL_LEVELS = ["debug", "info", "warning", "error", "critical", "success"]
+
+LEVEL_ICONS = {
+    "debug": "🔍",
+    "info": "ℹ️",
+    "warning": "⚠️",
+    "error": "❌",
+    "critical": "🚨",
+    "success": "✅",
+}
+
+LEVEL_COLORS = {
+    "debug": ModernColors.TEXT_SECONDARY,
+    "info": ModernColors.TEXT_PRIMARY,
+    "warning": ModernColors.WARNING,
+    "error": ModernColors.ERROR,
+    "critical": ModernColors.ERROR,
+    "success": ModernColors.SUCCESS,
+}
+
+# Custom item data roles
+LevelRole = Qt.ItemDataRole.UserRole + 1
+TimeRole = Qt.ItemDataRole.UserRole + 2
+EntryRole = Qt.ItemDataRole.UserRole + 3
+
+
 class LogEntry:
     """Structured log entry"""
 
+    __slots__ = ("message", "level", "timestamp", "formatted_time")
+
     def __init__(self, message, level="info", timestamp=None):
         self.message = message
         self.level = level.lower()
         self.timestamp = timestamp or datetime.now()
         self.formatted_time = self.timestamp.strftime("%H:%M:%S.%f")[:-3]
 
-    def to_html(self):
-        """Convert to HTML with styling"""
-        icons = {
-            "debug": "🔍",
-            "info": "ℹ️",
-            "warning": "⚠️",
-            "error": "❌",
-            "critical": "🚨",
-            "success": "✅",
-        }
 
-        colors = {
-            "debug": ModernColors.TEXT_SECONDARY,
-            "info": ModernColors.TEXT_PRIMARY,
-            "warning": ModernColors.WARNING,
-            "error": ModernColors.ERROR,
-            "critical": ModernColors.ERROR,
-            "success": ModernColors.SUCCESS,
-        }
+class RingBuffer:
+    """Fixed-capacity buffer with O(1) append, popleft and index access"""
 
-        icon = icons.get(self.level, "•")
-        color = colors.get(self.level, ModernColors.TEXT_PRIMARY)
+    def __init__(self, capacity):
+        self.capacity = max(1, capacity)
+        self._items = [None] * self.capacity
+        self._start = 0
+        self._size = 0
 
-        return f"""
-        <div style="margin: 2px 0; padding: 4px 8px; border-left: 2px solid {color}20; background: rgba(255,255,255,0.02);">
-            <span style="color: {ModernColors.TEXT_SECONDARY}; font-size: 11px;">{self.formatted_time}</span>
-            <span style="color: {color}; margin: 0 8px;">{icon}</span>
-            <span style="color: {color};">{self.message}</span>
-        </div>
-        """
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        return self._items[(self._start + index) % self.capacity]
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield self[index]
+
+    def append(self, item):
+        if self._size == self.capacity:
+            self.popleft()
+        self._items[(self._start + self._size) % self.capacity] = item
+        self._size += 1
+
+    def popleft(self):
+        item = self._items[self._start]
+        self._items[self._start] = None
+        self._start = (self._start + 1) % self.capacity
+        self._size -= 1
+        return item
+
+    def clear(self):
+        self._items = [None] * self.capacity
+        self._start = 0
+        self._size = 0
+
+
+class LogListModel(QAbstractListModel):
+    """
+    Ring-buffer backed log model.
+    New entries are staged and flushed in one insert per timer tick, so
+    the view does a single layout pass no matter how many messages arrived.
+    """
+
+    def __init__(self, max_entries=5000, flush_interval_ms=50, parent=None):
+        super().__init__(parent)
+        self.entries = RingBuffer(max_entries)
+        # Entries beyond capacity would be evicted on flush anyway
+        self.pending = deque(maxlen=max_entries)
+        self.highlight = ""
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(flush_interval_ms)
+        self.flush_timer.timeout.connect(self.flush)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.entries)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.entries):
+            return None
+
+        entry = self.entries[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return entry.message
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"[{entry.formatted_time}] {entry.level.upper()}: {entry.message}"
+        if role == LevelRole:
+            return entry.level
+        if role == TimeRole:
+            return entry.formatted_time
+        if role == EntryRole:
+            return entry
+        return None
+
+    def add_entry(self, entry):
+        self.pending.append(entry)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush(self) -> int:
+        """Move staged entries into the buffer; returns the number added"""
+        if not self.pending:
+            return 0
+
+        new_entries = list(self.pending)
+        self.pending.clear()
+        capacity = self.entries.capacity
+
+        if len(new_entries) >= capacity:
+            self.beginResetModel()
+            self.entries.clear()
+            for entry in new_entries[-capacity:]:
+                self.entries.append(entry)
+            self.endResetModel()
+            return len(new_entries)
+
+        overflow = len(self.entries) + len(new_entries) - capacity
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self.entries.popleft()
+            self.endRemoveRows()
+
+        first = len(self.entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_entries) - 1)
+        for entry in new_entries:
+            self.entries.append(entry)
+        self.endInsertRows()
+        return len(new_entries)
+
+    def clear(self):
+        self.flush_timer.stop()
+        self.pending.clear()
+        self.beginResetModel()
+        self.entries.clear()
+        self.endResetModel()
+
+    def set_highlight(self, text):
+        self.highlight = (text or "").lower()
+        if len(self.entries):
+            self.dataChanged.emit(
+                self.index(0), self.index(len(self.entries) - 1), [EntryRole]
+            )
+
+
+class LogLevelFilterModel(QSortFilterProxyModel):
+    """Hides entries whose level is not selected"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.levels = set(ALL_LEVELS)
+
+    def set_levels(self, levels):
+        self.levels = set(levels or ALL_LEVELS)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if len(self.levels) == len(ALL_LEVELS):
+            return True
+        index = self.sourceModel().index(source_row, 0, source_parent)
+        return self.sourceModel().data(index, LevelRole) in self.levels
+
+
+class LogItemDelegate(QStyledItemDelegate):
+    """Paints one log line: time, level icon and message in the level colour"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.font = QFont(Typography.MONO_FONT, Typography.TEXT_SM)
+        self.time_font = QFont(Typography.MONO_FONT, Typography.TEXT_XS)
+        metrics = QFontMetrics(self.font)
+        self.row_height = metrics.height() + 8
+        self.time_width = QFontMetrics(self.time_font).horizontalAdvance("00:00:00.000")
+        self.icon_width = metrics.horizontalAdvance("🚨") + 8
+        self.secondary = QColor(ModernColors.TEXT_SECONDARY)
+        self.highlight = QColor(ModernColors.WARNING)
+        self.highlight.setAlpha(60)
+        self.colors = {level: QColor(color) for level, color in LEVEL_COLORS.items()}
+
+    def sizeHint(self, option, index):
+        size = super().sizeHint(option, index)
+        size.setHeight(self.row_height)
+        return size
+
+    def paint(self, painter, option, index):
+        entry = index.data(EntryRole)
+        if entry is None:
+            return
+
+        painter.save()
+        rect = option.rect.adjusted(8, 0, -8, 0)
+
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+        else:
+            model = index.model()
+            source = model.sourceModel() if hasattr(model, "sourceModel") else model
+            if source.highlight and source.highlight in entry.message.lower():
+                painter.fillRect(option.rect, self.highlight)
+
+        color = self.colors.get(entry.level, self.colors["info"])
+        align = Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft
+
+        painter.setFont(self.time_font)
+        painter.setPen(self.secondary)
+        painter.drawText(rect, align, entry.formatted_time)
+        rect.setLeft(rect.left() + self.time_width + 8)
+
+        painter.setFont(self.font)
+        painter.setPen(color)
+        painter.drawText(rect, align, LEVEL_ICONS.get(entry.level, "•"))
+        rect.setLeft(rect.left() + self.icon_width)
+
+        message = painter.fontMetrics().elidedText(
+            entry.message.replace("\n", " "), Qt.TextElideMode.ElideRight, rect.width()
+        )
+        painter.drawText(rect, align, message)
+        painter.restore()
 
 
-class ModernLogConsole(QTextEdit):
-    """2025 Modern Log Console with performance optimization"""
+class ModernLogConsole(QListView):
+    """
+    2025 Modern Log Console.
+    Virtualized list view: only visible rows are painted, so cost does not
+    grow with the number of buffered messages.
+    """
 
     log_cleared = pyqtSignal()
 
-    def __init__(self, max_entries=500, parent=None):
+    def __init__(self, max_entries=5000, parent=None):
         super().__init__(parent)
         self.max_entries = max_entries
-        self.entry_queue = deque(maxlen=1000)
-        self.batch_timer = QTimer(self)
-        self.batch_timer.setSingleShot(True)
-        self.batch_timer.timeout.connect(self._process_batch)
-        self.pending_entries = []
+        self.log_model = LogListModel(max_entries, parent=self)
+        self.filter_model = LogLevelFilterModel(self)
+        self.filter_model.setSourceModel(self.log_model)
+        self.setModel(self.filter_model)
+        self.setItemDelegate(LogItemDelegate(self))
+
+        self._stick_to_bottom = True
+        self.log_model.rowsAboutToBeInserted.connect(self._remember_scroll)
+        self.log_model.rowsInserted.connect(self._scroll_if_following)
 
         self._setup_ui()
         self._add_welcome_message()
 
+    @property
+    def entry_queue(self):
+        """Buffered entries, oldest first (kept for backward compatibility)"""
+        return self.log_model.entries
+
     def _setup_ui(self):
         """Setup console styling and properties"""
-        self.setReadOnly(True)
         self.setFont(QFont(Typography.MONO_FONT, Typography.TEXT_SM))
 
         # Modern styling
         self.setStyleSheet(
             f"""
-            QTextEdit {{
+            QListView {{
                 background: {ModernColors.SURFACE_PRIMARY};
                 color: {ModernColors.TEXT_PRIMARY};
                 border: 1px solid {ModernColors.GLASS_BORDER};
                 border-radius: {BorderRadius.MD}px;
                 padding: 12px;
-                font-family: "{Typography.MONO_FONT}", "Consolas", monospace;
-                font-size: {Typography.TEXT_SM}px;
-                line-height: 1.4;
                 selection-background-color: {ModernColors.PRIMARY};
             }}
         """
         )
 
-        # Performance optimizations
+        # Performance optimizations - every row has the same height, so the
+        # view can compute scroll geometry without measuring each item
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.LayoutMode.SinglePass)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.setWordWrapMode(self.WordWrapMode.WidgetWidth)
-
-        # Enable rich text
-        self.setHtml("")
 
     def _add_welcome_message(self):
         """Add initial welcome message"""
-        welcome_html = f"""
-        <div style="text-align: center; padding: 20px; color: {ModernColors.TEXT_SECONDARY};">
-            <h3 style="color: {ModernColors.PRIMARY}; margin: 0;">🚀 DENSO Neural Matrix</h3>
-            <p style="margin: 8px 0 0 0; font-size: 12px;">Log Console Initialized</p>
-            <hr style="border: 1px solid {ModernColors.GLASS_BORDER}; margin: 16px 0;">
-        </div>
-        """
-        self.setHtml(welcome_html)
+        self.log_model.add_entry(
+            LogEntry("🚀 DENSO Neural Matrix - Log Console Initialized", "info")
+        )
 
     @pyqtSlot(str, str)
     def add_log_message(self, message, level="info"):
-        """Add log message with batching for performance"""
+        """Stage a log message; the model flushes staged entries in batches"""
         if not message.strip():
             return
 
-        entry = LogEntry(message, level)
-        self.pending_entries.append(entry)
-
-        # Start batch timer if not active
-        if not self.batch_timer.isActive():
-            self.batch_timer.start(100)  # 100ms batch delay
-
-    def _process_batch(self):
-        """Process batched log entries"""
-        if not self.pending_entries:
-            return
-
-        # Process up to 10 entries at once
-        batch_size = min(10, len(self.pending_entries))
-        entries_to_process = []
+        self.log_model.add_entry(LogEntry(message, level))
 
-        for _ in range(batch_size):
-            if self.pending_entries:
-                entries_to_process.append(self.pending_entries.pop(0))
+    @pyqtSlot(list)
+    def add_log_messages(self, messages):
+        """Stage a batch of (message, level) pairs"""
+        for message, level in messages:
+            if message.strip():
+                self.log_model.add_entry(LogEntry(message, level))
 
-        # Add entries to console
-        for entry in entries_to_process:
-            self._append_entry(entry)
-            self.entry_queue.append(entry)
-
-        # Limit total entries
-        self._limit_entries()
-
-        # Auto-scroll to bottom
-        self._scroll_to_bottom()
-
-        # Continue processing if more entries pending
-        if self.pending_entries:
-            self.batch_timer.start(50)
-
-    def _append_entry(self, entry):
-        """Append single entry to console"""
-        cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.insertHtml(entry.to_html())
-
-    def _limit_entries(self):
-        """Limit number of entries for performance"""
-        if len(self.entry_queue) > self.max_entries:
-            # Remove old entries from display
-            excess = len(self.entry_queue) - self.max_entries
-            self._remove_old_entries(excess)
-
-    def _remove_old_entries(self, count):
-        """Remove old entries from top of console"""
-        try:
-            document = self.document()
-            cursor = QTextCursor(document)
-            cursor.movePosition(QTextCursor.MoveOperation.Start)
-
-            # Remove blocks from top
-            for _ in range(min(count, document.blockCount() - 1)):
-                cursor.select(QTextCursor.SelectionType.BlockUnderCursor)
-                cursor.removeSelectedText()
-                cursor.deleteChar()
-
-        except Exception:
-            pass  # Fail silently to prevent console errors
-
-    def _scroll_to_bottom(self):
-        """Auto-scroll to show latest entries"""
+    def _remember_scroll(self, *args):
         scrollbar = self.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        self._stick_to_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+
+    def _scroll_if_following(self, *args):
+        """Auto-scroll only if the user has not scrolled up"""
+        if self._stick_to_bottom:
+            self.scrollToBottom()
+
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.StandardKey.Copy):
+            rows = sorted(index.row() for index in self.selectedIndexes())
+            lines = [
+                self.model().index(row, 0).data(Qt.ItemDataRole.ToolTipRole)
+                for row in rows
+            ]
+            QApplication.clipboard().setText("\n".join(lines))
+            return
+        super().keyPressEvent(event)
 
     @pyqtSlot()
     def clear(self):
         """Clear console and reset state"""
-        self.entry_queue.clear()
-        self.pending_entries.clear()
-
-        if self.batch_timer.isActive():
-            self.batch_timer.stop()
-
-        super().clear()
+        self.log_model.clear()
         self._add_welcome_message()
         self.log_cleared.emit()
 
     def export_logs(self, file_path):
         """Export logs to file"""
         try:
+            self.log_model.flush()
             with open(file_path, "w", encoding="utf-8") as f:
                 f.write("DENSO Neural Matrix - Log Export\n")
                 f.write(f"Generated: {datetime.now().isoformat()}\n")
                 f.write("=" * 50 + "\n\n")
 
-                for entry in self.entry_queue:
+                for entry in self.log_model.entries:
                     f.write(
                         f"[{entry.formatted_time}] {entry.level.upper()}: {entry.message}\n"
                     )
@@ -232,71 +413,35 @@ class ModernLogConsole(QTextEdit):
     def get_stats(self):
         """Get console statistics"""
         level_counts = {}
-        for entry in self.entry_queue:
+        for entry in self.log_model.entries:
             level_counts[entry.level] = level_counts.get(entry.level, 0) + 1
 
         return {
-            "total_entries": len(self.entry_queue),
-            "pending_entries": len(self.pending_entries),
+            "total_entries": len(self.log_model.entries),
+            "pending_entries": len(self.log_model.pending),
             "level_distribution": level_counts,
-            "is_processing": self.batch_timer.isActive(),
+            "is_processing": self.log_model.flush_timer.isActive(),
         }
 
     def filter_by_level(self, levels):
         """Filter display by log levels"""
-        if not levels:
-            levels = ["debug", "info", "warning", "error", "critical", "success"]
-
-        filtered_html = f"""
-        <div style="text-align: center; padding: 20px; color: {ModernColors.TEXT_SECONDARY};">
-            <h3 style="color: {ModernColors.PRIMARY}; margin: 0;">🚀 DENSO Neural Matrix</h3>
-            <p style="margin: 8px 0 0 0; font-size: 12px;">Filtered Log View</p>
-            <hr style="border: 1px solid {ModernColors.GLASS_BORDER}; margin: 16px 0;">
-        </div>
-        """
-
-        for entry in self.entry_queue:
-            if entry.level in levels:
-                filtered_html += entry.to_html()
-
-        self.setHtml(filtered_html)
-        self._scroll_to_bottom()
+        self.filter_model.set_levels(levels)
+        self.scrollToBottom()
 
     def search_logs(self, query):
-        """Search logs and highlight results"""
+        """Highlight matching entries and jump to the first one"""
+        self.log_model.set_highlight(query)
         if not query:
             return
 
-        cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.Start)
-
-        # Clear previous highlights
-        self.setExtraSelections([])
-
-        # Find and highlight all occurrences
-        selections = []
-        while True:
-            cursor = self.document().find(query, cursor)
-            if cursor.isNull():
+        query = query.lower()
+        for row in range(self.filter_model.rowCount()):
+            index = self.filter_model.index(row, 0)
+            if query in index.data(Qt.ItemDataRole.DisplayRole).lower():
+                self.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtCenter)
+                self.setCurrentIndex(index)
                 break
 
-            # Create highlight format
-            format = QTextCharFormat()
-            format.setBackground(QColor(ModernColors.WARNING))
-            format.setForeground(QColor(ModernColors.SURFACE_PRIMARY))
-
-            # Add to selections
-            selection = self.ExtraSelection()
-            selection.cursor = cursor
-            selection.format = format
-            selections.append(selection)
-
-        self.setExtraSelections(selections)
-
-        # Move to first result
-        if selections:
-            self.setTextCursor(selections[0].cursor)
-
 
 class LogConsoleWithControls(QWidget):
     """Log console with control buttons"""
@@ -330,16 +475,19 @@ class LogConsoleWithControls(QWidget):
         level_layout.setSpacing(4)
 
         levels = [
-            ("🔍", "DEBUG", ModernColors.TEXT_SECONDARY),
-            ("ℹ️", "INFO", ModernColors.TEXT_PRIMARY),
-            ("⚠️", "WARN", ModernColors.WARNING),
-            ("❌", "ERROR", ModernColors.ERROR),
+            ("🔍", "DEBUG", ModernColors.TEXT_SECONDARY, ["debug"]),
+            ("ℹ️", "INFO", ModernColors.TEXT_PRIMARY, ["info", "success"]),
+            ("⚠️", "WARN", ModernColors.WARNING, ["warning"]),
+            ("❌", "ERROR", ModernColors.ERROR, ["error", "critical"]),
         ]
 
-        for icon, name, color in levels:
+        self.level_buttons = {}
+        for icon, name, color, level_names in levels:
             indicator = QPushButton(f"{icon} {name}")
             indicator.setCheckable(True)
             indicator.setChecked(True)
+            indicator.toggled.connect(self._apply_level_filter)
+            self.level_buttons[indicator] = level_names
             indicator.setStyleSheet(
                 f"""
                 QPushButton {{
@@ -388,6 +536,26 @@ class LogConsoleWithControls(QWidget):
         self.clear_btn.clicked.connect(self.console.clear)
         self.export_btn.clicked.connect(self._export_logs)
 
+    @pyqtSlot(str, str)
+    def add_log_message(self, message, level="info"):
+        """Forward to the console (used by the UI logging handler)"""
+        self.console.add_log_message(message, level)
+
+    @pyqtSlot(list)
+    def add_log_messages(self, messages):
+        """Forward a batch of (message, level) pairs to the console"""
+        self.console.add_log_messages(messages)
+
+    def _apply_level_filter(self, *args):
+        levels = [
+            level
+            for button, level_names in self.level_buttons.items()
+            if button.isChecked()
+            for level in level_names
+        ]
+        # An empty selection would hide everything, including new errors
+        self.console.filter_by_level(levels or None)
+
     def _export_logs(self):
         """Export logs to file"""
         from PyQt6.QtWidgets import QFileDialog
@@ -27,18 +27,12 @@ class ModernLineEdit(QLineEdit):
         super().__init__(parent)
         self.setPlaceholderText(placeholder)
         self._setup_style()
-        self._setup_animations()
 
     def _setup_style(self):
         self.setStyleSheet(get_input_style())
         self.setFont(QFont(Typography.PRIMARY_FONT, Typography.TEXT_BASE))
         self.setMinimumHeight(40)
 
-    def _setup_animations(self):
-        self.focus_animation = QPropertyAnimation(self, b"styleSheet")
-        self.focus_animation.setDuration(200)
-        self.focus_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-
     def set_error(self, has_error=True):
         if has_error:
             self.setStyleSheet(
@@ -1,6 +1,13 @@
 # ui/widgets/holographic_progress_bar.py - Modern 2025 Progress Bar
 from PyQt6.QtWidgets import QProgressBar, QWidget, QVBoxLayout, QHBoxLayout, QLabel
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal
+from PyQt6.QtCore import (
+    Qt,
+    QPropertyAnimation,
+    QVariantAnimation,
+    QEasingCurve,
+    QRectF,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QPainter, QLinearGradient, QColor, QFont, QPen
 import sys
 from pathlib import Path
@@ -10,6 +17,8 @@ project_root = current_dir.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+from ui.render_budget import get_render_budget
+
 try:
     from ui.styles.theme import ModernColors, Typography, BorderRadius
 except ImportError:
@@ -25,6 +34,7 @@ class ModernProgressBar(QProgressBar):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.glow = 0.0
         self._setup_style()
         self._setup_animations()
 
@@ -63,26 +73,45 @@ class ModernProgressBar(QProgressBar):
 
     def _setup_animations(self):
         """Setup progress animations"""
-        self.glow_animation = QPropertyAnimation(self, b"styleSheet")
+        # The glow is painted over the bar - animating the stylesheet would
+        # re-polish the widget on every frame
+        self.glow_animation = QVariantAnimation(self)
         self.glow_animation.setDuration(1500)
+        self.glow_animation.setStartValue(0.0)
+        self.glow_animation.setKeyValueAt(0.5, 1.0)
+        self.glow_animation.setEndValue(0.0)
         self.glow_animation.setLoopCount(-1)
         self.glow_animation.setEasingCurve(QEasingCurve.Type.InOutSine)
+        self.glow_animation.valueChanged.connect(self._set_glow)
 
-    def start_glow_animation(self):
-        """Start glowing animation for active progress"""
-        normal_style = self.styleSheet()
-        glow_style = normal_style.replace(
-            f"border: none;", f"border: 1px solid {ModernColors.PRIMARY};"
+    def _set_glow(self, value):
+        self.glow = value
+        self.update()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.glow <= 0:
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        color = QColor(ModernColors.PRIMARY)
+        color.setAlphaF(self.glow)
+        painter.setPen(QPen(color, 1))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRoundedRect(
+            QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5),
+            BorderRadius.SM,
+            BorderRadius.SM,
         )
 
-        self.glow_animation.setKeyValueAt(0, normal_style)
-        self.glow_animation.setKeyValueAt(0.5, glow_style)
-        self.glow_animation.setKeyValueAt(1, normal_style)
-        self.glow_animation.start()
+    def start_glow_animation(self):
+        """Start glowing animation for active progress"""
+        get_render_budget().set_running(self.glow_animation, True)
 
     def stop_glow_animation(self):
         """Stop glowing animation"""
-        self.glow_animation.stop()
+        get_render_budget().set_running(self.glow_animation, False)
+        self._set_glow(0.0)
 
 
 class CircularProgressBar(QWidget):
@@ -1,6 +1,6 @@
 # ui/widgets/status_card.py - Modern 2025 Status Card
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QPainter, QColor
 import sys
 from pathlib import Path
@@ -10,6 +10,8 @@ project_root = current_dir.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+from ui.render_budget import get_render_budget
+
 try:
     from ui.styles.theme import ModernColors, Typography, BorderRadius
 except ImportError:
@@ -31,7 +33,8 @@ class StatusDot(QWidget):
         self.setFixedSize(size + 4, size + 4)
 
         self.pulse_timer = QTimer(self)
-        self.pulse_timer.timeout.connect(self.update)
+        self.pulse_timer.setInterval(50)
+        self.pulse_timer.timeout.connect(self._update_pulse)
         self.pulse_value = 0
 
     def paintEvent(self, event):
@@ -69,19 +72,20 @@ class StatusDot(QWidget):
 
     def set_status(self, status):
         self.status = status
-        if status in ["connecting", "syncing"]:
-            self.pulse_timer.start(50)
-        else:
-            self.pulse_timer.stop()
+        pulsing = status in ["connecting", "syncing"]
+        # The timer only ticks while the window is on screen and focused
+        get_render_budget().set_running(self.pulse_timer, pulsing)
+        if not pulsing:
             self.pulse_value = 0
         self.update()
 
     def _update_pulse(self):
         self.pulse_value = (self.pulse_value + 0.1) % 1.0
+        self.update()
 
 
 class ModernStatusCard(QWidget):
-    """2025 Modern status card with animations"""
+    """2025 Modern status card (hover styling comes from the stylesheet)"""
 
     status_clicked = pyqtSignal(str)
 
@@ -90,7 +94,6 @@ class ModernStatusCard(QWidget):
         self.title = title
         self.status = initial_status
         self._setup_ui()
-        self._setup_animations()
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -139,12 +142,6 @@ class ModernStatusCard(QWidget):
         self.setMinimumHeight(70)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
-    def _setup_animations(self):
-        # Hover animation
-        self.hover_animation = QPropertyAnimation(self, b"styleSheet")
-        self.hover_animation.setDuration(200)
-        self.hover_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-
     def _format_status(self, status):
         status_map = {
             "connected": "Connected",
@@ -1,14 +1,17 @@
 # utils/auth_helper.py - Fixed SharePoint Authentication Helper
-import requests
 import time
-from typing import Optional
+from typing import Optional, Tuple
 import logging
 from urllib.parse import urlparse
 
-from utils.config_manager import Config
+from utils.config_loader import Config
+from utils.lazy_imports import lazy_module
+from utils.metrics import current_metrics
 
 logger = logging.getLogger(__name__)
 
+requests = lazy_module("requests")  # imported on first request
+
 
 class SharePointAuth:
     """
@@ -61,7 +64,8 @@ class SharePointAuth:
 
             # Request new token
             logger.info("Requesting new SharePoint access token")
-            return self._request_new_token()
+            with current_metrics().span("auth"):
+                return self._request_new_token()
 
         except Exception as e:
             logger.error(f"Failed to get access token: {e}")
@@ -77,30 +81,35 @@ class SharePointAuth:
         buffer_time = 300  # 5 minutes
         return time.time() < (self.token_expiry - buffer_time)
 
+    def _token_request(self) -> Tuple[str, dict]:
+        """Token endpoint and form payload (ACS app-only for SharePoint)"""
+        # Extract domain from SharePoint site URL
+        site_url = self.config.sharepoint_site
+        parsed_url = urlparse(site_url)
+        domain = parsed_url.netloc
+
+        if not domain:
+            raise ValueError(f"Invalid SharePoint site URL: {site_url}")
+
+        # Build token endpoint URL
+        tenant_id = self.config.tenant_id
+        token_url = getattr(self.config, "sharepoint_token_url", "") or (
+            f"https://accounts.accesscontrol.windows.net/{tenant_id}/tokens/OAuth/2"
+        )
+
+        # Prepare authentication payload
+        payload = {
+            "grant_type": "client_credentials",
+            "client_id": f"{self.config.sharepoint_client_id}@{tenant_id}",
+            "client_secret": self.config.sharepoint_client_secret,
+            "resource": f"00000003-0000-0ff1-ce00-000000000000/{domain}@{tenant_id}",
+        }
+        return token_url, payload
+
     def _request_new_token(self) -> Optional[str]:
         """Request new access token from Azure AD"""
         try:
-            # Extract domain from SharePoint site URL
-            site_url = self.config.sharepoint_site
-            parsed_url = urlparse(site_url)
-            domain = parsed_url.netloc
-
-            if not domain:
-                raise ValueError(f"Invalid SharePoint site URL: {site_url}")
-
-            # Build token endpoint URL
-            tenant_id = self.config.tenant_id
-            token_url = (
-                f"https://accounts.accesscontrol.windows.net/{tenant_id}/tokens/OAuth/2"
-            )
-
-            # Prepare authentication payload
-            payload = {
-                "grant_type": "client_credentials",
-                "client_id": f"{self.config.sharepoint_client_id}@{tenant_id}",
-                "client_secret": self.config.sharepoint_client_secret,
-                "resource": f"00000003-0000-0ff1-ce00-000000000000/{domain}@{tenant_id}",
-            }
+            token_url, payload = self._token_request()
 
             # Request headers
             headers = {
@@ -301,3 +310,24 @@ class SharePointAuth:
             f"is_valid={info['is_valid']}, "
             f"expires_in={info['expires_in_seconds']:.0f}s)"
         )
+
+
+class GraphAuth(SharePointAuth):
+    """Client-credentials token for Microsoft Graph (same app registration)"""
+
+    def _token_request(self) -> Tuple[str, dict]:
+        tenant_id = self.config.tenant_id
+        token_url = getattr(self.config, "graph_token_url", "") or (
+            f"https://login.microsoftonline.com/{tenant_id}/oauth2/v2.0/token"
+        )
+        payload = {
+            "grant_type": "client_credentials",
+            "client_id": self.config.sharepoint_client_id,
+            "client_secret": self.config.sharepoint_client_secret,
+            "scope": "https://graph.microsoft.com/.default",
+        }
+        return token_url, payload
+
+    def test_token(self) -> bool:
+        """Graph tokens are checked by GraphListConnector.test_connection"""
+        return bool(self.token) and self._is_token_valid()
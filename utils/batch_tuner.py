@@ -0,0 +1,125 @@
+# utils/batch_tuner.py - Adaptive batch sizes for database and SharePoint transfers
+import logging
+import statistics
+from typing import Optional
+
+from utils.metrics import current_metrics
+from utils.ttl_cache import TTLCache, get_ttl_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TUNING_FILE = "data/batch_tuning.json"
+TUNING_TTL = 30 * 24 * 3600  # learned sizes older than this are re-learned
+
+
+class BatchTuner:
+    """
+    Hill-climbing controller for one target's batch size.
+
+    Callers read `size`, send a batch and report it with record(). After
+    `window` full-size batches the median rows/sec is compared with the
+    best size so far: the size keeps moving (x step) while throughput
+    improves and turns back with a smaller step once it drops, settling
+    on the best size. backoff() halves the size at once for timeouts and
+    throttling. save() stores the best size, which the next run starts
+    from.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        store: Optional[TTLCache] = None,
+        step: float = 2.0,
+        window: int = 3,
+    ):
+        self.key = key
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.store = store
+        self.window = window
+        saved = store.get(key) if store else None
+        self.size = self._clamp(saved["size"] if saved else initial)
+        self._step = step
+        self._direction = 1
+        self._samples = []
+        self._best_size = None
+        self._best_rate = None
+        self._settled = self.minimum == self.maximum
+
+    def _clamp(self, size: float) -> int:
+        return int(min(self.maximum, max(self.minimum, round(size))))
+
+    def record(self, rows: int, seconds: float):
+        """Report one batch of `rows` that took `seconds`"""
+        # Partial (tail) batches say little about the current size
+        if self._settled or seconds <= 0 or rows < self.size * 0.5:
+            return
+        self._samples.append(rows / seconds)
+        if len(self._samples) < self.window:
+            return
+
+        rate = statistics.median(self._samples)
+        self._samples.clear()
+        if self._best_rate is None or rate > self._best_rate:
+            self._best_size, self._best_rate = self.size, rate
+        else:
+            # Worse than the best: go back and probe the other side, closer
+            self._direction = -self._direction
+            self._step = self._step**0.5
+            self.size = self._best_size
+            if self._step < 1.1:
+                self._settled = True
+                logger.debug(f"Batch size for {self.key} settled at {self.size}")
+                return
+        self._move()
+
+    def _move(self):
+        size = self._clamp(self.size * self._step**self._direction)
+        if size == self.size:
+            # At a limit: try the other direction once, then stay
+            self._direction = -self._direction
+            size = self._clamp(self.size * self._step**self._direction)
+            if size == self._best_size or size == self.size:
+                self._settled = True
+                return
+        self.size = size
+
+    def backoff(self):
+        """Halve the size after a timeout or throttling response"""
+        self.size = self._clamp(self.size / 2)
+        self._best_size, self._best_rate = self.size, None
+        self._direction = 1
+        self._step = max(self._step**0.5, 1.25)
+        self._samples.clear()
+        self._settled = self.minimum == self.maximum
+        current_metrics().incr("batch_backoffs")
+        logger.info(f"Backing off batch size for {self.key} to {self.size}")
+
+    def save(self):
+        """Persist the best size found for the next run"""
+        if self.store is None or self.minimum == self.maximum:
+            return
+        best = self._best_size or self.size
+        self.store.set(
+            self.key,
+            {"size": best, "rows_per_sec": round(self._best_rate or 0.0, 1)},
+        )
+
+
+def get_batch_tuner(
+    config, key: str, initial: int, minimum: int, maximum: int
+) -> BatchTuner:
+    """
+    A tuner for `key` seeded from the tuning file; with adaptive_batching
+    off it is pinned to `initial` (clamped to the limits).
+    """
+    if not getattr(config, "adaptive_batching", True):
+        fixed = int(min(maximum, max(minimum, initial)))
+        return BatchTuner(key, fixed, fixed, fixed)
+    store = get_ttl_cache(
+        getattr(config, "batch_tuning_file", DEFAULT_TUNING_FILE), TUNING_TTL
+    )
+    return BatchTuner(key, initial, minimum, maximum, store)
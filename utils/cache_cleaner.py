@@ -1,12 +1,13 @@
 # utils/cache_cleaner.py - Fixed Cache Cleaner
 import os
+import re
 import shutil
+import threading
 import time
 import logging
-import glob
 from pathlib import Path
-from typing import List, Dict
-from PyQt6.QtCore import pyqtSignal, QTimer, QObject, pyqtSlot
+from typing import Callable, List, Dict, Optional, Tuple
+from PyQt6.QtCore import pyqtSignal, QTimer, QObject, QThread, pyqtSlot
 
 from utils.config_manager import ConfigManager
 
@@ -25,6 +26,229 @@ class CacheCleanupResult:
         self.cache_types_cleaned = []
 
 
+class CacheScanResult:
+    """Cache entries found by one CacheScanner pass"""
+
+    def __init__(self, cache_types: List[str]):
+        # cache type -> [(path, is_dir, size in bytes)]
+        self.entries: Dict[str, List[Tuple[str, bool, int]]] = {
+            cache_type: [] for cache_type in cache_types
+        }
+        self.dirs_scanned = 0
+        self.dirs_reused = 0
+        self.complete = True
+        self.duration = 0.0
+
+    def sizes_mb(self) -> Dict[str, float]:
+        return {
+            cache_type: sum(size for _, _, size in entries) / (1024 * 1024)
+            for cache_type, entries in self.entries.items()
+        }
+
+
+class _IndexedDir:
+    """One directory as seen by the last scan, reused while its mtime holds"""
+
+    __slots__ = ("mtime_ns", "owned", "subdirs", "matches", "file_bytes")
+
+    def __init__(self, mtime_ns: int, owned: bool):
+        self.mtime_ns = mtime_ns
+        self.owned = owned  # inside a matched cache directory
+        self.subdirs: List[str] = []
+        self.matches: List[Tuple[str, bool, str]] = []  # name, is_dir, type
+        self.file_bytes = 0  # owned directories: size of the files in it
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """
+    Translate a recursive glob pattern (relative to the root) to a regex.
+    Like glob.glob, wildcards do not match a leading dot, so hidden files
+    and directories are only matched by patterns that name the dot.
+    """
+    out, i = [], 0
+    while i < len(pattern):
+        component_start = i == 0 or pattern[i - 1] == "/"
+        if pattern.startswith("**/", i):
+            out.append("(?:[^/.][^/]*/)*")
+            i += 3
+        elif pattern[i] == "*":
+            out.append("(?!\\.)[^/]*" if component_start else "[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/.]" if component_start else "[^/]")
+            i += 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(out)
+
+
+class CacheScanner:
+    """
+    Single os.scandir pass over the project tree. Excluded directories are
+    pruned, each entry is classified against all cache patterns with one
+    combined regex, and a matched directory is sized as a whole without
+    being matched further.
+
+    Directory listings are indexed by mtime, so a repeat scan only lists
+    directories that changed; matched files are re-stat'ed every scan
+    (logs grow in place), files inside cache directories are not.
+    """
+
+    def __init__(self, root: Path, cache_patterns: Dict[str, List[str]], exclude_paths):
+        self.root = str(root)
+        self.exclude_paths = set(exclude_paths)
+        self.cache_types = list(cache_patterns)
+        self.last_result: Optional[CacheScanResult] = None
+        self._index: Dict[str, _IndexedDir] = {}
+        self._lock = threading.Lock()
+
+        file_groups, dir_groups = [], []
+        for i, patterns in enumerate(cache_patterns.values()):
+            # "dir/**" matches the directory itself (and so its contents)
+            files = [_glob_to_regex(p) for p in patterns if not p.endswith("/**")]
+            dirs = [
+                _glob_to_regex(p[:-3] if p.endswith("/**") else p) for p in patterns
+            ]
+            if files:
+                file_groups.append(f"(?P<t{i}>{'|'.join(files)})")
+            dir_groups.append(f"(?P<t{i}>{'|'.join(dirs)})")
+        flags = re.IGNORECASE if os.name == "nt" else 0
+        self._file_re = re.compile("|".join(file_groups) or "(?!)", flags)
+        self._dir_re = re.compile("|".join(dir_groups) or "(?!)", flags)
+
+    def scan(
+        self,
+        progress: Callable[[int, int], None] = None,
+        should_stop: Callable[[], bool] = None,
+    ) -> CacheScanResult:
+        """
+        Walk the tree. `progress(dirs_done, dirs_expected)` is called every
+        64 directories; the estimate comes from the previous scan.
+        """
+        with self._lock:
+            started = time.perf_counter()
+            result = CacheScanResult(self.cache_types)
+            expected = max(len(self._index), 1)
+            visited = set()
+            stack = [("", self.root)]
+
+            while stack:
+                if should_stop and should_stop():
+                    result.complete = False
+                    break
+                rel, path = stack.pop()
+                entry = self._read_dir(path, rel, False, result)
+                if entry is None:
+                    continue
+                visited.add(path)
+
+                for name, is_dir, cache_type in entry.matches:
+                    full_path = os.path.join(path, name)
+                    if is_dir:
+                        size = self._tree_bytes(full_path, visited, result)
+                    else:
+                        try:
+                            size = os.stat(full_path).st_size
+                        except OSError:
+                            continue
+                    result.entries[cache_type].append((full_path, is_dir, size))
+
+                for name in entry.subdirs:
+                    child_rel = f"{rel}/{name}" if rel else name
+                    stack.append((child_rel, os.path.join(path, name)))
+
+                done = result.dirs_scanned + result.dirs_reused
+                if progress and done % 64 == 0:
+                    progress(done, max(expected, done))
+
+            if result.complete:
+                # Forget directories that no longer exist
+                for stale in self._index.keys() - visited:
+                    del self._index[stale]
+                self.last_result = result
+
+            result.duration = time.perf_counter() - started
+            if progress:
+                done = result.dirs_scanned + result.dirs_reused
+                progress(done, done)
+            logger.debug(
+                f"Cache scan: {result.dirs_scanned} dirs listed, "
+                f"{result.dirs_reused} reused in {result.duration:.3f}s"
+            )
+            return result
+
+    def invalidate(self):
+        """Drop the index so the next scan lists every directory again"""
+        with self._lock:
+            self._index.clear()
+
+    def _tree_bytes(self, path: str, visited: set, result: CacheScanResult) -> int:
+        total, stack = 0, [path]
+        while stack:
+            current = stack.pop()
+            entry = self._read_dir(current, "", True, result)
+            if entry is None:
+                continue
+            visited.add(current)
+            total += entry.file_bytes
+            stack.extend(os.path.join(current, name) for name in entry.subdirs)
+        return total
+
+    def _read_dir(
+        self, path: str, rel: str, owned: bool, result: CacheScanResult
+    ) -> Optional[_IndexedDir]:
+        """The directory's entries, from the index when its mtime is unchanged"""
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        cached = self._index.get(path)
+        if cached is not None and cached.mtime_ns == mtime_ns and cached.owned == owned:
+            result.dirs_reused += 1
+            return cached
+
+        entry = _IndexedDir(mtime_ns, owned)
+        try:
+            with os.scandir(path) as items:
+                for item in items:
+                    try:
+                        if item.is_symlink():
+                            continue
+                        is_dir = item.is_dir(follow_symlinks=False)
+                        if owned:
+                            if is_dir:
+                                entry.subdirs.append(item.name)
+                            else:
+                                entry.file_bytes += item.stat(
+                                    follow_symlinks=False
+                                ).st_size
+                            continue
+
+                        item_rel = f"{rel}/{item.name}" if rel else item.name
+                        pattern = self._dir_re if is_dir else self._file_re
+                        match = pattern.fullmatch(item_rel)
+                        if match:
+                            cache_type = self.cache_types[int(match.lastgroup[1:])]
+                            entry.matches.append((item.name, is_dir, cache_type))
+                        elif (
+                            is_dir
+                            and not item.name.startswith(".")
+                            and item.name not in self.exclude_paths
+                        ):
+                            # Unmatched hidden directories are skipped like glob does
+                            entry.subdirs.append(item.name)
+                    except OSError:
+                        continue  # Skip entries we can't access
+        except OSError as e:
+            logger.debug(f"Cannot list {path}: {e}")
+            return None
+
+        self._index[path] = entry
+        result.dirs_scanned += 1
+        return entry
+
+
 class SmartCacheCleaner:
     """Intelligent cache cleaner with configurable patterns"""
 
@@ -47,45 +271,21 @@ class SmartCacheCleaner:
             "os_cache": ["**/Thumbs.db", "**/.DS_Store", "**/desktop.ini"],
             "qt_cache": ["**/.qmlc", "**/*.qmlc"],
         }
+        self.scanner = CacheScanner(
+            self.project_root, self.cache_patterns, self.exclude_paths
+        )
 
-    def get_cache_size(self) -> Dict[str, float]:
-        """Calculate cache sizes by type in MB"""
-        sizes = {}
-
-        for cache_type, patterns in self.cache_patterns.items():
-            total_size = 0
-            try:
-                for pattern in patterns:
-                    pattern_path = str(self.project_root / pattern)
-                    for file_path in glob.glob(pattern_path, recursive=True):
-                        path = Path(file_path)
-
-                        # Skip if in excluded directory
-                        if any(
-                            excluded in path.parts for excluded in self.exclude_paths
-                        ):
-                            continue
-
-                        try:
-                            if path.is_file() and not path.is_symlink():
-                                total_size += path.stat().st_size
-                            elif path.is_dir() and not path.is_symlink():
-                                for dirpath, dirnames, filenames in os.walk(path):
-                                    for filename in filenames:
-                                        file_path = Path(dirpath) / filename
-                                        if not file_path.is_symlink():
-                                            total_size += file_path.stat().st_size
-                        except (OSError, PermissionError):
-                            continue  # Skip files we can't access
-
-            except Exception as e:
-                logger.debug(f"Error calculating size for {cache_type}: {e}")
-
-            sizes[cache_type] = total_size / (1024 * 1024)  # Convert to MB
+    def scan(self, progress=None, should_stop=None) -> CacheScanResult:
+        """One pass over the project tree (see CacheScanner.scan)"""
+        return self.scanner.scan(progress, should_stop)
 
-        return sizes
+    def get_cache_size(self, progress=None) -> Dict[str, float]:
+        """Calculate cache sizes by type in MB"""
+        return self.scan(progress).sizes_mb()
 
-    def clean_cache(self, cache_types: List[str] = None) -> CacheCleanupResult:
+    def clean_cache(
+        self, cache_types: List[str] = None, progress=None, should_stop=None
+    ) -> CacheCleanupResult:
         """Clean specified cache types or all if none specified"""
         result = CacheCleanupResult()
         start_time = time.time()
@@ -95,76 +295,38 @@ class SmartCacheCleaner:
 
         logger.info(f"Starting cache cleanup for types: {', '.join(types_to_clean)}")
 
+        scan = self.scan(progress, should_stop)
         for cache_type in types_to_clean:
-            if cache_type not in self.cache_patterns:
+            if cache_type not in scan.entries:
                 error_msg = f"Unknown cache type: {cache_type}"
                 result.errors.append(error_msg)
                 logger.warning(error_msg)
                 continue
 
-            patterns = self.cache_patterns[cache_type]
-            logger.debug(f"Cleaning {cache_type} with patterns: {patterns}")
-
-            for pattern in patterns:
-                pattern_path = str(self.project_root / pattern)
-
+            for path, is_dir, size in scan.entries[cache_type]:
+                if should_stop and should_stop():
+                    break
                 try:
-                    for file_path in glob.glob(pattern_path, recursive=True):
-                        path = Path(file_path)
-
-                        # Skip if doesn't exist or is symlink
-                        if not path.exists() or path.is_symlink():
-                            continue
-
-                        # Skip if in excluded directory
-                        if any(
-                            excluded in path.parts for excluded in self.exclude_paths
-                        ):
-                            logger.debug(f"Skipping excluded path: {path}")
-                            continue
-
-                        try:
-                            if path.is_file():
-                                file_size = path.stat().st_size
-                                path.unlink()
-                                result.files_removed += 1
-                                result.space_freed_mb += file_size / (1024 * 1024)
-                                logger.debug(f"Removed file: {path}")
-
-                            elif path.is_dir():
-                                # Calculate directory size before removal
-                                dir_size = 0
-                                try:
-                                    for dirpath, dirnames, filenames in os.walk(path):
-                                        for filename in filenames:
-                                            file_path = Path(dirpath) / filename
-                                            if not file_path.is_symlink():
-                                                dir_size += file_path.stat().st_size
-                                except (OSError, PermissionError):
-                                    pass
-
-                                shutil.rmtree(path)
-                                result.dirs_removed += 1
-                                result.space_freed_mb += dir_size / (1024 * 1024)
-                                logger.debug(f"Removed directory: {path}")
-
-                        except PermissionError as e:
-                            error_msg = f"Permission denied: {path}"
-                            result.errors.append(error_msg)
-                            logger.warning(error_msg)
-                        except OSError as e:
-                            error_msg = f"OS error removing {path}: {e}"
-                            result.errors.append(error_msg)
-                            logger.warning(error_msg)
-                        except Exception as e:
-                            error_msg = f"Unexpected error removing {path}: {e}"
-                            result.errors.append(error_msg)
-                            logger.error(error_msg)
-
-                except Exception as e:
-                    error_msg = f"Error processing pattern {pattern}: {e}"
+                    if is_dir:
+                        shutil.rmtree(path)
+                        result.dirs_removed += 1
+                        logger.debug(f"Removed directory: {path}")
+                    else:
+                        os.remove(path)
+                        result.files_removed += 1
+                        logger.debug(f"Removed file: {path}")
+                    result.space_freed_mb += size / (1024 * 1024)
+
+                except FileNotFoundError:
+                    continue  # Already gone
+                except PermissionError as e:
+                    error_msg = f"Permission denied: {path}"
+                    result.errors.append(error_msg)
+                    logger.warning(error_msg)
+                except OSError as e:
+                    error_msg = f"OS error removing {path}: {e}"
                     result.errors.append(error_msg)
-                    logger.error(error_msg)
+                    logger.warning(error_msg)
 
         result.duration = time.time() - start_time
 
@@ -178,6 +340,54 @@ class SmartCacheCleaner:
         return result
 
 
+class CacheCleanupWorker(QThread):
+    """Runs a cache scan or cleanup off the GUI thread"""
+
+    progress_updated = pyqtSignal(int, str)  # percentage, message
+    scan_completed = pyqtSignal(dict)  # sizes in MB by cache type
+    cleanup_completed = pyqtSignal(object)  # CacheCleanupResult
+
+    def __init__(
+        self,
+        cleaner: SmartCacheCleaner,
+        clean: bool = True,
+        cache_types: List[str] = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.cleaner = cleaner
+        self.clean = clean
+        self.cache_types = cache_types
+        self._should_stop = False
+
+    def run(self):
+        try:
+            if self.clean:
+                result = self.cleaner.clean_cache(
+                    self.cache_types,
+                    progress=self._report_progress,
+                    should_stop=lambda: self._should_stop,
+                )
+                self.cleanup_completed.emit(result)
+            else:
+                self.scan_completed.emit(
+                    self.cleaner.get_cache_size(progress=self._report_progress)
+                )
+        except Exception as e:
+            logger.error(f"Cache worker failed: {e}", exc_info=True)
+            result = CacheCleanupResult()
+            result.errors.append(str(e))
+            if self.clean:
+                self.cleanup_completed.emit(result)
+
+    def _report_progress(self, done: int, expected: int):
+        percentage = min(100, int(done * 100 / max(expected, 1)))
+        self.progress_updated.emit(percentage, f"Scanned {done} folders")
+
+    def stop(self):
+        self._should_stop = True
+
+
 class AutoCacheManager(QObject):
     """
     Manages automatic cache cleanup with configurable schedules.
@@ -185,6 +395,8 @@ class AutoCacheManager(QObject):
 
     log_message = pyqtSignal(str, str)  # message, level
     cleanup_completed = pyqtSignal(object)  # CacheCleanupResult
+    cleanup_progress = pyqtSignal(int, str)  # percentage, message
+    statistics_updated = pyqtSignal(dict)  # get_cache_statistics() layout
 
     def __init__(self, config_manager: ConfigManager, parent=None):
         super().__init__(parent)
@@ -194,6 +406,7 @@ class AutoCacheManager(QObject):
         # Initialize cleaner with project root
         project_root = getattr(config_manager, "project_root", None) or os.getcwd()
         self.cleaner = SmartCacheCleaner(project_root)
+        self.worker: Optional[CacheCleanupWorker] = None
 
         # Setup auto-cleanup timer
         self.cleanup_timer = QTimer(self)
@@ -266,12 +479,22 @@ class AutoCacheManager(QObject):
     @pyqtSlot()
     def run_manual_cleanup(self):
         """Run manual cache cleanup"""
+        if self.worker and self.worker.isRunning():
+            self.log_message.emit("Cache cleanup is already running", "info")
+            return
         logger.info("Running manual cache cleanup")
         self.log_message.emit("Starting manual cache cleanup...", "info")
 
+        # Scan and delete on a worker thread to avoid blocking the UI
+        self.worker = CacheCleanupWorker(self.cleaner, clean=True)
+        self.worker.progress_updated.connect(self.cleanup_progress.emit)
+        self.worker.cleanup_completed.connect(self._handle_cleanup_completed)
+        self.worker.start()
+
+    @pyqtSlot(object)
+    def _handle_cleanup_completed(self, result: CacheCleanupResult):
+        """Handle cleanup completion"""
         try:
-            # Run cleanup in background to avoid blocking UI
-            result = self.cleaner.clean_cache()
             self.last_cleanup_time = time.time()
 
             # Emit completion signal
@@ -295,10 +518,30 @@ class AutoCacheManager(QObject):
             self.log_message.emit(f"❌ {error_msg}", "error")
             logger.error(error_msg, exc_info=True)
 
-    def get_cache_statistics(self) -> Dict:
-        """Get current cache statistics"""
+    @pyqtSlot()
+    def refresh_cache_statistics(self):
+        """Scan on a worker thread; the result arrives via statistics_updated"""
+        if self.worker and self.worker.isRunning():
+            return
+        self.worker = CacheCleanupWorker(self.cleaner, clean=False)
+        self.worker.progress_updated.connect(self.cleanup_progress.emit)
+        self.worker.scan_completed.connect(
+            lambda sizes: self.statistics_updated.emit(self.get_cache_statistics(sizes))
+        )
+        self.worker.start()
+
+    def get_cache_statistics(self, cache_sizes: Dict[str, float] = None) -> Dict:
+        """
+        Get current cache statistics. Repeat scans reuse the directory
+        index; while a worker is scanning, the previous result is returned.
+        """
         try:
-            cache_sizes = self.cleaner.get_cache_size()
+            if cache_sizes is None:
+                last = self.cleaner.scanner.last_result
+                if last and self.worker and self.worker.isRunning():
+                    cache_sizes = last.sizes_mb()
+                else:
+                    cache_sizes = self.cleaner.get_cache_size()
 
             stats = {
                 "total_size_mb": sum(cache_sizes.values()),
@@ -329,6 +572,11 @@ class AutoCacheManager(QObject):
         logger.info("AutoCacheManager cleanup initiated")
 
         try:
+            # Stop a running scan/cleanup
+            if self.worker and self.worker.isRunning():
+                self.worker.stop()
+                self.worker.wait(5000)
+
             # Stop timer
             if self.cleanup_timer and self.cleanup_timer.isActive():
                 self.cleanup_timer.stop()
@@ -340,6 +588,8 @@ class AutoCacheManager(QObject):
             try:
                 self.log_message.disconnect()
                 self.cleanup_completed.disconnect()
+                self.cleanup_progress.disconnect()
+                self.statistics_updated.disconnect()
                 logger.info("AutoCacheManager signals disconnected")
             except (TypeError, RuntimeError):
                 pass  # Signals already disconnected
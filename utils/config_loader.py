@@ -0,0 +1,293 @@
+# utils/config_loader.py - Configuration model and file loading (no Qt dependency)
+import os
+import json
+from dataclasses import dataclass, field, asdict
+from dotenv import load_dotenv
+from pathlib import Path
+from typing import Dict, Any, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Define the default configuration file path
+CONFIG_FILE = "config.json"
+DEFAULT_CONFIG_DIR = Path("config")
+DEFAULT_CONFIG_PATH = DEFAULT_CONFIG_DIR / CONFIG_FILE
+
+
+@dataclass
+class Config:
+    """
+    Unified configuration data class.
+    Removes conflicts between old and new field names.
+    """
+
+    # General Application Settings
+    app_name: str = "DENSO Neural Matrix"
+    app_version: str = "1.0.0"
+    connection_timeout: int = 30
+    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    max_retries: int = 3
+
+    # UI Settings
+    background_image_path: str = "resources/images/bg_denso_matrix.jpg"
+    enable_background_audio: bool = False
+    background_audio_path: str = "resources/audio/bg_ambient.mp3"
+    background_audio_volume: float = 0.1
+
+    # SharePoint Configuration (unified fields)
+    sharepoint_site: str = os.getenv("SHAREPOINT_SITE", "")
+    sharepoint_list: str = os.getenv("SHAREPOINT_LIST", "")
+    sharepoint_client_id: str = os.getenv("SHAREPOINT_CLIENT_ID", "")
+    sharepoint_client_secret: str = os.getenv("SHAREPOINT_CLIENT_SECRET", "")
+    tenant_id: str = os.getenv("TENANT_ID", "")
+    sharepoint_token_url: str = ""  # overrides the ACS token endpoint if set
+    use_graph_api: bool = False  # Microsoft Graph instead of SharePoint REST
+    graph_base_url: str = "https://graph.microsoft.com/v1.0"
+    graph_token_url: str = ""  # overrides the Azure AD token endpoint if set
+
+    # Database Configuration (unified)
+    database_type: str = "sqlserver"  # "sqlserver" or "sqlite"
+
+    # SQL Server Configuration
+    sql_server: str = os.getenv("SQL_SERVER", "")
+    sql_database: str = os.getenv("SQL_DATABASE", "")
+    sql_username: str = os.getenv("SQL_USERNAME", "")
+    sql_password: str = os.getenv("SQL_PASSWORD", "")
+    sql_table_name: str = os.getenv("SQL_TABLE_NAME", "")
+    sql_create_table: bool = True
+    sql_truncate_before: bool = True
+
+    # SQLite Configuration
+    sqlite_file: str = os.getenv("SQLITE_FILE", "data.db")
+    sqlite_table_name: str = os.getenv("SQLITE_TABLE_NAME", "sharepoint_data")
+    sqlite_create_table: bool = True
+
+    # Synchronization Settings
+    sync_interval: int = 600  # seconds
+    sync_mode: str = "full"
+    auto_sync_enabled: bool = False
+    auto_sync_direction: str = "spo_to_sql"
+    last_sync_timestamp: Optional[str] = None
+    last_sync_status: str = "never"
+
+    # Named sync jobs for the headless runner: {"name": {"direction": ...,
+    # <Config field overrides>}}. "spo_to_sql"/"sql_to_spo" always exist.
+    sync_jobs: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    # Scheduled jobs: {"job": {"schedule": "0 2 * * *" | "every 10m",
+    # "priority": 0, "jitter": "30s", "catch_up": "skip|once|all"}}.
+    # Empty = the single auto-sync above (auto_sync_direction every sync_interval)
+    sync_schedules: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    scheduler_max_workers: int = 2
+    scheduler_state_file: str = "data/scheduler_state.json"
+
+    # SharePoint webhooks: incremental spo_to_sql syncs on list changes.
+    # webhook_lists = {"List title": "sync job"}; empty = sharepoint_list.
+    # webhook_public_url is the HTTPS URL SharePoint posts to (reverse proxy).
+    webhook_enabled: bool = False
+    webhook_host: str = "0.0.0.0"
+    webhook_port: int = 8787
+    webhook_path: str = "/spo-webhook"
+    webhook_public_url: str = ""
+    webhook_client_state: str = ""  # generated and kept in the state file
+    webhook_lists: Dict[str, str] = field(default_factory=dict)
+    webhook_debounce_seconds: float = 10.0  # quiet time before syncing
+    webhook_max_delay_seconds: float = 60.0  # cap while changes keep coming
+    webhook_expiration_days: int = 90  # SharePoint allows at most 180
+    webhook_state_file: str = "data/webhook_state.json"
+
+    # Field Mappings
+    sharepoint_to_sql_mapping: Dict[str, str] = field(default_factory=dict)
+    sql_to_sharepoint_mapping: Dict[str, str] = field(default_factory=dict)
+    excel_import_mapping: Dict[str, str] = field(default_factory=dict)
+
+    # Lookup/person fields named in a mapping are translated between IDs and
+    # display values (person_field_value: Title, Email or LoginName)
+    resolve_lookup_fields: bool = True
+    person_field_value: str = "Title"
+    lookup_cache_file: str = "data/lookup_cache.json"
+    lookup_cache_ttl: int = 3600  # seconds
+    sql_timezone: str = "UTC"  # SharePoint dates are stored as naive times here
+
+    # Performance Settings
+    batch_size: int = 1000  # starting SQL batch; tuned per table when adaptive
+    adaptive_batching: bool = True  # tune SQL/SharePoint batch and page sizes
+    batch_tuning_file: str = "data/batch_tuning.json"
+    enable_parallel_processing: bool = False
+    connection_pool_size: int = 2  # pooled connectors per target
+    sharepoint_read_workers: int = 4  # parallel ID windows on large lists
+    skip_unchanged_lists: bool = True  # no-op full syncs of unmodified lists
+    read_plan_state_file: str = "data/read_plan_state.json"
+    connection_idle_ttl: int = 900  # seconds before an idle connector is closed
+    progress_update_hz: float = 10.0  # max progress updates per second
+    # Memory budget for syncs/imports: 0 = half the installed memory, < 0 = off.
+    # Over 3/4 of it, buffered rows are staged as Parquet in spill_dir (pyarrow)
+    memory_budget_mb: int = 0
+    spill_dir: str = "data/spill"
+
+    # Run History & Metrics
+    run_history_enabled: bool = True
+    run_history_file: str = "data/run_history.db"
+
+    # Profiling (off unless profiling_mode is "sampling" or "cprofile")
+    profiling_mode: str = os.getenv("SPO_SYNC_PROFILE", "")
+    profiling_dir: str = "logs/profiles"
+    profiling_interval_ms: float = 5.0  # sampling interval
+    profiling_trace_memory: bool = True  # tracemalloc peaks per stage
+
+    # Connection Health Monitoring
+    health_monitor_enabled: bool = True
+    health_check_interval: int = 60  # seconds between background probes
+    health_check_max_backoff: int = 600  # ceiling for failure backoff (seconds)
+    health_check_jitter: float = 0.2  # +/- fraction applied to each interval
+
+    # Retry & Circuit Breaker Settings (max_retries = attempts per call)
+    retry_base_delay: float = 1.0  # seconds, doubled per attempt with jitter
+    retry_max_delay: float = 30.0
+    retry_budget_ratio: float = 0.2  # retries allowed per first attempt
+    circuit_failure_threshold: int = 5
+    circuit_reset_timeout: int = 60  # seconds before a trial call
+
+    # Notification Settings
+    enable_success_notifications: bool = True
+    enable_error_notifications: bool = True
+
+    # Cache Management
+    auto_cache_cleanup_enabled: bool = False
+    cache_cleanup_interval_hours: int = 24
+
+    def __post_init__(self):
+        """Post-initialization to handle legacy field mapping"""
+        # Handle sharepoint_url legacy field
+        if hasattr(self, "sharepoint_url") and not self.sharepoint_site:
+            self.sharepoint_site = getattr(self, "sharepoint_url", "")
+
+        # Handle db_type legacy field
+        if hasattr(self, "db_type"):
+            if getattr(self, "db_type", "").lower() == "sql server":
+                self.database_type = "sqlserver"
+            elif getattr(self, "db_type", "").lower() == "sqlite":
+                self.database_type = "sqlite"
+
+    @property
+    def sharepoint_url(self) -> str:
+        """Backward compatibility property"""
+        return self.sharepoint_site
+
+    @property
+    def db_type(self) -> str:
+        """Backward compatibility property"""
+        return "SQL Server" if self.database_type == "sqlserver" else "SQLite"
+
+
+def load_config(config_path: Path = None) -> Config:
+    """Load configuration from a JSON file and environment variables"""
+    config_path = Path(config_path) if config_path else DEFAULT_CONFIG_PATH
+    config_data = {}
+
+    # Ensure config directory exists
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Load from config.json if exists
+    if config_path.exists():
+        try:
+            with open(config_path, "r", encoding="utf-8") as f:
+                config_data = json.load(f)
+            logger.info(f"Loaded configuration from {config_path}")
+        except (json.JSONDecodeError, IOError) as e:
+            logger.error(f"Error loading config.json: {e}. Using defaults.")
+            config_data = {}
+    else:
+        logger.warning(f"Config file not found. Creating default at {config_path}")
+        save_default_config(config_path)
+
+    # Create Config instance with defaults
+    config = Config()
+
+    # Apply config.json values safely
+    for key, value in config_data.items():
+        if hasattr(config, key):
+            current_value = getattr(config, key)
+            try:
+                if isinstance(current_value, dict) and isinstance(value, dict):
+                    getattr(config, key).update(value)
+                elif isinstance(current_value, bool) and isinstance(value, str):
+                    setattr(config, key, value.lower() in ("true", "1", "yes", "on"))
+                elif value is not None:
+                    # Type-safe conversion
+                    if isinstance(current_value, (int, float)) and isinstance(
+                        value, str
+                    ):
+                        try:
+                            converted_value = type(current_value)(value)
+                            setattr(config, key, converted_value)
+                        except ValueError:
+                            logger.warning(
+                                f"Cannot convert '{value}' to {type(current_value)} for key '{key}'"
+                            )
+                    else:
+                        setattr(config, key, value)
+            except Exception as e:
+                logger.warning(f"Failed to set config key '{key}': {e}")
+        else:
+            logger.warning(f"Unknown config key '{key}' in config.json")
+
+    # Environment variables override file settings
+    apply_env_overrides(config)
+
+    logger.info("Configuration loaded successfully")
+    return config
+
+
+def apply_env_overrides(config: Config):
+    """Apply environment variable overrides"""
+    env_mappings = {
+        "SHAREPOINT_SITE": "sharepoint_site",
+        "SHAREPOINT_LIST": "sharepoint_list",
+        "SHAREPOINT_CLIENT_ID": "sharepoint_client_id",
+        "SHAREPOINT_CLIENT_SECRET": "sharepoint_client_secret",
+        "TENANT_ID": "tenant_id",
+        "SQL_SERVER": "sql_server",
+        "SQL_DATABASE": "sql_database",
+        "SQL_USERNAME": "sql_username",
+        "SQL_PASSWORD": "sql_password",
+        "SQL_TABLE_NAME": "sql_table_name",
+        "LOG_LEVEL": "log_level",
+        "SPO_SYNC_PROFILE": "profiling_mode",
+    }
+
+    for env_var, config_attr in env_mappings.items():
+        env_value = os.getenv(env_var)
+        if env_value:
+            try:
+                current_type = type(getattr(config, config_attr))
+                if current_type == bool:
+                    setattr(
+                        config,
+                        config_attr,
+                        env_value.lower() in ("true", "1", "yes"),
+                    )
+                elif current_type == int:
+                    setattr(config, config_attr, int(env_value))
+                elif current_type == float:
+                    setattr(config, config_attr, float(env_value))
+                else:
+                    setattr(config, config_attr, env_value)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Failed to convert env var {env_var}: {e}")
+
+
+def save_default_config(config_path: Path = None):
+    """Save default configuration to file"""
+    config_path = Path(config_path) if config_path else DEFAULT_CONFIG_PATH
+    try:
+        default_config = asdict(Config())
+        with open(config_path, "w", encoding="utf-8") as f:
+            json.dump(default_config, f, indent=2, ensure_ascii=False)
+        logger.info(f"Default configuration saved to {config_path}")
+    except IOError as e:
+        logger.error(f"Failed to save default config: {e}")
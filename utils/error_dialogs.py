@@ -0,0 +1,91 @@
+# utils/error_dialogs.py - Qt message boxes for the central error handler
+import traceback
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+from PyQt6.QtWidgets import QApplication, QMessageBox
+
+from utils.error_handling import ErrorHandler, ErrorInfo, ErrorSeverity
+
+
+class _ErrorDialogBridge(QObject):
+    """Lives on the GUI thread so dialogs are shown there, whoever reports"""
+
+    error_occurred = pyqtSignal(object)  # ErrorInfo
+
+    def __init__(self):
+        super().__init__()
+        app = QApplication.instance()
+        if app is not None:
+            self.moveToThread(app.thread())
+        self.error_occurred.connect(self._show_message_box)
+
+    @pyqtSlot(object)
+    def _show_message_box(self, error_info: ErrorInfo):
+        """Default UI handler to display an error message box."""
+        # Avoid showing too many popups, especially for low severity or repeated errors
+        if (
+            error_info.severity in [ErrorSeverity.LOW, ErrorSeverity.MEDIUM]
+            and not error_info.user_message
+        ):
+            return  # Don't show popups for minor issues unless explicitly requested
+
+        msg_box = QMessageBox()
+        msg_box.setWindowTitle(
+            f"Error: {error_info.category.value.replace('_', ' ').title()}"
+        )
+
+        icon_map = {
+            ErrorSeverity.LOW: QMessageBox.Icon.Information,
+            ErrorSeverity.MEDIUM: QMessageBox.Icon.Warning,
+            ErrorSeverity.HIGH: QMessageBox.Icon.Critical,
+            ErrorSeverity.CRITICAL: QMessageBox.Icon.Critical,
+        }
+        msg_box.setIcon(icon_map.get(error_info.severity, QMessageBox.Icon.Critical))
+
+        display_message = error_info.user_message or "An unexpected error occurred."
+        if error_info.severity == ErrorSeverity.CRITICAL:
+            display_message += "\nThe application may not function correctly and might need to be restarted."
+
+        msg_box.setText(f"<b>{display_message}</b>")
+
+        details = f"Category: {error_info.category.value}\nSeverity: {error_info.severity.value}\n"
+        details += f"Message: {error_info.message}\n"
+        if error_info.context:
+            details += f"Context: {error_info.context}\n"
+        if error_info.exception:
+            details += f"Exception Type: {type(error_info.exception).__name__}\n"
+            details += "Traceback:\n" + "".join(
+                traceback.format_exception(
+                    type(error_info.exception),
+                    error_info.exception,
+                    error_info.exception.__traceback__,
+                )
+            )
+
+        msg_box.setDetailedText(details)
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        msg_box.exec()
+
+
+class QtErrorHandler(ErrorHandler):
+    """ErrorHandler that also shows a message box for serious errors"""
+
+    def __init__(self):
+        super().__init__()
+        self._bridge = _ErrorDialogBridge()
+        self.error_occurred = self._bridge.error_occurred
+
+    def _notify(self, error_info: ErrorInfo):
+        self.error_occurred.emit(error_info)
+
+    def cleanup(self):
+        """Cleans up the error handler by disconnecting signals."""
+        try:
+            self.error_occurred.disconnect(self._bridge._show_message_box)
+            self.logger.info("ErrorHandler signals disconnected.")
+        except TypeError as e:
+            self.logger.debug(
+                f"Attempted to disconnect non-connected ErrorHandler signal: {e}"
+            )
+        except Exception as e:
+            self.logger.warning(f"Error during ErrorHandler signal disconnection: {e}")
+        super().cleanup()
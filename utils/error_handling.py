@@ -3,13 +3,13 @@ Centralized Error Handling System - ระบบจัดการ Error แบ
 """
 
 import logging
-import traceback
+import sys
+import threading
+import time
 from functools import wraps
 from typing import Optional, Dict, Callable, Any
 from enum import Enum
-from dataclasses import dataclass
-from PyQt6.QtCore import QObject, pyqtSignal
-from PyQt6.QtWidgets import QMessageBox
+from dataclasses import dataclass, replace
 
 
 class ErrorSeverity(Enum):
@@ -38,30 +38,129 @@ class ErrorInfo:
     context: Optional[Dict] = None
     user_message: Optional[str] = None
     recovery_actions: Optional[list] = None
+    occurrences: int = 1  # > 1 for an aggregated summary
 
 
-class ErrorHandler(QObject):
-    """Central error handler with UI integration"""
+class _ErrorAggregate:
+    """Repeats of one error fingerprint within the current window"""
 
-    error_occurred = pyqtSignal(object)  # ErrorInfo
+    __slots__ = ("window_start", "count", "last", "timer")
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, now: float, error_info: ErrorInfo):
+        self.window_start = now
+        self.count = 1
+        self.last = error_info
+        self.timer: Optional[threading.Timer] = None
+
+
+class ErrorHandler:
+    """
+    Central error handler (logging, callbacks, recovery).
+    Has no Qt dependency; the GUI uses QtErrorHandler (utils/error_dialogs.py)
+    to show message boxes.
+
+    Error storms are aggregated: the first error of a fingerprint (category,
+    function, exception type) is handled in full, repeats within
+    `aggregation_window` seconds are only counted (the first
+    `traceback_samples` of them are logged with a traceback) and one summary
+    is handled when the window closes.
+    """
+
+    def __init__(self, aggregation_window: float = 60.0, traceback_samples: int = 3):
         self.logger = logging.getLogger("error_handler")
         self.error_callbacks: Dict[ErrorCategory, list] = {}
         self.recovery_handlers: Dict[ErrorCategory, Callable] = {}
-        self.error_occurred.connect(
-            self._show_message_box
-        )  # Connect to default UI display
         self.last_error_info: Optional[ErrorInfo] = None
+        self.aggregation_window = aggregation_window
+        self.traceback_samples = traceback_samples
+        self._aggregates: Dict[tuple, _ErrorAggregate] = {}
+        self._aggregate_lock = threading.Lock()
         self.logger.info("ErrorHandler initialized.")
 
+    @staticmethod
+    def fingerprint(error_info: ErrorInfo) -> tuple:
+        """Identity of an error for aggregation"""
+        function = (error_info.context or {}).get("function")
+        exception = error_info.exception
+        if not function and exception is None:
+            # Nothing else to tell plain messages apart
+            return (error_info.category.value, error_info.message)
+        return (error_info.category.value, function, type(exception).__name__)
+
     def handle_error(self, error_info: ErrorInfo):
         """
         Handles an error by logging it, calling registered callbacks,
-        and triggering a UI message.
+        and triggering a UI message. Repeats of a recent error are counted
+        and reported later in one summary.
         """
         self.last_error_info = error_info
+        if (
+            self.aggregation_window > 0
+            and error_info.severity != ErrorSeverity.CRITICAL
+        ):
+            count = self._count_repeat(error_info)
+            if count > 1:
+                if count <= self.traceback_samples + 1:
+                    self._log(error_info, f" (repeat {count - 1})")
+                return
+        self._dispatch(error_info)
+
+    def _count_repeat(self, error_info: ErrorInfo) -> int:
+        """Occurrences of this fingerprint in the current window"""
+        key = self.fingerprint(error_info)
+        now = time.monotonic()
+        with self._aggregate_lock:
+            aggregate = self._aggregates.get(key)
+            if aggregate is None or (
+                aggregate.timer is None
+                and now - aggregate.window_start >= self.aggregation_window
+            ):
+                self._aggregates[key] = _ErrorAggregate(now, error_info)
+                return 1
+            aggregate.count += 1
+            aggregate.last = error_info
+            if aggregate.timer is None:
+                delay = aggregate.window_start + self.aggregation_window - now
+                aggregate.timer = threading.Timer(
+                    max(delay, 0.0), self._flush_aggregate, (key,)
+                )
+                aggregate.timer.daemon = True
+                aggregate.timer.start()
+            return aggregate.count
+
+    def _flush_aggregate(self, key: tuple):
+        """Close a window: handle one summary for the suppressed repeats"""
+        with self._aggregate_lock:
+            aggregate = self._aggregates.pop(key, None)
+        if aggregate is None or aggregate.count < 2:
+            return
+        if aggregate.timer:
+            aggregate.timer.cancel()
+        repeats = aggregate.count - 1
+        last = aggregate.last
+        elapsed = time.monotonic() - aggregate.window_start
+        summary = f"repeated {repeats} more time(s) in {elapsed:.0f}s"
+        self._dispatch(
+            replace(
+                last,
+                message=f"{last.message} ({summary})",
+                user_message=(
+                    f"{last.user_message} ({summary})" if last.user_message else None
+                ),
+                exception=None,
+                occurrences=aggregate.count,
+            ),
+            recover=False,
+        )
+
+    def flush_aggregated(self):
+        """Report all pending error summaries now"""
+        with self._aggregate_lock:
+            keys = list(self._aggregates)
+        for key in keys:
+            self._flush_aggregate(key)
+
+    def _log(self, error_info: ErrorInfo, suffix: str = ""):
         log_method = {
             ErrorSeverity.LOW: self.logger.info,
             ErrorSeverity.MEDIUM: self.logger.warning,
@@ -70,10 +169,14 @@ class ErrorHandler(QObject):
         }.get(error_info.severity, self.logger.error)
 
         log_method(
-            f"Error [{error_info.category.value.upper()}/{error_info.severity.value.upper()}]: {error_info.message}",
+            f"Error [{error_info.category.value.upper()}/{error_info.severity.value.upper()}]: {error_info.message}{suffix}",
             exc_info=error_info.exception,
         )
 
+    def _dispatch(self, error_info: ErrorInfo, recover: bool = True):
+        """Log, run callbacks and recovery, and notify the user"""
+        self._log(error_info)
+
         # Call category-specific callbacks
         for callback in self.error_callbacks.get(error_info.category, []):
             try:
@@ -86,7 +189,7 @@ class ErrorHandler(QObject):
 
         # Attempt recovery action
         recovery_func = self.recovery_handlers.get(error_info.category)
-        if recovery_func:
+        if recovery_func and recover:
             self.logger.info(
                 f"Attempting recovery for {error_info.category.value} error."
             )
@@ -98,53 +201,10 @@ class ErrorHandler(QObject):
                     exc_info=True,
                 )
 
-        self.error_occurred.emit(error_info)  # Emit signal for UI display
+        self._notify(error_info)
 
-    def _show_message_box(self, error_info: ErrorInfo):
-        """Default UI handler to display an error message box."""
-        # Avoid showing too many popups, especially for low severity or repeated errors
-        if (
-            error_info.severity in [ErrorSeverity.LOW, ErrorSeverity.MEDIUM]
-            and not error_info.user_message
-        ):
-            return  # Don't show popups for minor issues unless explicitly requested
-
-        msg_box = QMessageBox()
-        msg_box.setWindowTitle(
-            f"Error: {error_info.category.value.replace('_', ' ').title()}"
-        )
-
-        icon_map = {
-            ErrorSeverity.LOW: QMessageBox.Icon.Information,
-            ErrorSeverity.MEDIUM: QMessageBox.Icon.Warning,
-            ErrorSeverity.HIGH: QMessageBox.Icon.Critical,
-            ErrorSeverity.CRITICAL: QMessageBox.Icon.Critical,
-        }
-        msg_box.setIcon(icon_map.get(error_info.severity, QMessageBox.Icon.Critical))
-
-        display_message = error_info.user_message or "An unexpected error occurred."
-        if error_info.severity == ErrorSeverity.CRITICAL:
-            display_message += "\nThe application may not function correctly and might need to be restarted."
-
-        msg_box.setText(f"<b>{display_message}</b>")
-
-        details = f"Category: {error_info.category.value}\nSeverity: {error_info.severity.value}\n"
-        details += f"Message: {error_info.message}\n"
-        if error_info.context:
-            details += f"Context: {error_info.context}\n"
-        if error_info.exception:
-            details += f"Exception Type: {type(error_info.exception).__name__}\n"
-            details += "Traceback:\n" + "".join(
-                traceback.format_exception(
-                    type(error_info.exception),
-                    error_info.exception,
-                    error_info.exception.__traceback__,
-                )
-            )
-
-        msg_box.setDetailedText(details)
-        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-        msg_box.exec()
+    def _notify(self, error_info: ErrorInfo):
+        """Hook for user-facing display; headless runs only log"""
 
     def register_callback(
         self, category: ErrorCategory, callback: Callable[[ErrorInfo], None]
@@ -167,16 +227,8 @@ class ErrorHandler(QObject):
         return self.last_error_info
 
     def cleanup(self):
-        """Cleans up the error handler by disconnecting signals."""
-        try:
-            self.error_occurred.disconnect(self._show_message_box)
-            self.logger.info("ErrorHandler signals disconnected.")
-        except TypeError as e:
-            self.logger.debug(
-                f"Attempted to disconnect non-connected ErrorHandler signal: {e}"
-            )
-        except Exception as e:
-            self.logger.warning(f"Error during ErrorHandler signal disconnection: {e}")
+        """Cleans up the error handler callbacks."""
+        self.flush_aggregated()
         self.error_callbacks.clear()
         self.recovery_handlers.clear()
         self.logger.info("ErrorHandler cleanup completed.")
@@ -190,10 +242,22 @@ def get_error_handler() -> ErrorHandler:
     """Returns the singleton instance of the ErrorHandler."""
     global _error_handler
     if _error_handler is None:
-        _error_handler = ErrorHandler()
+        # Only pull in Qt when the GUI already loaded it
+        if "PyQt6.QtWidgets" in sys.modules:
+            from utils.error_dialogs import QtErrorHandler
+
+            _error_handler = QtErrorHandler()
+        else:
+            _error_handler = ErrorHandler()
     return _error_handler
 
 
+def set_error_handler(handler: ErrorHandler):
+    """Install a specific ErrorHandler (e.g. from the headless runner)."""
+    global _error_handler
+    _error_handler = handler
+
+
 def handle_exceptions(
     category: ErrorCategory, severity: ErrorSeverity = ErrorSeverity.HIGH
 ):
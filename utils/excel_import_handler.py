@@ -1,17 +1,24 @@
 # utils/excel_import_handler.py - Fixed Excel Import Handler
-import pandas as pd
 from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QThread
 from typing import Dict, Optional
 import logging
 import os
+from datetime import datetime, timezone
 from pathlib import Path
 
 from utils.error_handling import handle_exceptions, ErrorCategory, ErrorSeverity
 from connectors.database_connector import DatabaseConnector
 from utils.config_manager import Config
+from utils.lazy_imports import lazy_module
+from utils.memory_budget import can_spill, frame_row_bytes, get_memory_budget
+from utils.metrics import RunMetrics, activate
+from utils.profiling import profile_run
+from utils.run_history import get_run_history
 
 logger = logging.getLogger(__name__)
 
+pd = lazy_module("pandas")  # openpyxl is pulled in by pd.read_excel
+
 
 class ExcelImportResult:
     """Results from Excel import operation"""
@@ -26,6 +33,7 @@ class ExcelImportResult:
         self.table_name = ""
         self.column_mapping = {}
         self.duration_seconds = 0.0
+        self.run_id = None
 
 
 class ExcelImportWorker(QThread):
@@ -41,22 +49,37 @@ class ExcelImportWorker(QThread):
         file_path: str,
         table_name: str,
         column_mapping: Dict[str, str],
+        connection_manager=None,
     ):
         super().__init__()
         self.config = config
         self.file_path = file_path
         self.table_name = table_name
         self.column_mapping = column_mapping
+        self.connection_manager = connection_manager
         self._should_stop = False
         self.db_connector = None
+        self.metrics = RunMetrics()
 
     def run(self):
         """Main execution method for import worker"""
+        self.metrics = RunMetrics()
+        with profile_run(self.config, "excel_import") as profiler:
+            profiler.run_id = self.metrics.run_id
+            with activate(self.metrics):
+                self._run_import()
+
+    def _run_import(self):
         import time
 
         start_time = time.time()
+        started_at = datetime.now(timezone.utc)
+
+        budget = get_memory_budget(self.config)
+        spill = None
 
         result = ExcelImportResult()
+        result.run_id = self.metrics.run_id
         result.file_path = self.file_path
         result.table_name = self.table_name
         result.column_mapping = self.column_mapping
@@ -77,7 +100,9 @@ class ExcelImportWorker(QThread):
             self.progress_updated.emit(10, "Reading Excel file...")
 
             # Read Excel file
-            df = self._read_excel_file()
+            with self.metrics.span("read") as span:
+                df = self._read_excel_file()
+                span["rows"] = 0 if df is None else len(df)
             if df is None:
                 result.message = f"Failed to read Excel file: {self.file_path}"
                 result.success = False
@@ -96,7 +121,9 @@ class ExcelImportWorker(QThread):
             self.progress_updated.emit(30, "Applying column mapping...")
 
             # Apply column mapping
-            df_mapped = self._apply_column_mapping(df)
+            with self.metrics.span("mapping", rows=len(df)):
+                df_mapped = self._apply_column_mapping(df)
+            del df  # the mapped frame holds its own copy of the columns
             if df_mapped is None or df_mapped.empty:
                 result.message = "No valid data after applying column mapping"
                 result.success = False
@@ -105,10 +132,15 @@ class ExcelImportWorker(QThread):
 
             self.progress_updated.emit(60, "Connecting to database...")
 
-            # Initialize database connector
-            self.db_connector = DatabaseConnector(self.config)
+            # Lease a warm database connector (pool_pre_ping validates it)
+            if self.connection_manager:
+                self.db_connector = self.connection_manager.acquire_connector(
+                    self.config, "database"
+                )
+            else:
+                self.db_connector = DatabaseConnector(self.config)
 
-            if not self.db_connector.test_connection():
+            if self.db_connector.engine is None:
                 result.message = "Failed to connect to database"
                 result.success = False
                 self.import_completed.emit(result)
@@ -120,14 +152,41 @@ class ExcelImportWorker(QThread):
                 "info",
             )
 
+            # Over the memory budget the frame is staged on disk and written
+            # back one part at a time
+            row_bytes = frame_row_bytes(df_mapped)
+            budget.track(self.metrics.run_id, row_bytes * len(df_mapped))
+            frames = [df_mapped]
+            if budget.should_spill() and can_spill():
+                part_rows = budget.fit_rows(len(df_mapped), row_bytes, minimum=1000)
+                spill = budget.spill_file("excel_import")
+                with self.metrics.span("spill", rows=len(df_mapped)):
+                    for start in range(0, len(df_mapped), part_rows):
+                        spill.append(df_mapped.iloc[start : start + part_rows])
+                self.log_message.emit(
+                    f"💽 Staged {spill.rows} rows on disk ({spill.parts} parts) "
+                    "to stay within the memory budget",
+                    "info",
+                )
+                frames = spill
+                budget.track(self.metrics.run_id, 0)
+            del df_mapped
+
             # Write to database
-            rows_written = self.db_connector.write_dataframe(
-                df=df_mapped,
-                table_name=self.table_name,
-                if_exists="append",  # Default to append mode
-                index=False,
-                create_table=True,
-            )
+            rows_written = 0
+            with self.metrics.span("write") as span:
+                for frame in frames:
+                    written = self.db_connector.write_dataframe(
+                        df=frame,
+                        table_name=self.table_name,
+                        if_exists="append",  # Default to append mode
+                        index=False,
+                        create_table=True,
+                    )
+                    if written is None:
+                        raise RuntimeError("Writing to the database failed")
+                    rows_written += written
+                span["rows"] = rows_written
 
             result.rows_imported_to_db = rows_written
             result.success = True
@@ -147,10 +206,44 @@ class ExcelImportWorker(QThread):
             self.log_message.emit(f"❌ {result.message}", "error")
             logger.error(f"Excel import error: {e}", exc_info=True)
         finally:
+            if spill:
+                spill.close()
+            budget.track(self.metrics.run_id, 0)
             if self.db_connector:
-                self.db_connector.close()
+                if self.connection_manager:
+                    self.connection_manager.release_connector(self.db_connector)
+                else:
+                    self.db_connector.close()
+                self.db_connector = None
+            self._record_history(result, started_at)
             self.import_completed.emit(result)
 
+    def _record_history(self, result: ExcelImportResult, started_at: datetime):
+        """Store the import in the run history next to the sync runs"""
+        if not getattr(self.config, "run_history_enabled", True):
+            return
+        duration = result.duration_seconds
+        stats = {
+            "run_id": self.metrics.run_id,
+            "start_time": started_at,
+            "end_time": datetime.now(timezone.utc),
+            "sync_direction": "excel_import",
+            "duration_seconds": duration,
+            "total_records": result.total_rows_read,
+            "records_added": result.rows_imported_to_db,
+            "errors": len(result.errors),
+            "rows_per_sec": (
+                round(result.rows_imported_to_db / duration, 1) if duration > 0 else 0.0
+            ),
+            "metrics": self.metrics.to_dict(),
+        }
+        try:
+            get_run_history(getattr(self.config, "run_history_file", None)).record_run(
+                stats, result.message, result.success
+            )
+        except Exception as e:
+            logger.warning(f"Could not record Excel import in run history: {e}")
+
     def _validate_file(self) -> bool:
         """Validate Excel file before processing"""
         try:
@@ -194,7 +287,7 @@ class ExcelImportWorker(QThread):
             self.log_message.emit(f"File validation error: {e}", "error")
             return False
 
-    def _read_excel_file(self) -> Optional[pd.DataFrame]:
+    def _read_excel_file(self) -> Optional["pd.DataFrame"]:
         """Read Excel file into pandas DataFrame"""
         try:
             file_path = Path(self.file_path)
@@ -231,7 +324,7 @@ class ExcelImportWorker(QThread):
             )
             return None
 
-    def _apply_column_mapping(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    def _apply_column_mapping(self, df: "pd.DataFrame") -> Optional["pd.DataFrame"]:
         """Apply column mapping from Excel columns to database columns"""
         try:
             if not self.column_mapping:
@@ -273,7 +366,7 @@ class ExcelImportWorker(QThread):
             logger.error(f"Column mapping error: {e}", exc_info=True)
             return None
 
-    def _optimize_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _optimize_data_types(self, df: "pd.DataFrame") -> "pd.DataFrame":
         """Optimize data types for better performance and storage"""
         try:
             for col in df.columns:
@@ -336,9 +429,10 @@ class ExcelImportHandler(QObject):
     import_completed = pyqtSignal(object)  # ExcelImportResult
     log_message = pyqtSignal(str, str)  # message, level
 
-    def __init__(self, config: Config, parent=None):
+    def __init__(self, config: Config, parent=None, connection_manager=None):
         super().__init__(parent)
         self.config = config
+        self.connection_manager = connection_manager
         self.worker: Optional[ExcelImportWorker] = None
         logger.info("ExcelImportHandler initialized")
 
@@ -373,7 +467,11 @@ class ExcelImportHandler(QObject):
 
         # Create and start new worker
         self.worker = ExcelImportWorker(
-            self.config, file_path, table_name, column_mapping or {}
+            self.config,
+            file_path,
+            table_name,
+            column_mapping or {},
+            connection_manager=self.connection_manager,
         )
 
         # Connect signals
@@ -0,0 +1,82 @@
+# utils/lazy_imports.py - Deferred imports for heavy third-party modules
+import importlib
+import logging
+import threading
+import time
+import types
+from typing import Dict, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Modules that dominate cold-start time; warmed up after the first paint
+HEAVY_MODULES = ("pandas", "sqlalchemy", "requests", "openpyxl")
+
+
+class LazyModule(types.ModuleType):
+    """
+    Module placeholder that imports the real module on first attribute access.
+    Use in place of `import pandas as pd` for modules only needed inside
+    functions; annotations that reference it must be quoted.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_name"] = name
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            # importlib's per-module locks make concurrent first use safe
+            module = importlib.import_module(self.__dict__["_lazy_name"])
+            self.__dict__.update(module.__dict__)
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_lazy_module"] else "not loaded"
+        return f"<lazy module '{self.__dict__['_lazy_name']}' ({state})>"
+
+
+def lazy_module(name: str) -> LazyModule:
+    """Return a placeholder for `name` that imports it on first use"""
+    return LazyModule(name)
+
+
+_warm_up_results: Dict[str, float] = {}
+
+
+def warm_up(modules: Iterable[str] = HEAVY_MODULES) -> threading.Thread:
+    """
+    Import modules on a background daemon thread so the first sync or
+    Excel import does not pay for them. Missing modules are skipped.
+    """
+
+    def _run():
+        for name in modules:
+            started = time.perf_counter()
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                logger.debug(f"Warm-up import of {name} skipped: {e}")
+                continue
+            _warm_up_results[name] = time.perf_counter() - started
+        logger.debug(
+            "Warm-up imports: "
+            + ", ".join(f"{n} {t * 1000:.0f} ms" for n, t in _warm_up_results.items())
+        )
+
+    thread = threading.Thread(target=_run, name="ImportWarmUp", daemon=True)
+    thread.start()
+    return thread
+
+
+def get_warm_up_times() -> Dict[str, float]:
+    """Seconds spent importing each module on the warm-up thread"""
+    return dict(_warm_up_results)
@@ -1,6 +1,11 @@
 # utils/logger.py - Modern 2025 Logging System
+import copy
 import logging
 import logging.handlers
+import queue
+import threading
+import time
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 from PyQt6.QtCore import QObject, pyqtSignal
@@ -9,13 +14,18 @@ import weakref
 
 
 class ModernUILogHandler(QObject, logging.Handler):
-    """Modern logging handler with proper cleanup"""
+    """
+    Modern logging handler with proper cleanup.
+    Records are buffered and sent to the UI in batches (see flush_pending);
+    consecutive repeats of the same message are collapsed into one line.
+    """
 
     log_record_emitted = pyqtSignal(str, str)  # message, level
+    log_batch_emitted = pyqtSignal(list)  # [(message, level), ...]
 
     _instances = weakref.WeakSet()
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, max_batch: int = 500):
         QObject.__init__(self, parent)
         logging.Handler.__init__(self)
 
@@ -24,17 +34,24 @@ class ModernUILogHandler(QObject, logging.Handler):
 
         self.setFormatter(ModernLogFormatter())
         self._is_destroyed = False
+        self.max_batch = max_batch
+        self._buffer = []  # [message, level, repeat_key, count]
 
     def emit(self, record):
-        """Emit log record as signal with safety checks"""
+        """Buffer a record; consecutive duplicates only bump a counter"""
         if self._is_destroyed:
             return
 
         try:
-            message = self.format(record)
-            # Only emit if signal is still connected
-            if self.log_record_emitted.receivers() > 0:
-                self.log_record_emitted.emit(message, record.levelname.lower())
+            level = record.levelname.lower()
+            repeat_key = (record.name, level, record.getMessage())
+            if self._buffer and self._buffer[-1][2] == repeat_key:
+                self._buffer[-1][3] += 1
+                return
+
+            self._buffer.append([self.format(record), level, repeat_key, 1])
+            if len(self._buffer) >= self.max_batch:
+                self._flush_buffer()
         except (RuntimeError, AttributeError):
             # Object has been deleted or signal disconnected
             self._is_destroyed = True
@@ -42,6 +59,36 @@ class ModernUILogHandler(QObject, logging.Handler):
             # Fallback to prevent logging errors from breaking the app
             self.handleError(record)
 
+    def flush_pending(self):
+        """Send buffered records to the UI as one batch"""
+        self.acquire()
+        try:
+            self._flush_buffer()
+        finally:
+            self.release()
+
+    def _flush_buffer(self):
+        if not self._buffer or self._is_destroyed:
+            self._buffer = []
+            return
+
+        batch = [
+            (message if count == 1 else f"{message} (×{count})", level)
+            for message, level, _, count in self._buffer
+        ]
+        self._buffer = []
+
+        try:
+            # Only emit if signals are still connected
+            if self.log_batch_emitted.receivers() > 0:
+                self.log_batch_emitted.emit(batch)
+            elif self.log_record_emitted.receivers() > 0:
+                for message, level in batch:
+                    self.log_record_emitted.emit(message, level)
+        except (RuntimeError, AttributeError):
+            # Object has been deleted or signal disconnected
+            self._is_destroyed = True
+
     def cleanup(self):
         """Safe cleanup method"""
         if self._is_destroyed:
@@ -51,6 +98,8 @@ class ModernUILogHandler(QObject, logging.Handler):
             # Disconnect all signals
             if hasattr(self, "log_record_emitted"):
                 self.log_record_emitted.disconnect()
+            if hasattr(self, "log_batch_emitted"):
+                self.log_batch_emitted.disconnect()
             self._is_destroyed = True
         except (RuntimeError, TypeError):
             pass
@@ -142,10 +191,129 @@ class PerformanceFileHandler(logging.handlers.RotatingFileHandler):
         self.setFormatter(ModernLogFormatter())
 
 
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Hands records to the listener thread without ever blocking the caller.
+    Under pressure DEBUG records are dropped first, then INFO; warnings and
+    errors are always queued. Drops are counted and reported by the listener.
+    """
+
+    def __init__(self, log_queue, capacity: int = 10000, debug_fraction: float = 0.5):
+        super().__init__(log_queue)
+        self.capacity = capacity
+        self.debug_limit = int(capacity * debug_fraction)
+        self._dropped = Counter()
+        self._drop_lock = threading.Lock()
+
+    def prepare(self, record):
+        """
+        Snapshot the message only; unlike QueueHandler.prepare() nothing is
+        formatted here. exc_info stays on the record (the queue is
+        in-process), so tracebacks are formatted by the listener's handlers.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        depth = self.queue.qsize()
+        if (record.levelno <= logging.DEBUG and depth >= self.debug_limit) or (
+            record.levelno < logging.WARNING and depth >= self.capacity
+        ):
+            with self._drop_lock:
+                self._dropped[record.levelname] += 1
+            return
+        self.queue.put_nowait(record)
+
+    def take_dropped(self) -> Counter:
+        """Return and reset the per-level drop counters"""
+        with self._drop_lock:
+            dropped, self._dropped = self._dropped, Counter()
+        return dropped
+
+
+class AsyncLogListener(logging.handlers.QueueListener):
+    """
+    Listener thread that fans queued records out to the file, console and UI
+    handlers. Wakes at least every `flush_interval` seconds to push batched
+    UI records and to report dropped records.
+    """
+
+    _TICK = object()
+
+    def __init__(
+        self,
+        log_queue,
+        *handlers,
+        queue_handler: NonBlockingQueueHandler = None,
+        flush_interval: float = 0.1,
+        drop_report_interval: float = 5.0,
+    ):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.queue_handler = queue_handler
+        self.flush_interval = flush_interval
+        self.drop_report_interval = drop_report_interval
+        self.dropped_total = Counter()
+        self._last_flush = 0.0
+        self._last_drop_report = time.monotonic()
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get(block, timeout=self.flush_interval)
+        except queue.Empty:
+            return self._TICK
+
+    def handle(self, record):
+        if record is not self._TICK:
+            super().handle(record)
+
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_interval:
+            self._last_flush = now
+            self.flush_handlers()
+        if now - self._last_drop_report >= self.drop_report_interval:
+            self._last_drop_report = now
+            self._report_dropped()
+
+    def flush_handlers(self):
+        for handler in self.handlers:
+            if hasattr(handler, "flush_pending"):
+                handler.flush_pending()
+
+    def _report_dropped(self):
+        if not self.queue_handler:
+            return
+        dropped = self.queue_handler.take_dropped()
+        if not dropped:
+            return
+
+        self.dropped_total.update(dropped)
+        summary = ", ".join(f"{count} {level}" for level, count in dropped.items())
+        record = logging.LogRecord(
+            "logging",
+            logging.WARNING,
+            __file__,
+            0,
+            f"Logging under load - dropped {summary} records",
+            None,
+            None,
+        )
+        super().handle(record)
+
+    def stop(self):
+        super().stop()
+        # Deliver whatever was buffered when the sentinel arrived
+        self._report_dropped()
+        self.flush_handlers()
+
+
 class LoggerManager:
     """Centralized logger management"""
 
     _ui_handler: Optional[ModernUILogHandler] = None
+    _queue_handler: Optional[NonBlockingQueueHandler] = None
+    _listener: Optional[AsyncLogListener] = None
     _is_initialized = False
 
     @classmethod
@@ -155,8 +323,13 @@ class LoggerManager:
         log_level: str = "INFO",
         max_bytes: int = 10 * 1024 * 1024,
         backup_count: int = 5,
+        queue_capacity: int = 10000,
     ) -> Optional[ModernUILogHandler]:
-        """Setup modern logging system"""
+        """
+        Setup modern logging system.
+        Loggers only enqueue records; a listener thread formats and writes
+        them to the file, console and UI handlers.
+        """
 
         if cls._is_initialized:
             return cls._ui_handler
@@ -164,31 +337,45 @@ class LoggerManager:
         # Clean up any existing handlers
         cls.cleanup_logging()
 
-        # Set root logger level
-        logging.root.setLevel(logging.DEBUG)
+        # Records below every sink's level are never created at all
+        level = logging.getLevelName(log_level)
+        if not isinstance(level, int):
+            level = logging.INFO
+        logging.root.setLevel(min(level, logging.INFO))
 
         try:
+            sinks = []
+
             # File handler
             file_handler = PerformanceFileHandler(
                 log_file, maxBytes=max_bytes, backupCount=backup_count
             )
-            file_handler.setLevel(logging.getLevelName(log_level))
-            logging.root.addHandler(file_handler)
+            file_handler.setLevel(level)
+            sinks.append(file_handler)
 
             # Console handler
             console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.getLevelName(log_level))
+            console_handler.setLevel(level)
             console_handler.setFormatter(ModernLogFormatter())
             # Mark for console coloring
             console_handler.addFilter(
                 lambda record: setattr(record, "console_output", True) or True
             )
-            logging.root.addHandler(console_handler)
+            sinks.append(console_handler)
 
             # UI Handler
             cls._ui_handler = ModernUILogHandler()
             cls._ui_handler.setLevel(logging.INFO)  # UI shows less verbose logs
-            logging.root.addHandler(cls._ui_handler)
+            sinks.append(cls._ui_handler)
+
+            # Loggers only enqueue; the listener thread does the I/O
+            log_queue = queue.SimpleQueue()
+            cls._queue_handler = NonBlockingQueueHandler(log_queue, queue_capacity)
+            cls._listener = AsyncLogListener(
+                log_queue, *sinks, queue_handler=cls._queue_handler
+            )
+            cls._listener.start()
+            logging.root.addHandler(cls._queue_handler)
 
             cls._is_initialized = True
 
@@ -206,6 +393,19 @@ class LoggerManager:
             return
 
         try:
+            # Detach the queue first, then drain it into the sinks
+            if cls._queue_handler:
+                logging.root.removeHandler(cls._queue_handler)
+            if cls._listener:
+                try:
+                    cls._listener.stop()
+                except Exception as e:
+                    print(f"Error stopping log listener: {e}")
+                for handler in cls._listener.handlers:
+                    if isinstance(handler, ModernUILogHandler):
+                        handler.cleanup()
+                    handler.close()
+
             # Remove all existing handlers
             for handler in logging.root.handlers[:]:
                 try:
@@ -226,6 +426,8 @@ class LoggerManager:
             ModernUILogHandler.cleanup_all_instances()
 
             cls._ui_handler = None
+            cls._queue_handler = None
+            cls._listener = None
             cls._is_initialized = False
 
         except Exception as e:
@@ -236,6 +438,17 @@ class LoggerManager:
         """Get current UI handler"""
         return cls._ui_handler
 
+    @classmethod
+    def get_queue_stats(cls) -> dict:
+        """Queue depth and dropped record counts of the async pipeline"""
+        if not cls._listener:
+            return {}
+        pending_drops = cls._queue_handler._dropped if cls._queue_handler else {}
+        return {
+            "queue_depth": cls._listener.queue.qsize(),
+            "dropped": dict(cls._listener.dropped_total + Counter(pending_drops)),
+        }
+
     @classmethod
     def is_initialized(cls) -> bool:
         """Check if logging is initialized"""
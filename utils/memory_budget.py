@@ -0,0 +1,245 @@
+# utils/memory_budget.py - Memory budget and Parquet spill files for sync/import workers
+"""
+One process-wide budget (memory_budget_mb) shared by every sync and
+Excel import. Usage is the process RSS (psutil or /proc) or, where that
+cannot be measured, the estimated size of the buffers and frames the
+workers have registered with track(). As usage grows the budget
+
+- shrinks parallel SharePoint window reads and their queue depth,
+- caps the rows per write chunk to a share of the remaining room,
+- asks workers to move buffered rows to a SpillFile (Parquet parts in
+  spill_dir, needs pyarrow) once SPILL_AT of the budget is in use.
+"""
+import logging
+import os
+import shutil
+import sys
+import threading
+import uuid
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from utils.lazy_imports import lazy_module
+
+logger = logging.getLogger(__name__)
+
+pd = lazy_module("pandas")
+
+DEFAULT_SPILL_DIR = "data/spill"
+DEFAULT_BUDGET_MB = 2048  # when physical memory cannot be determined
+THROTTLE_AT = 0.5  # share of the budget above which parallelism shrinks
+SPILL_AT = 0.75  # share of the budget above which buffered rows go to disk
+CHUNK_SHARE = 0.1  # share of the remaining room one write chunk may take
+
+
+def process_rss() -> Optional[int]:
+    """Resident set size of this process in bytes (None if unavailable)"""
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def physical_memory() -> Optional[int]:
+    """Installed memory in bytes (None if unavailable)"""
+    try:
+        import psutil
+
+        return psutil.virtual_memory().total
+    except ImportError:
+        pass
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def frame_row_bytes(df: "pd.DataFrame", sample: int = 1000) -> float:
+    """Average in-memory bytes per row, measured on the first `sample` rows"""
+    if df is None or not len(df):
+        return 0.0
+    head = df.head(sample)
+    return float(head.memory_usage(deep=True, index=False).sum()) / len(head)
+
+
+def object_row_bytes(rows: list, columns=None, sample: int = 100) -> float:
+    """Average bytes per row of dicts - each value plus its list slot"""
+    head = rows[:sample]
+    if not head:
+        return 0.0
+    total = sum(
+        sys.getsizeof(row.get(column)) + 8
+        for row in head
+        for column in (row if columns is None else columns)
+    )
+    return total / len(head)
+
+
+def _as_text(value) -> Optional[str]:
+    return None if value is None or value != value else str(value)
+
+
+class MemoryBudget:
+    """Process-wide memory limit consulted by the sync and import workers"""
+
+    def __init__(self, limit_bytes: int, spill_dir: str = DEFAULT_SPILL_DIR):
+        self.limit = max(0, int(limit_bytes))
+        self.spill_dir = spill_dir
+        self._lock = threading.Lock()
+        self._tracked: Dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.limit > 0
+
+    def track(self, name: str, nbytes: float):
+        """Register the estimated size of an in-flight buffer (0 drops it)"""
+        with self._lock:
+            if nbytes > 0:
+                self._tracked[name] = int(nbytes)
+            else:
+                self._tracked.pop(name, None)
+
+    def tracked(self) -> int:
+        with self._lock:
+            return sum(self._tracked.values())
+
+    def used(self) -> int:
+        """RSS when measurable, else the tracked estimates"""
+        return max(process_rss() or 0, self.tracked())
+
+    def pressure(self) -> float:
+        """Share of the budget in use (0.0 without a budget)"""
+        return self.used() / self.limit if self.enabled else 0.0
+
+    def should_spill(self) -> bool:
+        return self.enabled and self.pressure() >= SPILL_AT
+
+    def workers(self, requested: int) -> int:
+        """Parallel readers allowed: all of them up to THROTTLE_AT, 1 at SPILL_AT"""
+        requested = max(1, requested)
+        pressure = self.pressure()
+        if pressure <= THROTTLE_AT:
+            return requested
+        share = max(0.0, (SPILL_AT - pressure) / (SPILL_AT - THROTTLE_AT))
+        return max(1, int(requested * share))
+
+    def queue_depth(self, workers: int) -> int:
+        """Finished-but-unconsumed results allowed on top of the running ones"""
+        return workers if self.pressure() <= THROTTLE_AT else 0
+
+    def fit_rows(self, rows: int, row_bytes: float, minimum: int = 1) -> int:
+        """`rows` capped so one chunk takes at most CHUNK_SHARE of the room left"""
+        if not self.enabled or row_bytes <= 0:
+            return rows
+        room = max(0, self.limit - self.used()) * CHUNK_SHARE
+        return max(min(minimum, rows), min(rows, int(room / row_bytes)))
+
+    def spill_file(self, prefix: str) -> "SpillFile":
+        return SpillFile(self.spill_dir, prefix)
+
+
+class SpillFile:
+    """
+    Staging area for frames that should not stay in memory. Each append()
+    writes one Parquet part; iterating reads the parts back one at a time.
+    close() removes the files.
+    """
+
+    def __init__(self, directory: str, prefix: str):
+        self.path = Path(directory) / f"{prefix}-{uuid.uuid4().hex[:12]}"
+        self.parts = 0
+        self.rows = 0
+
+    @staticmethod
+    def available() -> bool:
+        """Whether pyarrow is installed (spilling is skipped without it)"""
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def append(self, df: "pd.DataFrame"):
+        import pyarrow
+        import pyarrow.parquet as pq
+
+        try:
+            table = pyarrow.Table.from_pandas(df, preserve_index=False)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+            # Mixed-type object columns are staged as text
+            df = df.copy()
+            for column in df.columns[df.dtypes == object]:
+                df[column] = df[column].map(_as_text)
+            table = pyarrow.Table.from_pandas(df, preserve_index=False)
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, self.path / f"part-{self.parts:05d}.parquet")
+        self.parts += 1
+        self.rows += len(df)
+
+    def __iter__(self) -> Iterator["pd.DataFrame"]:
+        import pyarrow.parquet as pq
+
+        for part in range(self.parts):
+            yield pq.read_table(self.path / f"part-{part:05d}.parquet").to_pandas()
+
+    def close(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+        self.parts = self.rows = 0
+
+    def __enter__(self) -> "SpillFile":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+_budget: Optional[MemoryBudget] = None
+_budget_lock = threading.Lock()
+_warned_no_pyarrow = False
+
+
+def budget_bytes(config) -> int:
+    """
+    memory_budget_mb in bytes: as given when > 0, half the installed
+    memory when 0, no budget (0 bytes) when negative.
+    """
+    megabytes = getattr(config, "memory_budget_mb", 0) or 0
+    if megabytes < 0:
+        return 0
+    if megabytes:
+        return int(megabytes * 1024 * 1024)
+    return (physical_memory() or DEFAULT_BUDGET_MB * 2 * 1024 * 1024) // 2
+
+
+def get_memory_budget(config) -> MemoryBudget:
+    """The shared budget, updated to the given config's limit and spill dir"""
+    global _budget
+    with _budget_lock:
+        if _budget is None:
+            _budget = MemoryBudget(0)
+        _budget.limit = budget_bytes(config)
+        _budget.spill_dir = getattr(config, "spill_dir", DEFAULT_SPILL_DIR)
+        return _budget
+
+
+def can_spill() -> bool:
+    """SpillFile.available(), warning once when pyarrow is missing"""
+    global _warned_no_pyarrow
+    if SpillFile.available():
+        return True
+    if not _warned_no_pyarrow:
+        _warned_no_pyarrow = True
+        logger.warning(
+            "pyarrow is not installed - over the memory budget, rows stay in "
+            "memory instead of spilling to disk"
+        )
+    return False
@@ -0,0 +1,217 @@
+# utils/metrics.py - Per-run spans and counters for sync instrumentation
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict
+
+
+class StageStats:
+    """Accumulated timings and counters for one stage (e.g. "http:items")"""
+
+    __slots__ = ("count", "errors", "total_seconds", "max_seconds", "counters")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.counters: Dict[str, float] = {}
+
+    def add(self, seconds: float, error: bool = False, **counters):
+        self.count += 1
+        self.errors += int(error)
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        for name, value in counters.items():
+            if value is not None:
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def to_dict(self) -> dict:
+        data = {
+            "count": self.count,
+            "errors": self.errors,
+            "total_seconds": round(self.total_seconds, 4),
+            "avg_seconds": (
+                round(self.total_seconds / self.count, 4) if self.count else 0.0
+            ),
+            "max_seconds": round(self.max_seconds, 4),
+        }
+        data.update(self.counters)
+        return data
+
+
+class RunMetrics:
+    """
+    Spans and counters accumulated over one sync run.
+    Code deeper in the stack records through `current_metrics()`, so the
+    connectors need no extra parameters; activate a run with `activate()`.
+    """
+
+    def __init__(self, run_id: str = None):
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self.stages: Dict[str, StageStats] = {}
+        self.counters: Dict[str, float] = {}
+
+    def record(self, stage: str, seconds: float, error: bool = False, **counters):
+        """Add one completed operation to a stage"""
+        with self._lock:
+            stats = self.stages.get(stage)
+            if stats is None:
+                stats = self.stages[stage] = StageStats()
+            stats.add(seconds, error, **counters)
+
+    def incr(self, name: str, value: float = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    @contextmanager
+    def span(self, stage: str, **counters):
+        """
+        Time a block as one operation of `stage`. The yielded dict can be
+        filled with counters (rows, bytes, ...) before the block ends.
+        """
+        listeners = getattr(_active, "listeners", None)
+        for listener in listeners or ():
+            listener.span_started(stage)
+        started = time.perf_counter()
+        extra = dict(counters)
+        error = False
+        try:
+            yield extra
+        except Exception:
+            error = True
+            raise
+        finally:
+            self.record(stage, time.perf_counter() - started, error, **extra)
+            for listener in listeners or ():
+                listener.span_finished(stage)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "run_id": self.run_id,
+                "stages": {name: s.to_dict() for name, s in self.stages.items()},
+                "counters": {k: round(v, 4) for k, v in self.counters.items()},
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self, labels: Dict[str, str] = None) -> str:
+        return metrics_to_prometheus(self.to_dict(), labels)
+
+
+class _NullMetrics(RunMetrics):
+    """Sink used when no run is active - records nothing"""
+
+    def record(self, stage, seconds, error=False, **counters):
+        pass
+
+    def incr(self, name, value=1):
+        pass
+
+
+_NULL_METRICS = _NullMetrics(run_id="none")
+_active = threading.local()
+
+
+def current_metrics() -> RunMetrics:
+    """The RunMetrics active on this thread, or a no-op sink"""
+    return getattr(_active, "metrics", None) or _NULL_METRICS
+
+
+@contextmanager
+def activate(metrics: RunMetrics):
+    """Make `metrics` the current run for this thread"""
+    previous = getattr(_active, "metrics", None)
+    _active.metrics = metrics
+    try:
+        yield metrics
+    finally:
+        _active.metrics = previous
+
+
+def add_span_listener(listener):
+    """
+    Notify `listener.span_started(stage)` / `span_finished(stage)` for spans
+    opened on this thread (used by the profiler for per-stage memory peaks).
+    """
+    if not hasattr(_active, "listeners"):
+        _active.listeners = []
+    _active.listeners.append(listener)
+
+
+def remove_span_listener(listener):
+    listeners = getattr(_active, "listeners", [])
+    if listener in listeners:
+        listeners.remove(listener)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _label_text(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = (f'{key}="{_escape(value)}"' for key, value in sorted(labels.items()))
+    return "{" + ",".join(pairs) + "}"
+
+
+def _metric_name(name: str) -> str:
+    return "".join(c if c.isalnum() else "_" for c in name).strip("_").lower()
+
+
+def metrics_to_prometheus(
+    metrics: dict,
+    labels: Dict[str, str] = None,
+    prefix: str = "spo_sync",
+    summary: Dict[str, float] = None,
+) -> str:
+    """
+    Render a RunMetrics dict in the Prometheus text exposition format.
+    `summary` adds run-level gauges (duration, rows/sec, ...).
+    """
+    labels = dict(labels or {})
+    labels.setdefault("run_id", metrics.get("run_id", ""))
+    lines = []
+
+    for key, value in (summary or {}).items():
+        name = f"{prefix}_run_{_metric_name(key)}"
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name}{_label_text(labels)} {value}")
+
+    stage_series = {
+        "count": ("stage_operations_total", "counter"),
+        "errors": ("stage_errors_total", "counter"),
+        "total_seconds": ("stage_seconds_total", "counter"),
+        "max_seconds": ("stage_max_seconds", "gauge"),
+    }
+    for key, (name, metric_type) in stage_series.items():
+        lines.append(f"# TYPE {prefix}_{name} {metric_type}")
+        for stage, stats in sorted(metrics.get("stages", {}).items()):
+            series_labels = _label_text({**labels, "stage": stage})
+            lines.append(f"{prefix}_{name}{series_labels} {stats.get(key, 0)}")
+
+    # Stage-specific counters (rows, bytes, ...)
+    extra = {}
+    for stage, stats in metrics.get("stages", {}).items():
+        for key, value in stats.items():
+            if key not in stage_series and key != "avg_seconds":
+                extra.setdefault(key, []).append((stage, value))
+    for key, series in sorted(extra.items()):
+        name = f"{prefix}_stage_{_metric_name(key)}_total"
+        lines.append(f"# TYPE {name} counter")
+        for stage, value in sorted(series):
+            lines.append(f"{name}{_label_text({**labels, 'stage': stage})} {value}")
+
+    for key, value in sorted(metrics.get("counters", {}).items()):
+        name = f"{prefix}_{_metric_name(key)}_total"
+        lines.append(f"# TYPE {name} counter")
+        lines.append(f"{name}{_label_text(labels)} {value}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,273 @@
+# utils/profiling.py - Opt-in profiler for sync and Excel import runs
+"""
+Enabled with `profiling_mode` in the configuration, the SPO_SYNC_PROFILE
+environment variable or `python -m spo_sync --profile MODE`:
+
+    sampling  samples the worker thread's stack every profiling_interval_ms
+              and writes folded stacks (flamegraph.pl, speedscope)
+    cprofile  deterministic cProfile; writes a .prof file (snakeviz,
+              gprof2dot) and the top functions
+
+With profiling_trace_memory, tracemalloc records the peak traced memory of
+every metrics span (read, parse, mapping, write, http:..., db:...) and the
+top allocation sites. Files are named after the run ID in the run history.
+"""
+import cProfile
+import io
+import logging
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utils.metrics import add_span_listener, remove_span_listener
+
+logger = logging.getLogger(__name__)
+
+PROFILING_MODES = ("sampling", "cprofile")
+
+
+class StackSampler:
+    """Samples one thread's Python stack from a background thread"""
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run, name="ProfileSampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{Path(code.co_filename).stem}:{code.co_name}")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(names))] += 1
+            self.samples += 1
+
+    def folded(self) -> str:
+        """Brendan Gregg's folded stack format: `a;b;c <count>` per line"""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+
+class RunProfiler:
+    """
+    Profiles the calling thread between start() and stop(). Set `run_id`
+    before stop() so the output files can be matched to the run history.
+    """
+
+    def __init__(
+        self,
+        mode: str = "sampling",
+        output_dir: str = "logs/profiles",
+        label: str = "run",
+        interval_ms: float = 5.0,
+        trace_memory: bool = True,
+        top: int = 25,
+    ):
+        if mode not in PROFILING_MODES:
+            raise ValueError(f"Unknown profiling mode: {mode}")
+        self.mode = mode
+        self.output_dir = Path(output_dir)
+        self.label = label
+        self.interval = max(interval_ms, 1.0) / 1000
+        self.trace_memory = trace_memory
+        self.top = top
+        self.run_id = None
+
+        self.stage_peaks: Dict[str, int] = {}
+        self._stack: List[list] = []
+        self._snapshot = None
+        self._snapshot_size = 0
+        self._started_tracemalloc = False
+        self._profile = None
+        self._sampler = None
+        self._started = 0.0
+
+    def start(self):
+        self._started = time.perf_counter()
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            tracemalloc.reset_peak()
+            add_span_listener(self)
+
+        if self.mode == "cprofile":
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._sampler = StackSampler(threading.get_ident(), self.interval)
+            self._sampler.start()
+
+    def stop(self) -> List[Path]:
+        """Stop profiling and write the reports; returns the files written"""
+        if self._profile:
+            self._profile.disable()
+        if self._sampler:
+            self._sampler.stop()
+        if self.trace_memory:
+            remove_span_listener(self)
+            self._take_snapshot()
+
+        try:
+            return self._write_reports(time.perf_counter() - self._started)
+        except OSError as e:
+            logger.warning(f"Could not write profile for {self.label}: {e}")
+            return []
+        finally:
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # Span listener - tracemalloc peaks per stage (nested spans included)
+    def span_started(self, stage: str):
+        _, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            self._stack[-1][1] = max(self._stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        self._stack.append([stage, 0])
+
+    def span_finished(self, stage: str):
+        if not self._stack:
+            return
+        _, peak = tracemalloc.get_traced_memory()
+        peak = max(self._stack.pop()[1], peak)
+        self.stage_peaks[stage] = max(self.stage_peaks.get(stage, 0), peak)
+        if self._stack:
+            self._stack[-1][1] = max(self._stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        self._take_snapshot()
+
+    def _take_snapshot(self):
+        """Keep the snapshot with the most live memory (only on 10% growth)"""
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self._snapshot_size * 1.1:
+            self._snapshot = tracemalloc.take_snapshot()
+            self._snapshot_size = current
+
+    def _write_reports(self, seconds: float) -> List[Path]:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{self.run_id or time.strftime('%Y%m%d_%H%M%S')}_{self.label}"
+        files = []
+
+        lines = [
+            f"Profile of {self.label} (run {self.run_id or 'n/a'})",
+            f"Mode: {self.mode}, wall time {seconds:.2f}s",
+            "",
+        ]
+
+        if self._sampler:
+            path = self.output_dir / f"{stem}.folded"
+            path.write_text(self._sampler.folded(), encoding="utf-8")
+            files.append(path)
+            lines.append(
+                f"{self._sampler.samples} samples every "
+                f"{self.interval * 1000:.0f} ms -> {path.name}"
+            )
+
+        if self._profile:
+            path = self.output_dir / f"{stem}.prof"
+            self._profile.dump_stats(path)
+            files.append(path)
+            out = io.StringIO()
+            stats = pstats.Stats(self._profile, stream=out)
+            stats.sort_stats("cumulative").print_stats(self.top)
+            lines.append(f"cProfile -> {path.name}")
+            lines.append(out.getvalue())
+
+        if self.stage_peaks:
+            lines += ["", "Peak traced memory per stage:"]
+            for stage, peak in sorted(
+                self.stage_peaks.items(), key=lambda item: -item[1]
+            ):
+                lines.append(f"  {stage:<32} {peak / (1024 * 1024):10.1f} MB")
+
+        if self._snapshot is not None:
+            lines += ["", f"Top {self.top} allocation sites at peak live memory:"]
+            snapshot = self._snapshot.filter_traces(
+                (
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, __file__),
+                )
+            )
+            for stat in snapshot.statistics("lineno")[: self.top]:
+                lines.append(f"  {stat}")
+
+        path = self.output_dir / f"{stem}_profile.txt"
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        files.append(path)
+
+        logger.info(f"Profile written: {', '.join(str(f) for f in files)}")
+        return files
+
+
+class _NullProfiler:
+    """Stand-in when profiling is off"""
+
+    run_id = None
+
+
+def create_profiler(config, label: str) -> Optional[RunProfiler]:
+    """A RunProfiler for the configured mode, or None when profiling is off"""
+    mode = (getattr(config, "profiling_mode", "") or "").strip().lower()
+    if not mode or mode in ("off", "none", "false", "0"):
+        return None
+    if mode not in PROFILING_MODES:
+        logger.warning(f"Ignoring unknown profiling_mode '{mode}'")
+        return None
+    return RunProfiler(
+        mode=mode,
+        output_dir=getattr(config, "profiling_dir", "logs/profiles"),
+        label=label,
+        interval_ms=getattr(config, "profiling_interval_ms", 5.0),
+        trace_memory=getattr(config, "profiling_trace_memory", True),
+    )
+
+
+@contextmanager
+def profile_run(config, label: str):
+    """
+    Profile the block when the configuration asks for it. Yields the
+    profiler (or a stand-in) so the caller can set `run_id`.
+    """
+    profiler = create_profiler(config, label)
+    if profiler is None:
+        yield _NullProfiler()
+        return
+
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
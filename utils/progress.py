@@ -0,0 +1,91 @@
+# utils/progress.py - Throttled progress reporting with throughput and ETA
+import time
+from typing import Callable, Optional
+
+
+class ProgressThrottle:
+    """
+    Rate-limits progress callbacks for per-record loops.
+    An update is forwarded only when the percentage changed and at most
+    `max_rate_hz` times per second; task changes and 0/100% always pass.
+    Each forwarded update carries rows/sec and ETA for the current task.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[str, int, str, dict], None],
+        max_rate_hz: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.callback = callback
+        self.min_interval = 1.0 / max_rate_hz if max_rate_hz > 0 else 0.0
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        self._task: Optional[str] = None
+        self._task_started = 0.0
+        self._last_emit = float("-inf")
+        self._last_percentage: Optional[int] = None
+        self.suppressed = 0
+
+    def update(
+        self,
+        task_name: str,
+        percentage: int,
+        message: str = "",
+        rows_done: int = None,
+        rows_total: int = None,
+    ) -> bool:
+        """Forward the update if due; returns True when it was emitted"""
+        now = self.clock()
+        task_changed = task_name != self._task
+        if task_changed:
+            self._task = task_name
+            self._task_started = now
+
+        boundary = percentage <= 0 or percentage >= 100
+        if not (task_changed or boundary):
+            if percentage == self._last_percentage:
+                self.suppressed += 1
+                return False
+            if now - self._last_emit < self.min_interval:
+                self.suppressed += 1
+                return False
+
+        self._last_emit = now
+        self._last_percentage = percentage
+        stats = self._stats(task_name, percentage, now, rows_done, rows_total)
+        self.callback(task_name, percentage, message, stats)
+        return True
+
+    def _stats(self, task_name, percentage, now, rows_done, rows_total) -> dict:
+        elapsed = now - self._task_started
+        rows_per_sec = None
+        eta_seconds = None
+        if rows_done is not None and elapsed > 0:
+            rows_per_sec = rows_done / elapsed
+            if rows_total and rows_per_sec > 0:
+                eta_seconds = max(0.0, (rows_total - rows_done) / rows_per_sec)
+
+        return {
+            "task": task_name,
+            "percentage": percentage,
+            "rows_done": rows_done,
+            "rows_total": rows_total,
+            "rows_per_sec": round(rows_per_sec, 1) if rows_per_sec else None,
+            "eta_seconds": round(eta_seconds, 1) if eta_seconds is not None else None,
+            "elapsed_seconds": round(elapsed, 2),
+        }
+
+
+def format_eta(seconds: Optional[float]) -> str:
+    """Format an ETA as H:MM:SS / M:SS"""
+    if seconds is None:
+        return "—"
+    seconds = int(round(seconds))
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
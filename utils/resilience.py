@@ -0,0 +1,325 @@
+# utils/resilience.py - Circuit breakers, retry budget and backoff for external services
+import logging
+import random
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Union
+
+from utils.metrics import current_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"  # Requests flow normally
+    OPEN = "open"  # Failing - requests are short-circuited
+    HALF_OPEN = "half_open"  # Trial request allowed after cool-down
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised when a call is short-circuited by an open breaker"""
+
+    def __init__(self, endpoint: str, retry_in: float = 0.0):
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(
+            f"Circuit '{endpoint}' is open - skipping call (retry in {retry_in:.0f}s)"
+        )
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker.
+    Opens after `failure_threshold` consecutive failures and allows a single
+    trial call once `reset_timeout` seconds have passed.
+    """
+
+    def __init__(
+        self, name: str, failure_threshold: int = 5, reset_timeout: float = 60.0
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> CircuitState:
+        """Resolve OPEN -> HALF_OPEN once the cool-down elapsed (lock held)"""
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Return True if a call may proceed"""
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self._state != CircuitState.CLOSED:
+                logger.info(f"Circuit '{self.name}' closed")
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            state = self._current_state()
+            if state == CircuitState.HALF_OPEN or (
+                state == CircuitState.CLOSED
+                and self._failures >= self.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+                logger.warning(
+                    f"Circuit '{self.name}' opened after {self._failures} failures"
+                )
+
+    def reset(self):
+        """Force the breaker back to CLOSED"""
+        self.record_success()
+
+    def snapshot(self) -> dict:
+        """Return breaker state for status displays"""
+        with self._lock:
+            state = self._current_state()
+            retry_in = 0.0
+            if state == CircuitState.OPEN:
+                retry_in = max(
+                    0.0, self.reset_timeout - (time.monotonic() - self._opened_at)
+                )
+            return {
+                "name": self.name,
+                "state": state.value,
+                "consecutive_failures": self._failures,
+                "retry_in_seconds": retry_in,
+            }
+
+
+class RetryBudget:
+    """
+    Process-wide cap on retries.
+    Within a sliding window, retries may not exceed `ratio` of first attempts
+    (plus a small floor), so an outage cannot multiply traffic.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        window_seconds: float = 10.0,
+    ):
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window_seconds = window_seconds
+
+        self._lock = threading.Lock()
+        self._requests = deque()
+        self._retries = deque()
+        self._denied = 0
+
+    def _trim(self, now: float):
+        cutoff = now - self.window_seconds
+        for events in (self._requests, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
+
+    def record_request(self):
+        """Record a first attempt - each one earns `ratio` retries"""
+        with self._lock:
+            now = time.monotonic()
+            self._trim(now)
+            self._requests.append(now)
+
+    def try_spend(self) -> bool:
+        """Reserve one retry; False when the budget is exhausted"""
+        with self._lock:
+            now = time.monotonic()
+            self._trim(now)
+            allowed = max(
+                self.min_retries_per_second * self.window_seconds,
+                self.ratio * len(self._requests),
+            )
+            if len(self._retries) >= allowed:
+                self._denied += 1
+                return False
+            self._retries.append(now)
+            return True
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            self._trim(time.monotonic())
+            return {
+                "requests": len(self._requests),
+                "retries": len(self._retries),
+                "denied": self._denied,
+                "window_seconds": self.window_seconds,
+            }
+
+
+def is_connection_error(error: Exception) -> bool:
+    """Default transient classifier for callers without their own"""
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+
+class ResilienceManager:
+    """
+    Shared resilience layer for connector calls.
+    Keeps one circuit breaker per endpoint and a global retry budget, and
+    retries transient failures with exponential backoff and full jitter.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self.budget = RetryBudget()
+
+        self.max_attempts = 3
+        self.base_delay = 1.0
+        self.max_delay = 30.0
+        self.max_retry_after = 120.0
+        self.failure_threshold = 5
+        self.reset_timeout = 60.0
+
+    def configure(self, config):
+        """Apply retry and breaker settings from configuration"""
+        self.max_attempts = max(1, getattr(config, "max_retries", 3))
+        self.base_delay = getattr(config, "retry_base_delay", 1.0)
+        self.max_delay = getattr(config, "retry_max_delay", 30.0)
+        self.failure_threshold = getattr(config, "circuit_failure_threshold", 5)
+        self.reset_timeout = getattr(config, "circuit_reset_timeout", 60)
+        self.budget.ratio = getattr(config, "retry_budget_ratio", 0.2)
+
+        with self._lock:
+            for breaker in self._breakers.values():
+                breaker.failure_threshold = max(1, self.failure_threshold)
+                breaker.reset_timeout = self.reset_timeout
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        """Return (creating if needed) the breaker for an endpoint"""
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    endpoint, self.failure_threshold, self.reset_timeout
+                )
+                self._breakers[endpoint] = breaker
+            return breaker
+
+    def backoff_delay(self, attempt: int, retry_after: float = None) -> float:
+        """Full-jitter exponential backoff; a server Retry-After is a floor"""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        delay = random.uniform(0, ceiling)
+        if retry_after:
+            delay = max(delay, min(retry_after, self.max_retry_after))
+        return delay
+
+    def call(
+        self,
+        endpoint: str,
+        func: Callable[..., Any],
+        *args,
+        is_transient: Callable[[Exception], bool] = is_connection_error,
+        retryable: Union[bool, Callable[[Exception], bool]] = True,
+        retry_after: Optional[Callable[[Exception], Optional[float]]] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        Run `func` guarded by the endpoint breaker.
+
+        Transient failures count against the breaker and are retried while
+        attempts and the global budget allow. `retryable` may be False (or a
+        predicate) for calls that are unsafe to repeat, e.g. non-idempotent
+        writes. Other exceptions propagate immediately.
+        """
+        breaker = self.breaker(endpoint)
+        self.budget.record_request()
+        attempt = 0
+
+        while True:
+            if not breaker.allow_request():
+                raise CircuitOpenError(endpoint, breaker.snapshot()["retry_in_seconds"])
+
+            attempt += 1
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if not is_transient(e):
+                    # The endpoint answered - the failure is not an outage
+                    breaker.record_success()
+                    raise
+
+                breaker.record_failure()
+                can_retry = retryable(e) if callable(retryable) else retryable
+                if not can_retry or attempt >= self.max_attempts:
+                    raise
+                if not self.budget.try_spend():
+                    logger.warning(f"Retry budget exhausted - not retrying {endpoint}")
+                    raise
+
+                server_delay = retry_after(e) if retry_after else None
+                delay = self.backoff_delay(attempt, server_delay)
+                metrics = current_metrics()
+                metrics.incr("retries")
+                metrics.incr("retry_wait_seconds", delay)
+                if server_delay:
+                    metrics.incr("throttled")
+                logger.warning(
+                    f"{endpoint} failed ({e}); retry {attempt}/"
+                    f"{self.max_attempts - 1} in {delay:.1f}s"
+                )
+                time.sleep(delay)
+            else:
+                breaker.record_success()
+                return result
+
+    def get_stats(self) -> dict:
+        """Return breaker and budget state for status displays"""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {
+            "breakers": {b.name: b.snapshot() for b in breakers},
+            "retry_budget": self.budget.snapshot(),
+        }
+
+    def reset(self):
+        """Close every breaker (e.g. after the user fixed a configuration)"""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.reset()
+
+
+# Global instance shared by all connectors
+_resilience: Optional[ResilienceManager] = None
+
+
+def get_resilience() -> ResilienceManager:
+    """Returns the shared ResilienceManager instance."""
+    global _resilience
+    if _resilience is None:
+        _resilience = ResilienceManager()
+    return _resilience
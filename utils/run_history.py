@@ -0,0 +1,215 @@
+# utils/run_history.py - Local SQLite store of completed sync runs
+import json
+import logging
+import math
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_FILE = "data/run_history.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL UNIQUE,
+    started_at TEXT,
+    finished_at TEXT,
+    direction TEXT,
+    success INTEGER NOT NULL,
+    duration_seconds REAL,
+    total_records INTEGER,
+    records_added INTEGER,
+    errors INTEGER,
+    rows_per_sec REAL,
+    message TEXT,
+    metrics TEXT
+)
+"""
+
+# Aggregates only touch recent rows per direction, so these keep them cheap
+INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_runs_started_at ON runs (started_at)",
+    "CREATE INDEX IF NOT EXISTS idx_runs_direction_id ON runs (direction, id)",
+)
+
+
+def _timestamp(value) -> Optional[str]:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class RunHistoryStore:
+    """
+    Append-only record of sync runs with their per-stage metrics.
+    Each call opens its own connection, so any thread may record or query.
+    """
+
+    def __init__(self, path: str = DEFAULT_HISTORY_FILE):
+        self.path = Path(path)
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    with sqlite3.connect(self.path) as conn:
+                        conn.execute(SCHEMA)
+                        for statement in INDEXES:
+                            conn.execute(statement)
+                    self._initialized = True
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def record_run(self, stats: dict, message: str = "", success: bool = None):
+        """Append one completed run (a SyncJob sync_stats dict)"""
+        metrics = stats.get("metrics") or {}
+        row = (
+            stats.get("run_id") or metrics.get("run_id"),
+            _timestamp(stats.get("start_time")),
+            _timestamp(stats.get("end_time")),
+            stats.get("sync_direction"),
+            int(bool(stats.get("success") if success is None else success)),
+            stats.get("duration_seconds"),
+            stats.get("total_records"),
+            stats.get("records_added"),
+            stats.get("errors"),
+            stats.get("rows_per_sec"),
+            message,
+            json.dumps(metrics),
+        )
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT INTO runs (run_id, started_at, finished_at, direction, "
+                    "success, duration_seconds, total_records, records_added, "
+                    "errors, rows_per_sec, message, metrics) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    row,
+                )
+        finally:
+            conn.close()
+
+    def get_run(self, run_id: str = None) -> Optional[dict]:
+        """One run by ID, or the latest run"""
+        query = "SELECT * FROM runs "
+        if run_id:
+            rows = self._query(query + "WHERE run_id = ?", (run_id,))
+        else:
+            rows = self._query(query + "ORDER BY id DESC LIMIT 1")
+        return rows[0] if rows else None
+
+    def recent_runs(self, limit: int = 20, direction: str = None) -> List[dict]:
+        """Latest runs, newest first"""
+        where, params = self._direction_filter(direction)
+        return self._query(
+            f"SELECT * FROM runs {where} ORDER BY id DESC LIMIT ?", params + (limit,)
+        )
+
+    def runs_since(
+        self, last_id: int = 0, limit: int = 100, direction: str = None
+    ) -> List[dict]:
+        """
+        Runs recorded after row `last_id`, oldest first. Lets a view append
+        only what is new instead of reloading the whole history.
+        """
+        where, params = self._direction_filter(direction, "id > ?", (last_id,))
+        rows = self._query(
+            f"SELECT * FROM runs {where} ORDER BY id DESC LIMIT ?", params + (limit,)
+        )
+        return rows[::-1]
+
+    def duration_percentiles(self, last_n: int = 100, direction: str = None) -> dict:
+        """p50/p95 duration and rows/sec over the last `last_n` successful runs"""
+        where, params = self._direction_filter(direction, "success = 1")
+        rows = self._execute(
+            f"SELECT duration_seconds, rows_per_sec FROM runs {where} "
+            "ORDER BY id DESC LIMIT ?",
+            params + (last_n,),
+        )
+        durations = sorted(r[0] for r in rows if r[0] is not None)
+        rates = sorted(r[1] for r in rows if r[1] is not None)
+        return {
+            "runs": len(rows),
+            "p50_duration": _percentile(durations, 50),
+            "p95_duration": _percentile(durations, 95),
+            "p50_rows_per_sec": _percentile(rates, 50),
+            "p95_rows_per_sec": _percentile(rates, 95),
+        }
+
+    def throughput_trend(self, days: int = 30, direction: str = None) -> List[dict]:
+        """Daily average/peak rows/sec and run counts for the last `days` days"""
+        since = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+        where, params = self._direction_filter(direction, "started_at >= ?", (since,))
+        rows = self._execute(
+            "SELECT substr(started_at, 1, 10) AS day, COUNT(*), "
+            "AVG(rows_per_sec), MAX(rows_per_sec), AVG(duration_seconds), "
+            f"SUM(1 - success) FROM runs {where} GROUP BY day ORDER BY day",
+            params,
+        )
+        return [
+            {
+                "day": day,
+                "runs": runs,
+                "avg_rows_per_sec": round(avg_rate or 0.0, 1),
+                "max_rows_per_sec": round(max_rate or 0.0, 1),
+                "avg_duration": round(avg_duration or 0.0, 2),
+                "failures": failures,
+            }
+            for day, runs, avg_rate, max_rate, avg_duration, failures in rows
+        ]
+
+    @staticmethod
+    def _direction_filter(direction: str, condition: str = "", params: tuple = ()):
+        conditions = [condition] if condition else []
+        if direction:
+            conditions.append("direction = ?")
+            params = params + (direction,)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, params
+
+    def _execute(self, sql: str, params: tuple = ()) -> list:
+        conn = self._connect()
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def _query(self, sql: str, params: tuple = ()) -> List[dict]:
+        rows = self._execute(sql, params)
+        runs = []
+        for row in rows:
+            run = dict(row)
+            run["success"] = bool(run["success"])
+            run["metrics"] = json.loads(run["metrics"]) if run["metrics"] else {}
+            runs.append(run)
+        return runs
+
+
+def _percentile(sorted_values: list, pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_run_history(path: str = None) -> RunHistoryStore:
+    """Returns the shared RunHistoryStore for a file."""
+    path = str(path or DEFAULT_HISTORY_FILE)
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = RunHistoryStore(path)
+        return _stores[path]
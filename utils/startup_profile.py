@@ -0,0 +1,141 @@
+# utils/startup_profile.py - Startup phase timing and import-time report
+"""
+Startup phases are recorded by main.py through `get_startup_timer().mark()`
+and logged once the window is shown.
+
+For a per-module breakdown run:
+
+    python -m utils.startup_profile [module ...]
+
+which imports the given modules (default: the GUI startup path) in a fresh
+interpreter with `-X importtime` and prints the slowest imports.
+"""
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from utils.lazy_imports import HEAVY_MODULES
+
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+
+# What main.py imports before the first window paints
+STARTUP_MODULES = (
+    "ui.styles.theme",
+    "controller.app_controller",
+    "ui.main_window",
+)
+
+
+class StartupTimer:
+    """Wall-clock checkpoints for the application start sequence"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self._last = self.started
+
+    def mark(self, phase: str):
+        """Record the time since the previous checkpoint under `phase`"""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    def total(self) -> float:
+        return self._last - self.started
+
+    def report(self) -> str:
+        lines = [f"Startup took {self.total() * 1000:.0f} ms"]
+        for phase, seconds in self.phases:
+            lines.append(f"  {phase:<28} {seconds * 1000:8.0f} ms")
+
+        loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+        if loaded:
+            lines.append(f"  Heavy modules loaded: {', '.join(loaded)}")
+        else:
+            lines.append("  Heavy modules loaded: none")
+        return "\n".join(lines)
+
+
+_startup_timer: Optional[StartupTimer] = None
+
+
+def get_startup_timer() -> StartupTimer:
+    """Returns the process-wide StartupTimer instance."""
+    global _startup_timer
+    if _startup_timer is None:
+        _startup_timer = StartupTimer()
+    return _startup_timer
+
+
+def measure_imports(modules=STARTUP_MODULES) -> List[Tuple[str, int, int]]:
+    """
+    Import `modules` in a fresh interpreter with `-X importtime`.
+    Returns (module, self_us, cumulative_us) rows.
+    """
+    code = "; ".join(f"import {name}" for name in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        errors = [
+            line
+            for line in result.stderr.splitlines()
+            if not line.startswith("import time:")
+        ]
+        print("Import failed during measurement:\n" + "\n".join(errors[-10:]))
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:") :].split("|")
+            rows.append((name.rstrip(), int(self_us), int(cumulative_us)))
+        except ValueError:
+            continue
+    return rows
+
+
+def format_import_report(rows, top: int = 25) -> str:
+    """Slowest top-level imports by cumulative time"""
+    depth = [(len(name) - len(name.lstrip())) // 2 for name, _, _ in rows]
+    outer = min(depth, default=0)
+    top_level = [row for row, d in zip(rows, depth) if d == outer]
+    top_level.sort(key=lambda r: r[2], reverse=True)
+
+    total_us = sum(r[2] for r in top_level)
+    lines = [f"Total import time: {total_us / 1000:.0f} ms", ""]
+    lines.append(f"{'cumulative':>12} {'self':>10}  module")
+    for name, self_us, cumulative_us in top_level[:top]:
+        lines.append(
+            f"{cumulative_us / 1000:>10.1f}ms {self_us / 1000:>8.1f}ms  {name.strip()}"
+        )
+
+    heavy = sorted({r[0].strip() for r in rows} & set(HEAVY_MODULES))
+    lines.append("")
+    lines.append(f"Heavy modules imported: {', '.join(heavy) if heavy else 'none'}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m utils.startup_profile",
+        description="Report import time for the application startup path",
+    )
+    parser.add_argument("modules", nargs="*", default=list(STARTUP_MODULES))
+    parser.add_argument("--top", type=int, default=25)
+    args = parser.parse_args(argv)
+
+    rows = measure_imports(args.modules)
+    print(format_import_report(rows, top=args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+# utils/ttl_cache.py - Expiring key/value cache kept in memory and in a JSON file
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_FILE = "data/lookup_cache.json"
+
+
+class TTLCache:
+    """
+    Values expire `ttl` seconds after they were stored. Reads are served
+    from memory; the file lets a restarted app (or the headless runner)
+    reuse entries that are still fresh. Values must be JSON-serialisable.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_FILE, ttl: float = 3600.0):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, dict]] = None  # loaded on first use
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._load().get(key)
+        if entry is None or time.time() - entry["stored_at"] > self.ttl:
+            return None
+        return entry["value"]
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._load()[key] = {"stored_at": time.time(), "value": value}
+            self._save()
+
+    def get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        """Cached value, or `loader()` stored under `key` (None is not cached)"""
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            if value is not None:
+                self.set(key, value)
+        return value
+
+    def invalidate(self, prefix: str = ""):
+        """Drop the entries whose key starts with `prefix` (all by default)"""
+        with self._lock:
+            entries = self._load()
+            for key in [k for k in entries if k.startswith(prefix)]:
+                del entries[key]
+            self._save()
+
+    def _load(self) -> Dict[str, dict]:
+        if self._entries is None:
+            self._entries = {}
+            if self.path.exists():
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        self._entries = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable cache {self.path}: {e}")
+            # Expired entries are dropped on load, so the file cannot grow forever
+            now = time.time()
+            self._entries = {
+                key: entry
+                for key, entry in self._entries.items()
+                if now - entry.get("stored_at", 0) <= self.ttl
+            }
+        return self._entries
+
+    def _save(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, separators=(",", ":"))
+            tmp.replace(self.path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not save cache {self.path}: {e}")
+
+
+_caches: Dict[str, TTLCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_ttl_cache(path: str = None, ttl: float = None) -> TTLCache:
+    """Returns the shared TTLCache for a file (updating its TTL if given)."""
+    path = str(path or DEFAULT_CACHE_FILE)
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = TTLCache(path)
+        if ttl is not None:
+            _caches[path].ttl = ttl
+        return _caches[path]